@@ -0,0 +1,39 @@
+"""
+Measures get_price_data_bulk throughput for 500 symbols against a local
+stand-in server with 20ms simulated latency, for increasing worker counts.
+
+Run from the repository root:
+    python -m benchmarks.bench_bulk
+"""
+
+import time
+
+from benchmarks.mock_server import MockDataHubServer
+from src.eetc_data_client.client import EETCDataClient
+
+SYMBOLS = [f"SYM{i}" for i in range(500)]
+
+
+def main():
+    with MockDataHubServer(rows=20, latency=0.02) as server:
+        for max_workers in (1, 4, 8, 16, 32):
+            with EETCDataClient(
+                "benchmark",
+                pool_maxsize=max_workers,
+                max_workers=max_workers,
+            ) as client:
+                client.base_url = server.base_url
+
+                start = time.perf_counter()
+                data, failures = client.get_price_data_bulk(SYMBOLS)
+                elapsed = time.perf_counter() - start
+
+            print(
+                f"max_workers={max_workers:<3} {elapsed:.2f}s "
+                f"{len(SYMBOLS) / elapsed:.1f} symbols/s "
+                f"rows={len(data)} failures={len(failures)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Measures the response bytes on the wire with and without compression for
+ten years of daily Price data, against a local stand-in server which
+gzip-compresses responses when asked to.
+
+Run from the repository root:
+    python -m benchmarks.bench_compression
+"""
+
+import time
+
+from benchmarks.mock_server import MockDataHubServer
+from src.eetc_data_client.client import EETCDataClient
+
+ROUNDS = 20
+
+
+def main():
+    with MockDataHubServer(rows=3650, compress=True) as server:
+        for compress in (False, True):
+            with EETCDataClient("benchmark", compress=compress) as client:
+                client.base_url = server.base_url
+
+                start = time.perf_counter()
+
+                for _ in range(ROUNDS):
+                    client.get_price_data("AAPL")
+
+                elapsed = time.perf_counter() - start
+                stats = client.transfer_stats
+
+            print(
+                f"compress={str(compress):<5} {elapsed / ROUNDS * 1000:.1f}ms/call "
+                f"wire_bytes={stats['wire_bytes'] // ROUNDS} "
+                f"decoded_bytes={stats['decoded_bytes'] // ROUNDS} "
+                f"ratio={stats['decoded_bytes'] / stats['wire_bytes']:.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
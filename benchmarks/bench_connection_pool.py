@@ -0,0 +1,59 @@
+"""
+Compares per-request latency of one-off `requests.get` calls (new TCP
+connection per request) against the pooled keep-alive session used by
+EETCDataClient.
+
+Run from the repository root:
+    python -m benchmarks.bench_connection_pool
+"""
+
+import statistics
+import time
+
+import requests
+
+from benchmarks.mock_server import MockDataHubServer
+from src.eetc_data_client.client import EETCDataClient
+
+REQUESTS = 500
+
+
+def measure(send_request) -> list:
+    latencies = []
+
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        send_request()
+        latencies.append(time.perf_counter() - start)
+
+    return latencies
+
+
+def report(label: str, latencies: list):
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1000
+    p95 = latencies[int(len(latencies) * 0.95)] * 1000
+
+    print(f"{label:<24} p50={p50:.3f}ms p95={p95:.3f}ms")
+
+
+def main():
+    with MockDataHubServer(rows=10) as server:
+        url = f"{server.base_url}/price/?symbol=AAPL"
+        headers = {"EETC-API-Key": "benchmark"}
+
+        report(
+            "requests.get",
+            measure(lambda: requests.get(url, headers=headers)),
+        )
+
+        with EETCDataClient("benchmark") as client:
+            client.base_url = server.base_url
+            report(
+                "EETCDataClient session",
+                measure(lambda: client._send_http_request(url, {})),
+            )
+
+
+if __name__ == "__main__":
+    main()
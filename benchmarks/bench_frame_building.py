@@ -0,0 +1,39 @@
+"""
+Compares pd.json_normalize with the columnar records_to_frame builder used by
+EETCDataClient, on a 100k row price payload.
+
+Run from the repository root:
+    python -m benchmarks.bench_frame_building
+"""
+
+import timeit
+
+import pandas as pd
+
+from benchmarks.mock_server import generate_price_data
+from src.eetc_data_client.frames import records_to_frame
+from src.eetc_data_client.schemas import PRICE_DATA_FIELDS
+
+ROUNDS = 5
+
+
+def main():
+    records = generate_price_data("AAPL", 100000)
+
+    pd.testing.assert_frame_equal(
+        pd.json_normalize(records),
+        records_to_frame(records, PRICE_DATA_FIELDS),
+    )
+
+    results = {
+        "json_normalize": lambda: pd.json_normalize(records),
+        "records_to_frame": lambda: records_to_frame(records, PRICE_DATA_FIELDS),
+    }
+
+    for name, build in results.items():
+        elapsed = min(timeit.repeat(build, number=1, repeat=ROUNDS))
+        print(f"{name:<18} {elapsed * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Compares decode time of the standard library json module with the fast JSON
+libraries picked by EETCDataClient(json_loads="auto"), on a synthetic 20
+year daily price history payload.
+
+Run from the repository root:
+    python -m benchmarks.bench_json_decoding
+"""
+
+import json
+import timeit
+
+from benchmarks.mock_server import generate_price_data
+
+ROUNDS = 20
+
+
+def main():
+    body = json.dumps(generate_price_data("AAPL", 20 * 365)).encode()
+    decoders = {"json": json.loads}
+
+    for module_name in ("orjson", "ujson"):
+        try:
+            decoders[module_name] = __import__(module_name).loads
+        except ImportError:
+            print(f"{module_name:<8} not installed")
+
+    print(f"payload: {len(body) / 1024:.0f} KiB")
+
+    for name, loads in decoders.items():
+        elapsed = min(timeit.repeat(lambda: loads(body), number=1, repeat=ROUNDS))
+        print(f"{name:<8} {elapsed * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Measures the response bytes and time saved by revalidating unchanged
+Fundamentals data with conditional requests, against a local stand-in
+server serving 40 quarters per symbol.
+
+Run from the repository root:
+    python -m benchmarks.bench_revalidation
+"""
+
+import time
+
+from benchmarks.mock_server import MockDataHubServer
+from src.eetc_data_client.client import EETCDataClient
+
+SYMBOLS = [f"SYM{i}" for i in range(20)]
+ROUNDS = 5
+
+
+def main():
+    for revalidate in (False, True):
+        with MockDataHubServer(rows=40) as server:
+            with EETCDataClient("benchmark", revalidate=revalidate) as client:
+                client.base_url = server.base_url
+
+                start = time.perf_counter()
+
+                for _ in range(ROUNDS):
+                    for symbol in SYMBOLS:
+                        client.get_fundamentals_data(symbol)
+
+                elapsed = time.perf_counter() - start
+
+            print(
+                f"revalidate={str(revalidate):<5} {elapsed:.2f}s "
+                f"bytes_sent={server.bytes_sent} "
+                f"not_modified={client.revalidation_info['not_modified']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Measures the startup cost of short-lived scripts using the client: the cold
+import of the client module and the first call of a fresh process against
+a local stand-in server, with the process's peak RSS and whether pandas
+had to be imported.
+
+Every measurement runs in a new interpreter, so nothing is cached between
+them.
+
+Run from the repository root:
+    python -m benchmarks.bench_startup
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+
+from benchmarks.mock_server import MockDataHubServer
+
+ROUNDS = 10
+
+# timed code mapped to its name, `client` is created before the timer stops
+SCENARIOS = {
+    "import": "",
+    "get_indicators": "client.get_indicators()",
+    "get_companies": "client.get_companies()",
+    "get_price_data[as_json]": "client.get_price_data('AAPL', as_json=True)",
+    "get_price_data": "client.get_price_data('AAPL')",
+}
+
+SCRIPT = """
+import json
+import resource
+import sys
+import time
+
+start = time.perf_counter()
+from src.eetc_data_client.client import EETCDataClient
+client = EETCDataClient("benchmark")
+client.base_url = sys.argv[1]
+{code}
+elapsed = time.perf_counter() - start
+
+print(json.dumps({{
+    "time": elapsed,
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "pandas": "pandas" in sys.modules,
+}}))
+"""
+
+
+def measure(code: str, base_url: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(code=code), base_url],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    return json.loads(output)
+
+
+def main():
+    with MockDataHubServer(rows=250) as server:
+        for name, code in SCENARIOS.items():
+            results = [measure(code, server.base_url) for _ in range(ROUNDS)]
+            times = [result["time"] for result in results]
+            max_rss = max(result["max_rss_kb"] for result in results)
+
+            print(
+                f"{name:<25} p50={statistics.median(times) * 1000:7.1f}ms "
+                f"min={min(times) * 1000:7.1f}ms "
+                f"rss={max_rss / 1024:6.1f}MB "
+                f"pandas={'yes' if results[0]['pandas'] else 'no'}"
+            )
+
+
+if __name__ == "__main__":
+    main()
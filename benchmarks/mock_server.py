@@ -0,0 +1,290 @@
+"""
+Local stand-in for the EETC Data Hub REST API used by the benchmarks.
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from src.eetc_data_client.schemas import FUNDAMENTALS_VALUE_FIELDS
+
+# data served by the stand-in never changes
+LAST_MODIFIED = "Mon, 02 Jan 2023 00:00:00 GMT"
+
+# bytes per chunk of chunked responses
+CHUNK_SIZE = 4096
+
+
+def generate_price_data(symbol: str, rows: int) -> list:
+    start = date(1990, 1, 1)
+    price = 100.0
+    records = []
+
+    for i in range(rows):
+        price = round(price * (1.0 + ((i * 7919) % 201 - 100) / 10000.0), 4)
+        records.append(
+            {
+                "date": f"{start + timedelta(days=i)}T00:00:00Z",
+                "symbol": symbol,
+                "open": price,
+                "high": round(price * 1.01, 4),
+                "low": round(price * 0.99, 4),
+                "close": price,
+                "volume": float(1000000 + i),
+                "name": f"{symbol} Inc.",
+            }
+        )
+
+    return records
+
+
+def generate_fundamentals_data(symbol: str, rows: int) -> list:
+    records = []
+
+    for i in range(rows):
+        record = {
+            "symbol": symbol,
+            "year": 2000 + i // 4,
+            "quarter": i % 4 + 1,
+            "name": f"{symbol} Inc.",
+            "inserted_at": "2023-01-02T00:00:00Z",
+            "frequency": "Quarterly",
+            "source": "stand-in",
+        }
+
+        for j, field in enumerate(FUNDAMENTALS_VALUE_FIELDS):
+            record[field] = float((i * 7919 + j * 104729) % 1000003)
+
+        records.append(record)
+
+    return records
+
+
+def generate_indicator_data(name: str, frequency: str, rows: int) -> list:
+    start = date(1950, 1, 1)
+    step = {"Yearly": 365, "Quarterly": 91, "Monthly": 30, "Weekly": 7}
+    days = step.get(frequency, 1)
+
+    return [
+        {
+            "date": f"{start + timedelta(days=i * days)}T00:00:00Z",
+            "name": name,
+            "value": round(100.0 + ((i * 7919) % 2001 - 1000) / 100.0, 2),
+            "frequency": frequency,
+        }
+        for i in range(rows)
+    ]
+
+
+def generate_indicator_names(rows: int) -> dict:
+    return {
+        frequency: [f"{frequency} Indicator {i}" for i in range(rows)]
+        for frequency in ("Yearly", "Quarterly", "Monthly", "Weekly", "Daily")
+    }
+
+
+def generate_companies(rows: int) -> list:
+    return [
+        {"symbol": f"SYM{i}", "name": f"SYM{i} Inc.", "index": "S&P 500"}
+        for i in range(rows)
+    ]
+
+
+def generate_payload(path: str, query: dict, rows: int):
+    """
+    :return: Synthetic response data of an endpoint, None for unknown paths.
+    """
+
+    if path == "/api/price/":
+        return generate_price_data(query.get("symbol", "AAPL"), rows)
+
+    if path == "/api/fundamentals/":
+        return generate_fundamentals_data(query.get("symbol", "AAPL"), rows)
+
+    if path == "/api/indicators/":
+        return generate_indicator_data(
+            query.get("name", "US Real GDP"),
+            query.get("frequency", "Daily"),
+            rows,
+        )
+
+    if path == "/api/indicators/names/":
+        return generate_indicator_names(rows)
+
+    if path == "/api/companies/":
+        return generate_companies(rows)
+
+    return None
+
+
+class MockDataHubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parsed_url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(parsed_url.query).items()}
+
+        # simulate server side processing and network latency
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        # like EETC Data Hub during cold starts
+        if self.server.count_request() <= self.server.unavailable:
+            self.send_response(503)
+
+            if self.server.retry_after is not None:
+                self.send_header("Retry-After", self.server.retry_after)
+
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        # payloads are generated once per URL, so repeated requests measure
+        # the client rather than the stand-in
+        payload = self.server.payloads.get(self.path)
+
+        if payload is None:
+            data = generate_payload(parsed_url.path, query, self.server.rows)
+
+            if data is None:
+                self.send_error(404)
+                return
+
+            # like a server supporting field selection
+            if "fields" in query and isinstance(data, list):
+                fields = query["fields"].split(",")
+                data = [{f: record.get(f) for f in fields} for record in data]
+
+            body = json.dumps(data).encode()
+            payload = (body, f'"{hashlib.md5(body).hexdigest()}"')
+            self.server.payloads[self.path] = payload
+
+        body, etag = payload
+
+        # answer conditional requests for unchanged data without a body
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", LAST_MODIFIED)
+
+        if self.server.compress and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, compresslevel=6)
+            self.send_header("Content-Encoding", "gzip")
+
+        # counted before writing so clients never see a stale count
+        self.server.count_bytes_sent(len(body))
+
+        # like servers streaming their responses, e.g. on Cloud Run
+        if self.server.chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+
+            for start in range(0, len(body), CHUNK_SIZE):
+                chunk = body[start : start + CHUNK_SIZE]
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+
+            self.wfile.write(b"0\r\n\r\n")
+            return
+
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        # simulate a body stalling after the headers were sent
+        if self.server.stall:
+            self.wfile.flush()
+            time.sleep(self.server.stall)
+
+        self.wfile.write(body)
+
+
+class MockDataHubServer:
+    """
+    Runs a MockDataHubHandler based HTTP server in a background thread.
+    """
+
+    def __init__(
+        self,
+        rows: int = 10,
+        latency: float = 0.0,
+        compress: bool = False,
+        chunked: bool = False,
+        unavailable: int = 0,
+        retry_after: str = None,
+        stall: float = 0.0,
+    ):
+        """
+        :param unavailable: Number of requests answered with 503 first.
+        :param retry_after: Retry-After header sent with the 503 responses.
+        :param stall: Seconds to pause between headers and body.
+        """
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), MockDataHubHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.rows = rows
+        self.httpd.latency = latency
+        self.httpd.compress = compress
+        self.httpd.chunked = chunked
+        self.httpd.unavailable = unavailable
+        self.httpd.retry_after = retry_after
+        self.httpd.stall = stall
+        self.httpd.requests = 0
+        self.httpd.payloads = {}
+        self.httpd.bytes_sent = 0
+        self.httpd.counters_lock = threading.Lock()
+        self.httpd.count_bytes_sent = self._count_bytes_sent
+        self.httpd.count_request = self._count_request
+        self.thread = threading.Thread(target=self.httpd.serve_forever)
+        self.thread.daemon = True
+
+    def _count_bytes_sent(self, n: int):
+        with self.httpd.counters_lock:
+            self.httpd.bytes_sent += n
+
+    def _count_request(self) -> int:
+        with self.httpd.counters_lock:
+            self.httpd.requests += 1
+            return self.httpd.requests
+
+    @property
+    def requests(self) -> int:
+        """
+        Number of requests received so far.
+        """
+
+        return self.httpd.requests
+
+    @property
+    def bytes_sent(self) -> int:
+        """
+        Number of response body bytes sent so far.
+        """
+
+        return self.httpd.bytes_sent
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}/api"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,359 @@
+"""
+Benchmark suite measuring throughput, latency and peak memory of every
+client method and concurrency mode against a local stand-in server.
+
+Results are written as JSON together with the commit they were measured
+on, so runs can be compared across commits.
+
+Run from the repository root:
+    python -m benchmarks.suite --output before.json
+    python -m benchmarks.suite --compare before.json
+
+Use --latency to simulate network latency (seconds per request) and
+--scale to multiply the payload sizes.
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.mock_server import MockDataHubServer
+from src.eetc_data_client.async_client import AsyncEETCDataClient
+from src.eetc_data_client.client import EETCDataClient
+
+SYMBOLS = [f"SYM{i}" for i in range(50)]
+INDICATORS = [f"Indicator {i}" for i in range(40)]
+WORKERS = 16
+
+# output backends mapped to the optional module their scenarios need
+OPTIONAL_MODULES = {"arrow": "pyarrow", "polars": "polars"}
+
+
+class Clients:
+    """
+    Sync and async client pointed at the stand-in server, the async client
+    runs on its own event loop so its connections are reused across calls.
+    """
+
+    def __init__(self, base_url: str):
+        self.sync = EETCDataClient(
+            "benchmark",
+            pool_maxsize=WORKERS,
+            max_workers=WORKERS,
+        )
+        self.sync.base_url = base_url
+        self.async_ = AsyncEETCDataClient("benchmark", concurrency=WORKERS)
+        self.async_.base_url = base_url
+        self.loop = asyncio.new_event_loop()
+
+    def close(self):
+        self.sync.close()
+        self.loop.run_until_complete(self.async_.close())
+        self.loop.close()
+
+
+def sync_call(method: str, *args, **kwargs) -> Callable[[Clients], object]:
+    return lambda clients: getattr(clients.sync, method)(*args, **kwargs)
+
+
+def concurrent_call(method: str, *args, **kwargs) -> Callable[[Clients], object]:
+    def run(clients: Clients):
+        method_ = getattr(clients.sync, method)
+
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            futures = [
+                executor.submit(method_, *args, **kwargs) for _ in range(WORKERS)
+            ]
+
+            return [future.result() for future in futures]
+
+    return run
+
+
+def iter_call(*args, **kwargs) -> Callable[[Clients], object]:
+    return lambda clients: list(clients.sync.iter_price_data(*args, **kwargs))
+
+
+def async_gather(method: str, symbols: List[str]) -> Callable[[Clients], object]:
+    async def gather(clients: Clients):
+        method_ = getattr(clients.async_, method)
+
+        return await asyncio.gather(*[method_(symbol) for symbol in symbols])
+
+    def run(clients: Clients):
+        return clients.loop.run_until_complete(gather(clients))
+
+    return run
+
+
+# name, rows per response, one benchmarked call and the requests it sends
+SCENARIOS = [
+    ("get_price_data", 2500, sync_call("get_price_data", "AAPL"), 1),
+    (
+        "get_price_data[typed]",
+        2500,
+        sync_call("get_price_data", "AAPL", typed=True),
+        1,
+    ),
+    (
+        "get_price_data[large]",
+        25000,
+        sync_call("get_price_data", "AAPL"),
+        1,
+    ),
+    (
+        "get_price_data[descending]",
+        2500,
+        sync_call("get_price_data", "AAPL", sort_order="descending"),
+        1,
+    ),
+    (
+        "get_price_data[as_json]",
+        2500,
+        sync_call("get_price_data", "AAPL", as_json=True),
+        1,
+    ),
+    (
+        "get_price_data[split_days]",
+        2500,
+        sync_call(
+            "get_price_data",
+            "AAPL",
+            from_date="2000-01-01",
+            to_date="2019-12-31",
+            split_days=1826,
+        ),
+        4,
+    ),
+    (
+        "iter_price_data",
+        2500,
+        iter_call(
+            "AAPL",
+            from_date="2000-01-01",
+            to_date="2019-12-31",
+            chunk_days=1826,
+        ),
+        4,
+    ),
+    (
+        "get_price_data_bulk[threads]",
+        250,
+        sync_call("get_price_data_bulk", SYMBOLS),
+        len(SYMBOLS),
+    ),
+    (
+        "get_price_data[asyncio]",
+        250,
+        async_gather("get_price_data", SYMBOLS),
+        len(SYMBOLS),
+    ),
+    (
+        "get_price_data[arrow]",
+        2500,
+        sync_call("get_price_data", "AAPL", output="arrow"),
+        1,
+    ),
+    (
+        "get_price_data[arrow, typed]",
+        2500,
+        sync_call("get_price_data", "AAPL", output="arrow", typed=True),
+        1,
+    ),
+    (
+        "get_price_data[polars]",
+        2500,
+        sync_call("get_price_data", "AAPL", output="polars"),
+        1,
+    ),
+    (
+        "get_price_data[polars, typed]",
+        2500,
+        sync_call("get_price_data", "AAPL", output="polars", typed=True),
+        1,
+    ),
+    ("get_fundamentals_data", 80, sync_call("get_fundamentals_data", "AAPL"), 1),
+    (
+        "get_fundamentals_data[fields]",
+        80,
+        sync_call("get_fundamentals_data", "AAPL", fields=["revenue", "ebit"]),
+        1,
+    ),
+    (
+        "get_fundamentals_panel",
+        80,
+        sync_call("get_fundamentals_panel", SYMBOLS, 2005, 2019),
+        len(SYMBOLS),
+    ),
+    (
+        "get_indicator_data",
+        5000,
+        sync_call("get_indicator_data", "US Real GDP", frequency="Daily"),
+        1,
+    ),
+    (
+        "get_indicator_data_bulk",
+        2500,
+        sync_call("get_indicator_data_bulk", INDICATORS, align="ffill"),
+        len(INDICATORS),
+    ),
+    (
+        "get_indicator_data[coalesced]",
+        5000,
+        concurrent_call("get_indicator_data", "US Real GDP", frequency="Daily"),
+        WORKERS,
+    ),
+    ("get_indicators", 50, sync_call("get_indicators"), 1),
+    ("get_companies", 500, sync_call("get_companies"), 1),
+]
+
+
+def run_scenario(
+    rows: int,
+    call: Callable[[Clients], object],
+    requests_per_call: int,
+    latency: float,
+    repeat: int,
+) -> Dict[str, float]:
+    with MockDataHubServer(rows=rows, latency=latency) as server:
+        clients = Clients(server.base_url)
+
+        # warm up connections and the server's payload cache
+        call(clients)
+
+        timings = []
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+            call(clients)
+            timings.append(time.perf_counter() - start)
+
+        # traced separately because tracing slows down allocations
+        tracemalloc.start()
+        call(clients)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        clients.close()
+
+    total_time = sum(timings)
+
+    return {
+        "rows": rows,
+        "requests_per_call": requests_per_call,
+        "calls": repeat,
+        "latency_p50_ms": float(np.percentile(timings, 50)) * 1000,
+        "latency_p95_ms": float(np.percentile(timings, 95)) * 1000,
+        "latency_mean_ms": total_time / repeat * 1000,
+        "calls_per_s": repeat / total_time,
+        "requests_per_s": repeat * requests_per_call / total_time,
+        "peak_memory_mb": peak_memory / 2**20,
+    }
+
+
+def get_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results: dict, baseline: dict):
+    print(f"\ncompared to {baseline['meta']['commit']}:")
+
+    for name, result in results["results"].items():
+        before = baseline["results"].get(name)
+
+        if before is None:
+            continue
+
+        changes = [
+            f"{key}={(result[key] / before[key] - 1) * 100:+.1f}%"
+            for key in ("latency_p50_ms", "calls_per_s", "peak_memory_mb")
+            if before[key]
+        ]
+        print(f"{name:<30} {' '.join(changes)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--filter", default="", help="run matching scenarios only")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="JSON results of a previous run")
+    args = parser.parse_args()
+
+    results = {
+        "meta": {
+            "commit": get_commit(),
+            "measured_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "latency": args.latency,
+            "scale": args.scale,
+            "repeat": args.repeat,
+        },
+        "results": {},
+    }
+
+    for name, rows, call, requests_per_call in SCENARIOS:
+        if args.filter not in name:
+            continue
+
+        missing = [
+            module
+            for backend, module in OPTIONAL_MODULES.items()
+            if backend in name and importlib.util.find_spec(module) is None
+        ]
+
+        if missing:
+            print(f"{name:<30} skipped, {missing[0]} not installed")
+            continue
+
+        result = run_scenario(
+            max(int(rows * args.scale), 1),
+            call,
+            requests_per_call,
+            args.latency,
+            args.repeat,
+        )
+        results["results"][name] = result
+
+        print(
+            f"{name:<30} p50={result['latency_p50_ms']:8.2f}ms "
+            f"p95={result['latency_p95_ms']:8.2f}ms "
+            f"{result['requests_per_s']:8.1f} req/s "
+            f"peak={result['peak_memory_mb']:7.2f}MB"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
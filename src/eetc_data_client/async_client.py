@@ -0,0 +1,557 @@
+import asyncio
+import json
+from typing import Union, List, Dict, Tuple, Iterable
+
+from .client import BaseEETCDataClient, OutputData
+from .coalescing import SingleFlight
+from .exceptions import DeadlineExceededError, RequestTimeoutError
+from .retry import RetryPolicy
+
+
+class AsyncEETCDataClient(BaseEETCDataClient):
+    """
+    asyncio based EETC Data Hub client. Requires the optional `aiohttp`
+    dependency (pip install eetc_data_client[async]).
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        concurrency: int = 10,
+        json_loads="auto",
+        typed: bool = False,
+        retry_policy: RetryPolicy = None,
+        rate_limit: float = None,
+        rate_limit_burst: int = None,
+        timeout: Union[float, Tuple[float, float]] = (5.0, 60.0),
+        deadline: float = None,
+        output: str = "pandas",
+        sort_order: str = "ascending",
+        forward_fields: bool = False,
+        coalesce: bool = True,
+    ):
+        """
+        :param api_key: EETC Data Hub API Key.
+        :param max_connections: Maximum number of open connections in the
+        pool, 0 means no limit.
+        :param max_connections_per_host: Maximum number of open connections
+        per host, 0 means no limit.
+        :param concurrency: Maximum number of requests in flight at once.
+        :param json_loads: Function used for decoding response bodies. By
+        default ("auto") orjson or ujson is used if installed, None forces
+        the standard library json module.
+        :param typed: If True, DataFrames are returned with parsed tz-aware
+        dates as index, categorical labels and numeric dtypes as defined in
+        eetc_data_client.schemas, instead of the raw JSON types.
+        :param retry_policy: How requests failing with connection errors or
+        retryable statuses (429, 5xx) are retried, see
+        eetc_data_client.retry.RetryPolicy. Defaults to 3 attempts with
+        exponential backoff.
+        :param rate_limit: Maximum number of requests per second sent by the
+        client across all tasks, including retries. Unlimited if None.
+        :param rate_limit_burst: Number of requests which may be sent at once
+        before rate_limit applies, defaults to one second worth of requests.
+        :param timeout: Seconds to wait for a connection and between bytes of
+        the response, either one value for both or a (connect, read) tuple.
+        None waits forever.
+        :param deadline: Seconds a method call may take in total, retries
+        included. DeadlineExceededError is raised once it passes. Unlimited
+        if None.
+        :param output: Default format returned by the data methods: "pandas"
+        DataFrames, "json" records, "polars" DataFrames (requires polars) or
+        "arrow" pyarrow Tables (requires pyarrow).
+        :param sort_order: Order in which the data methods return Price and
+        indicator data: by date "ascending" or "descending", or "unsorted" in
+        the order returned by the server. Data which is already in order is
+        not sorted again. JSON records are always returned unsorted.
+        :param forward_fields: If True, fields selected with the `fields`
+        parameter of the data methods are sent to EETC Data Hub, so only
+        those are transferred. Otherwise they are selected locally.
+        :param coalesce: If True, concurrent calls requesting the same
+        endpoint with the same params from several tasks share one request
+        and each gets its own copy of the response, see coalescing_info.
+        """
+
+        super().__init__(
+            api_key,
+            json_loads,
+            typed,
+            retry_policy,
+            rate_limit,
+            rate_limit_burst,
+            timeout,
+            deadline,
+            output,
+            sort_order,
+            forward_fields,
+        )
+
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.concurrency = concurrency
+        self.single_flight = SingleFlight() if coalesce else None
+
+        self.session = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """
+        Close all pooled connections held by the client.
+        """
+
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _create_session(self):
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise ImportError(
+                "AsyncEETCDataClient requires aiohttp, install it with "
+                "`pip install eetc_data_client[async]`."
+            ) from e
+
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections_per_host,
+        )
+
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={"EETC-API-Key": self.api_key},
+        )
+
+    async def _send_http_request(
+        self,
+        url: str,
+        params: dict,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline_at: float = None,
+    ) -> bytes:
+        if params is None:
+            params = {}
+
+        # session and semaphore have to be created inside the running loop
+        if self.session is None:
+            self.session = self._create_session()
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        import aiohttp
+
+        attempt = 1
+
+        while True:
+            if self.rate_limiter is not None:
+                # fail fast instead of waiting for a token past the deadline
+                acquired = await self.rate_limiter.acquire_async(
+                    self._check_deadline(deadline_at)
+                )
+
+                if not acquired:
+                    raise DeadlineExceededError("Deadline exceeded")
+
+            try:
+                async with self._semaphore:
+                    connect_timeout, read_timeout = self._get_attempt_timeout(
+                        timeout,
+                        deadline_at,
+                    )
+                    client_timeout = aiohttp.ClientTimeout(
+                        total=self._check_deadline(deadline_at),
+                        sock_connect=connect_timeout,
+                        sock_read=read_timeout,
+                    )
+
+                    async with self.session.get(
+                        url,
+                        params=params,
+                        timeout=client_timeout,
+                    ) as response:
+                        if not self.retry_policy.should_retry(
+                            attempt,
+                            response.status,
+                        ):
+                            if response.status != 200 and attempt > 1:
+                                self._count_retry_stat("exhausted")
+
+                            response.raise_for_status()
+
+                            return await response.read()
+
+                        delay = self.retry_policy.get_backoff(
+                            attempt,
+                            response.headers.get("Retry-After"),
+                        )
+            # a subclass of asyncio.TimeoutError since Python 3.11, raised
+            # before the request is sent
+            except DeadlineExceededError:
+                raise
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if not self.retry_policy.should_retry(attempt):
+                    if attempt > 1:
+                        self._count_retry_stat("exhausted")
+
+                    if isinstance(e, asyncio.TimeoutError):
+                        raise RequestTimeoutError(f"Request to {url} timed out") from e
+
+                    raise
+
+                delay = self.retry_policy.get_backoff(attempt)
+
+            # give up early instead of sleeping past the deadline
+            self._check_deadline(deadline_at, delay)
+
+            if attempt == 1:
+                self._count_retry_stat("retried_requests")
+
+            self._count_retry_stat("retries")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _decode_body(self, body: bytes):
+        if self.json_loads is None:
+            return json.loads(body)
+
+        return self.json_loads(body)
+
+    @property
+    def coalescing_info(self) -> Dict[str, int]:
+        """
+        Number of requests sent on behalf of possibly concurrent calls
+        ("flights") and number of calls which shared the response of one of
+        them instead of sending their own request ("coalesced").
+        """
+
+        if self.single_flight is None:
+            return {"flights": 0, "coalesced": 0}
+
+        return self.single_flight.info
+
+    async def _request_data(
+        self,
+        endpoint: str,
+        url: str,
+        params: dict,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline_at: float = None,
+    ):
+        async def fetch():
+            response_body = await self._send_http_request(
+                url,
+                params,
+                timeout,
+                deadline_at,
+            )
+
+            return self._decode_body(response_body)
+
+        if self.single_flight is None:
+            return await fetch()
+
+        key = (url, tuple(sorted(params.items())))
+        copier = self._get_copier(endpoint)
+
+        while True:
+            fetched = []
+
+            async def fetch_once():
+                fetched.append(True)
+                return await fetch()
+
+            try:
+                return await self.single_flight.do_async(
+                    key,
+                    fetch_once,
+                    self._check_deadline(deadline_at),
+                    copier,
+                )
+            except RequestTimeoutError:
+                if fetched:
+                    raise
+
+                # the shared request timed out under the other call's limits
+                self._check_deadline(deadline_at)
+            except asyncio.TimeoutError:
+                raise DeadlineExceededError("Deadline exceeded")
+
+    async def get_price_data(
+        self,
+        symbol: str,
+        date: str = None,
+        from_date: str = None,
+        to_date: str = None,
+        as_json=False,
+        typed: bool = None,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline: float = None,
+        output: str = None,
+        path: str = None,
+        sort_order: str = None,
+        fields: Iterable[str] = None,
+    ) -> OutputData:
+        """
+        Get historical Price data from EETC Data Hub via REST API.
+
+        :param symbol: Symbol of the instrument.
+        :param date: Specific date in string format "yyyy-mm-dd"
+        :param from_date: Earliest date in string format "yyyy-mm-dd"
+        :param to_date: Latest date in string format "yyyy-mm-dd"
+        :param as_json: Indicates if caller wants data returned as JSON. False
+        by default, if False, it will return the data as a pandas DataFrame.
+        :param typed: Indicates if caller wants a typed DataFrame, see
+        eetc_data_client.schemas. Defaults to the client's `typed` setting.
+        :param timeout: Connect and read timeout in seconds, defaults to the
+        client's `timeout` setting.
+        :param deadline: Seconds the call may take in total, defaults to the
+        client's `deadline` setting.
+        :param output: "pandas", "json", "polars" (polars DataFrame), "arrow"
+        (pyarrow Table) or "parquet" (pyarrow Table written to `path`, which
+        is returned). Defaults to the client's `output` setting, as_json=True
+        is the same as "json".
+        :param path: File the "parquet" output is written to.
+        :param sort_order: "ascending", "descending" or "unsorted", defaults
+        to the client's `sort_order` setting.
+        :param fields: Fields to return besides "date", e.g. ["close"], all if
+        None.
+        :return: Historical Price data as a pandas DataFrame.
+        """
+
+        output = self._get_output(as_json, output, path)
+        sort_order = self._get_sort_order(sort_order)
+        columns = self._get_columns("price", fields)
+
+        url, params = self._price_data_request(
+            symbol,
+            date,
+            from_date,
+            to_date,
+            columns,
+        )
+
+        # send the HTTP request to EETC Data Hub
+        response_data = await self._request_data(
+            "price",
+            url,
+            params,
+            timeout,
+            self._get_deadline_at(deadline),
+        )
+
+        return self._convert_records(
+            "price",
+            response_data,
+            output,
+            typed,
+            path,
+            sort_order,
+            columns,
+        )
+
+    async def get_fundamentals_data(
+        self,
+        symbol: str,
+        frequency: str = "Quarterly",
+        name: str = None,
+        year: int = None,
+        as_json=False,
+        typed: bool = None,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline: float = None,
+        output: str = None,
+        path: str = None,
+        fields: Iterable[str] = None,
+    ) -> OutputData:
+        """
+        Get historical Fundamentals data from EETC Data Hub via REST API.
+
+        :param symbol: Symbol of the instrument.
+        :param frequency: Can be "Yearly" or "Quarterly".
+        :param name: Name of the instrument/company.
+        :param year: Specific year for which the caller wants data.
+        :param as_json: Indicates if caller wants data returned as JSON. False
+        by default, if False, it will return the data as a pandas DataFrame.
+        :param typed: Indicates if caller wants a typed DataFrame, see
+        eetc_data_client.schemas. Defaults to the client's `typed` setting.
+        :param timeout: Connect and read timeout in seconds, defaults to the
+        client's `timeout` setting.
+        :param deadline: Seconds the call may take in total, defaults to the
+        client's `deadline` setting.
+        :param output: "pandas", "json", "polars" (polars DataFrame), "arrow"
+        (pyarrow Table) or "parquet" (pyarrow Table written to `path`, which
+        is returned). Defaults to the client's `output` setting, as_json=True
+        is the same as "json".
+        :param path: File the "parquet" output is written to.
+        :param fields: Fields to return besides "symbol", "year" and
+        "quarter", e.g. ["revenue", "ebit"], all if None.
+        :return: Historical Fundamentals data as a pandas DataFrame.
+        """
+
+        output = self._get_output(as_json, output, path)
+        columns = self._get_columns("fundamentals", fields)
+
+        url, params = self._fundamentals_data_request(
+            symbol,
+            frequency,
+            name,
+            year,
+            columns,
+        )
+
+        # send the HTTP request to EETC Data Hub
+        response_data = await self._request_data(
+            "fundamentals",
+            url,
+            params,
+            timeout,
+            self._get_deadline_at(deadline),
+        )
+
+        return self._convert_records(
+            "fundamentals",
+            response_data,
+            output,
+            typed,
+            path,
+            columns=columns,
+        )
+
+    async def get_indicator_data(
+        self,
+        name: str,
+        frequency: str = None,
+        from_date: str = None,
+        to_date: str = None,
+        as_json=False,
+        typed: bool = None,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline: float = None,
+        output: str = None,
+        path: str = None,
+        sort_order: str = None,
+        fields: Iterable[str] = None,
+    ) -> OutputData:
+        """
+        Get historical Macroeconomic data from EETC Data Hub via REST API.
+
+        :param name: Name of the macroeconomic data point.
+        :param frequency: "Yearly", "Quarterly", "Monthly", "Weekly", "Daily".
+        :param from_date: Earliest date in string format "yyyy-mm-dd"
+        :param to_date: Latest date in string format "yyyy-mm-dd"
+        :param as_json: Indicates if caller wants data returned as JSON. False
+        by default, if False, it will return the data as a pandas DataFrame.
+        :param typed: Indicates if caller wants a typed DataFrame, see
+        eetc_data_client.schemas. Defaults to the client's `typed` setting.
+        :param timeout: Connect and read timeout in seconds, defaults to the
+        client's `timeout` setting.
+        :param deadline: Seconds the call may take in total, defaults to the
+        client's `deadline` setting.
+        :param output: "pandas", "json", "polars" (polars DataFrame), "arrow"
+        (pyarrow Table) or "parquet" (pyarrow Table written to `path`, which
+        is returned). Defaults to the client's `output` setting, as_json=True
+        is the same as "json".
+        :param path: File the "parquet" output is written to.
+        :param sort_order: "ascending", "descending" or "unsorted", defaults
+        to the client's `sort_order` setting.
+        :param fields: Fields to return besides "date", e.g. ["value"], all if
+        None.
+        :return: Historical Macroeconomic data as a pandas DataFrame.
+        """
+
+        output = self._get_output(as_json, output, path)
+        sort_order = self._get_sort_order(sort_order)
+        columns = self._get_columns("indicators", fields)
+
+        url, params = self._indicator_data_request(
+            name,
+            frequency,
+            from_date,
+            to_date,
+            columns,
+        )
+
+        # send the HTTP request to EETC Data Hub
+        response_data = await self._request_data(
+            "indicators",
+            url,
+            params,
+            timeout,
+            self._get_deadline_at(deadline),
+        )
+
+        return self._convert_records(
+            "indicators",
+            response_data,
+            output,
+            typed,
+            path,
+            sort_order,
+            columns,
+        )
+
+    async def get_indicators(
+        self,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline: float = None,
+    ) -> Dict[str, List[str]]:
+        """
+        Get supported indicators grouped by frequency from EETC Data Hub via
+        REST API.
+
+        :param timeout: Connect and read timeout in seconds, defaults to the
+        client's `timeout` setting.
+        :param deadline: Seconds the call may take in total, defaults to the
+        client's `deadline` setting.
+        :return: List of indicator names grouped by frequency.
+        """
+
+        url, params = self._indicators_request()
+
+        # send the HTTP request to EETC Data Hub
+        response_data = await self._request_data(
+            "indicators/names",
+            url,
+            params,
+            timeout,
+            self._get_deadline_at(deadline),
+        )
+
+        return response_data
+
+    async def get_companies(
+        self,
+        index: str = None,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline: float = None,
+    ) -> Dict[str, List[str]]:
+        """
+        Get supported companies from EETC Data Hub via REST API.
+
+        :param index: Index which contains the Company.
+        :param timeout: Connect and read timeout in seconds, defaults to the
+        client's `timeout` setting.
+        :param deadline: Seconds the call may take in total, defaults to the
+        client's `deadline` setting.
+        :return: List of companies in the EETC Data Hub database.
+        """
+
+        url, params = self._companies_request(index)
+
+        # send the HTTP request to EETC Data Hub
+        response_data = await self._request_data(
+            "companies",
+            url,
+            params,
+            timeout,
+            self._get_deadline_at(deadline),
+        )
+
+        return response_data
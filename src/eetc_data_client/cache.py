@@ -0,0 +1,245 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Tuple, Any, Callable, Hashable
+from urllib.parse import quote
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _parquet_supported() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+
+    return True
+
+
+class PriceDataCache:
+    """
+    Directory of per-symbol files holding the historical Price data already
+    fetched from EETC Data Hub, so only new rows have to be requested again.
+
+    Every symbol gets a data file (Parquet if pyarrow is installed, pickle
+    otherwise) and a small JSON file with the earliest date the cached data
+    covers.
+    """
+
+    def __init__(self, cache_dir: str, file_format: str = None):
+        """
+        :param cache_dir: Directory where cached data is stored, it is
+        created if it does not exist.
+        :param file_format: "parquet" or "pickle", by default "parquet" is
+        used if pyarrow is installed.
+        """
+
+        if file_format is None:
+            file_format = "parquet" if _parquet_supported() else "pickle"
+
+        if file_format not in ("parquet", "pickle"):
+            raise ValueError(f"Unsupported cache file format: {file_format}")
+
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.file_format = file_format
+
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def lock(self, symbol: str) -> threading.Lock:
+        """
+        :param symbol: Symbol of the instrument.
+        :return: Lock of the symbol, held while its cached data is loaded,
+        topped up and saved so concurrent calls do not interleave.
+        """
+
+        with self._locks_lock:
+            return self._locks.setdefault(symbol, threading.Lock())
+
+    def _path(self, symbol: str, extension: str) -> str:
+        # symbols like "BRK/B" or "^GSPC" must map to safe file names
+        return os.path.join(self.cache_dir, f"{quote(symbol, safe='')}.{extension}")
+
+    def load(self, symbol: str) -> Optional[Tuple["pd.DataFrame", Optional[str]]]:
+        """
+        Load cached Price data for a symbol.
+
+        :param symbol: Symbol of the instrument.
+        :return: Tuple of the cached data and the earliest date it covers (None
+        if it covers the full history), or None if nothing is cached.
+        """
+
+        data_path = self._path(symbol, self.file_format)
+        meta_path = self._path(symbol, "json")
+
+        if not os.path.exists(data_path) or not os.path.exists(meta_path):
+            return None
+
+        with open(meta_path) as f:
+            meta = json.load(f)
+
+        import pandas as pd
+
+        if self.file_format == "parquet":
+            df = pd.read_parquet(data_path)
+        else:
+            df = pd.read_pickle(data_path)
+
+        return df, meta["from_date"]
+
+    def save(self, symbol: str, df: "pd.DataFrame", from_date: Optional[str]):
+        """
+        Store Price data for a symbol, replacing what was cached before.
+
+        :param symbol: Symbol of the instrument.
+        :param df: Price data sorted by date.
+        :param from_date: Earliest date the data covers, None if it covers the
+        full history.
+        """
+
+        data_path = self._path(symbol, self.file_format)
+        meta_path = self._path(symbol, "json")
+
+        # write to unique temporary files first so readers never see partial
+        # files and concurrent writers never share one
+        if self.file_format == "parquet":
+            data_tmp_path = self._write_temporary(
+                lambda path: df.to_parquet(path, index=False),
+            )
+        else:
+            data_tmp_path = self._write_temporary(df.to_pickle)
+
+        try:
+            meta_tmp_path = self._write_temporary(
+                lambda path: self._write_meta(path, from_date),
+            )
+        except BaseException:
+            os.remove(data_tmp_path)
+            raise
+
+        # the data is replaced first, a reader in between pairs it with the
+        # previous from_date, which never covers more than the new data
+        os.replace(data_tmp_path, data_path)
+        os.replace(meta_tmp_path, meta_path)
+
+    def _write_temporary(self, write: Callable[[str], Any]) -> str:
+        fd, path = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+        os.close(fd)
+
+        try:
+            write(path)
+        except BaseException:
+            os.remove(path)
+            raise
+
+        return path
+
+    def _write_meta(self, path: str, from_date: Optional[str]):
+        with open(path, "w") as f:
+            json.dump({"from_date": from_date}, f)
+
+    def invalidate(self, symbol: str = None):
+        """
+        Remove cached Price data.
+
+        :param symbol: Symbol of the instrument, if None the whole cache is
+        cleared.
+        """
+
+        if symbol is None:
+            file_names = [
+                file_name
+                for file_name in os.listdir(self.cache_dir)
+                if file_name.endswith((".parquet", ".pickle", ".json"))
+            ]
+        else:
+            file_names = [
+                os.path.basename(self._path(symbol, extension))
+                for extension in ("parquet", "pickle", "json")
+            ]
+
+        for file_name in file_names:
+            path = os.path.join(self.cache_dir, file_name)
+
+            if os.path.exists(path):
+                os.remove(path)
+
+
+class ResponseCache:
+    """
+    Thread-safe in-memory cache of decoded responses with time-to-live
+    expiry and least-recently-used eviction.
+    """
+
+    def __init__(self, ttl: float = None, max_entries: int = 128):
+        """
+        :param ttl: Seconds an entry stays valid, None means entries never
+        expire.
+        :param max_entries: Maximum number of entries, the least recently
+        used entry is evicted when it is exceeded.
+        """
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        :param key: Cache key.
+        :return: Tuple indicating if a valid entry was found and its value.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                expires_at, value = entry
+
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+
+                del self._entries[key]
+
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Hashable, value: Any):
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool] = None):
+        """
+        Remove cached entries.
+
+        :param predicate: Called with every key, entries for which it returns
+        True are removed. If None the whole cache is cleared.
+        """
+
+        with self._lock:
+            if predicate is None:
+                self._entries.clear()
+                return
+
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
@@ -1,30 +1,1162 @@
-from typing import Union, List, Dict
+import concurrent.futures
+import copy
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Union,
+    List,
+    Dict,
+    Tuple,
+    Iterable,
+    Iterator,
+    Callable,
+    Optional,
+    Any,
+)
 
-import pandas as pd
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.models import CONTENT_CHUNK_SIZE
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from urllib3.response import _get_decoder
+from urllib3.util.request import ACCEPT_ENCODING
 
+from .cache import PriceDataCache, ResponseCache
+from .coalescing import SingleFlight
+from .date_ranges import split_date_range
+from .exceptions import DeadlineExceededError, RequestTimeoutError
+from .frames import (
+    records_to_frame,
+    records_to_polars,
+    records_to_table,
+    records_to_series,
+    series_to_wide_frame,
+    apply_schema,
+    resample_frame,
+    sort_frame,
+    import_pyarrow,
+)
+from .instrumentation import CallRecord, StatsCollector
+from .json_decoding import resolve_json_loads
+from .panel import (
+    FundamentalsPanel,
+    FundamentalsRows,
+    fundamentals_rows_to_frame,
+    records_to_fundamentals_rows,
+)
+from .rate_limit import TokenBucket
+from .retry import RetryPolicy
+from .schemas import (
+    PRICE_DATA_FIELDS,
+    FUNDAMENTALS_DATA_FIELDS,
+    FUNDAMENTALS_VALUE_FIELDS,
+    INDICATOR_DATA_FIELDS,
+    KEY_FIELDS,
+    SCHEMAS,
+)
+
+# pandas and NumPy are only imported once a DataFrame is built, so scripts
+# only requesting JSON or reference data start quickly
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import polars
+    import pyarrow
+
+# formats the data methods can return
+OUTPUTS = ("pandas", "json", "polars", "arrow", "parquet")
+
+# orders in which price and indicator data is returned, "unsorted" keeps the
+# order of the server's response
+SORT_ORDERS = ("ascending", "descending", "unsorted")
+
+# frequencies of indicators, from highest to lowest, mapped to the pandas
+# period alias they are resampled with
+INDICATOR_FREQUENCIES = {
+    "Daily": "D",
+    "Weekly": "W",
+    "Monthly": "M",
+    "Quarterly": "Q",
+    "Yearly": "Y",
+}
+
+# data returned by the data methods, depending on their output
+OutputData = Union["pd.DataFrame", List[Dict], "polars.DataFrame", "pyarrow.Table", str]
+
+# endpoints serving slowly changing reference data
+REFERENCE_ENDPOINTS = ("indicators/names", "companies")
+
+# endpoints whose responses are revalidated with conditional requests
+REVALIDATED_ENDPOINTS = ("fundamentals", "indicators/names", "companies")
+
+# response headers holding validators mapped to the request headers they
+# are sent back in
+VALIDATOR_HEADERS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
+
+def _copy_records(records: List[Dict]) -> List[Dict]:
+    return [dict(record) for record in records]
+
+
+class BaseEETCDataClient:
+    """
+    Request building and response processing shared by the sync and async
+    EETC Data Hub clients, so both return identical data.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        json_loads="auto",
+        typed: bool = False,
+        retry_policy: RetryPolicy = None,
+        rate_limit: float = None,
+        rate_limit_burst: int = None,
+        timeout: Union[float, Tuple[float, float]] = (5.0, 60.0),
+        deadline: float = None,
+        output: str = "pandas",
+        sort_order: str = "ascending",
+        forward_fields: bool = False,
+    ):
+        if output not in OUTPUTS:
+            raise ValueError(f"Unsupported output: {output}")
+
+        if sort_order not in SORT_ORDERS:
+            raise ValueError(f"Unsupported sort order: {sort_order}")
 
-class EETCDataClient:
-    def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://eetc-data-hub-service-nb7ewdzv6q-ue.a.run.app/api"
+        self.json_loads = resolve_json_loads(json_loads)
+        self.typed = typed
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = None
+        self.timeout = timeout
+        self.deadline = deadline
+        self.output = output
+        self.sort_order = sort_order
+        self.forward_fields = forward_fields
         # TODO check API Key validity during __init__ & raise exception
 
-    def _send_http_request(self, url: str, params: dict) -> Response:
-        if params is None:
-            params = {}
+        self._retry_stats = {"retries": 0, "retried_requests": 0, "exhausted": 0}
+        self._retry_stats_lock = threading.Lock()
+
+        if rate_limit is not None:
+            self.rate_limiter = TokenBucket(rate_limit, rate_limit_burst)
+
+    @property
+    def retry_stats(self) -> Dict[str, int]:
+        """
+        Number of retries sent, requests which needed at least one retry and
+        requests which still failed after the last attempt.
+        """
+
+        with self._retry_stats_lock:
+            return dict(self._retry_stats)
+
+    def _count_retry_stat(self, name: str):
+        with self._retry_stats_lock:
+            self._retry_stats[name] += 1
+
+    def _get_copier(self, endpoint: str) -> Callable[[Any], Any]:
+        """
+        :return: Function copying decoded response data of the endpoint
+        which is kept in a cache or shared by coalesced calls, so every
+        caller may modify the data it gets.
+        """
+
+        # reference data is small, records of the data endpoints are flat
+        if endpoint in REFERENCE_ENDPOINTS:
+            return copy.deepcopy
+
+        return _copy_records
+
+    def _get_deadline_at(self, deadline: float = None) -> Optional[float]:
+        """
+        :param deadline: Seconds the method call may take, defaults to the
+        client's deadline.
+        :return: time.monotonic() value at which the call's deadline passes,
+        None if it has no deadline.
+        """
+
+        if deadline is None:
+            deadline = self.deadline
+
+        if deadline is None:
+            return None
+
+        return time.monotonic() + deadline
+
+    def _get_attempt_timeout(
+        self,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline_at: float = None,
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """
+        :return: Connect and read timeout of the next attempt, shortened to
+        the time left until the deadline.
+        """
+
+        if timeout is None:
+            timeout = self.timeout
+
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+        else:
+            connect_timeout, read_timeout = timeout, timeout
+
+        if deadline_at is None:
+            return connect_timeout, read_timeout
+
+        remaining = self._check_deadline(deadline_at)
+
+        return (
+            remaining if connect_timeout is None else min(connect_timeout, remaining),
+            remaining if read_timeout is None else min(read_timeout, remaining),
+        )
+
+    def _check_deadline(self, deadline_at: float = None, delay: float = 0.0):
+        """
+        Raise DeadlineExceededError if the deadline passes within `delay`
+        seconds.
+
+        :return: Seconds left until the deadline, None if there is none.
+        """
+
+        if deadline_at is None:
+            return None
+
+        remaining = deadline_at - time.monotonic()
+
+        if remaining <= delay:
+            raise DeadlineExceededError("Deadline exceeded")
+
+        return remaining
+
+    def _price_data_request(
+        self,
+        symbol: str,
+        date: str = None,
+        from_date: str = None,
+        to_date: str = None,
+        columns: List[str] = None,
+    ) -> Tuple[str, dict]:
+        url = f"{self.base_url}/price/?symbol={symbol}"
+        params = self._fields_params(columns)
+
+        # add optional query params
+        if date:
+            params["date"] = date
+
+        if from_date:
+            params["from_date"] = from_date
+
+        if to_date:
+            params["to_date"] = to_date
+
+        return url, params
+
+    def _fundamentals_data_request(
+        self,
+        symbol: str,
+        frequency: str = "Quarterly",
+        name: str = None,
+        year: int = None,
+        columns: List[str] = None,
+    ) -> Tuple[str, dict]:
+        url = f"{self.base_url}/fundamentals/?symbol={symbol}&frequency={frequency}"
+        params = self._fields_params(columns)
+
+        # add optional query params
+        if name:
+            params["name"] = name
+
+        if year:
+            params["year"] = year
+
+        return url, params
+
+    def _indicator_data_request(
+        self,
+        name: str,
+        frequency: str = None,
+        from_date: str = None,
+        to_date: str = None,
+        columns: List[str] = None,
+    ) -> Tuple[str, dict]:
+        url = f"{self.base_url}/indicators/?name={name}"
+        params = self._fields_params(columns)
+
+        # add optional query params
+        if frequency:
+            params["frequency"] = frequency
+
+        if from_date:
+            params["from_date"] = from_date
+
+        if to_date:
+            params["to_date"] = to_date
+
+        return url, params
+
+    def _fields_params(self, columns: List[str] = None) -> dict:
+        # the server is only asked for the selected fields if enabled, they
+        # are selected while building the data anyway
+        if columns is not None and self.forward_fields:
+            return {"fields": ",".join(columns)}
+
+        return {}
+
+    def _get_columns(
+        self,
+        endpoint: str,
+        fields: Iterable[str] = None,
+    ) -> Optional[List[str]]:
+        """
+        :param endpoint: "price", "fundamentals" or "indicators".
+        :param fields: Fields selected by the caller, all if None.
+        :return: The endpoint's key fields followed by the selected fields,
+        None if all fields are returned.
+        """
+
+        if fields is None:
+            return None
+
+        if isinstance(fields, str):
+            raise ValueError("fields must be a list of field names")
+
+        return list(dict.fromkeys([*KEY_FIELDS[endpoint], *fields]))
+
+    def _indicators_request(self) -> Tuple[str, dict]:
+        return f"{self.base_url}/indicators/names/", {}
+
+    def _companies_request(self, index: str = None) -> Tuple[str, dict]:
+        url = f"{self.base_url}/companies/"
+        params = {}
+
+        # add optional query params
+        if index:
+            params["index"] = index
+
+        return url, params
+
+    def _is_typed(self, typed: bool = None) -> bool:
+        return self.typed if typed is None else typed
+
+    def _get_output(self, as_json=False, output: str = None, path: str = None) -> str:
+        if as_json:
+            return "json"
+
+        if output is None:
+            output = self.output
+
+        if output not in OUTPUTS:
+            raise ValueError(f"Unsupported output: {output}")
+
+        # checked before anything is requested
+        if output == "parquet" and path is None:
+            raise ValueError("Parquet output requires a path")
+
+        return output
+
+    def _get_sort_order(self, sort_order: str = None) -> str:
+        if sort_order is None:
+            return self.sort_order
+
+        if sort_order not in SORT_ORDERS:
+            raise ValueError(f"Unsupported sort order: {sort_order}")
+
+        return sort_order
+
+    def _convert_records(
+        self,
+        endpoint: str,
+        response_data: List[Dict],
+        output: str,
+        typed: bool = None,
+        path: str = None,
+        sort_order: str = "ascending",
+        columns: List[str] = None,
+    ):
+        """
+        :param endpoint: "price", "fundamentals" or "indicators".
+        :param response_data: Decoded records returned by the endpoint.
+        :param output: One of OUTPUTS, see _get_output.
+        :param sort_order: One of SORT_ORDERS, fundamentals data is never
+        sorted.
+        :param columns: Fields returned, see _get_columns. All if None.
+        :return: Records as returned by the data methods for the output.
+        """
+
+        if output == "json":
+            if columns is None:
+                return response_data
+
+            return [
+                {key: record.get(key) for key in columns} for record in response_data
+            ]
+
+        if output == "pandas":
+            if endpoint == "fundamentals":
+                return self._fundamentals_data_to_df(response_data, typed, columns)
+
+            to_df = {
+                "price": self._price_data_to_df,
+                "indicators": self._indicator_data_to_df,
+            }[endpoint]
+
+            return to_df(response_data, typed, sort_order, columns)
+
+        # polars and Arrow are built straight from the records, skipping pandas
+        schema = SCHEMAS[endpoint]
+        fields = schema.dtypes if self._is_typed(typed) else schema.fields
+        sort_by = "date"
+        descending = sort_order == "descending"
+
+        if endpoint == "fundamentals" or sort_order == "unsorted":
+            sort_by = None
+
+        if output == "polars":
+            return records_to_polars(
+                response_data,
+                fields,
+                sort_by,
+                descending,
+                columns,
+            )
+
+        table = records_to_table(response_data, fields, sort_by, descending, columns)
+
+        if output == "parquet":
+            import_pyarrow()
+            import pyarrow.parquet
+
+            pyarrow.parquet.write_table(table, path)
+
+            return path
+
+        return table
+
+    def _price_data_to_df(
+        self,
+        response_data: List[Dict],
+        typed: bool = None,
+        sort_order: str = "ascending",
+        columns: List[str] = None,
+    ) -> "pd.DataFrame":
+        df = records_to_frame(response_data, PRICE_DATA_FIELDS, columns)
+
+        if sort_order != "unsorted":
+            df = sort_frame(df, "date", sort_order == "descending")
+
+        if self._is_typed(typed):
+            df = apply_schema(df, SCHEMAS["price"])
+
+        return df
+
+    def _fundamentals_data_to_df(
+        self,
+        response_data: List[Dict],
+        typed: bool = None,
+        columns: List[str] = None,
+    ) -> "pd.DataFrame":
+        df = records_to_frame(response_data, FUNDAMENTALS_DATA_FIELDS, columns)
+
+        if self._is_typed(typed):
+            df = apply_schema(df, SCHEMAS["fundamentals"])
+
+        return df
+
+    def _indicator_data_to_df(
+        self,
+        response_data: List[Dict],
+        typed: bool = None,
+        sort_order: str = "ascending",
+        columns: List[str] = None,
+    ) -> "pd.DataFrame":
+        df = records_to_frame(response_data, INDICATOR_DATA_FIELDS, columns)
+
+        if sort_order != "unsorted":
+            df = sort_frame(df, "date", sort_order == "descending")
+
+        if self._is_typed(typed):
+            df = apply_schema(df, SCHEMAS["indicators"])
+
+        return df
+
+
+class EETCDataClient(BaseEETCDataClient):
+    def __init__(
+        self,
+        api_key: str,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        compress: bool = True,
+        transfer_log_size: int = 100,
+        max_workers: int = 8,
+        cache_dir: str = None,
+        response_cache_ttl: float = None,
+        response_cache_max_entries: int = 128,
+        cache_data_endpoints: bool = False,
+        revalidate: bool = False,
+        json_loads="auto",
+        typed: bool = False,
+        split_days: Dict[str, int] = None,
+        retry_policy: RetryPolicy = None,
+        rate_limit: float = None,
+        rate_limit_burst: int = None,
+        timeout: Union[float, Tuple[float, float]] = (5.0, 60.0),
+        deadline: float = None,
+        hooks: List[Callable[[Dict], None]] = None,
+        collect_stats: bool = False,
+        output: str = "pandas",
+        sort_order: str = "ascending",
+        forward_fields: bool = False,
+        coalesce: bool = True,
+    ):
+        """
+        :param api_key: EETC Data Hub API Key.
+        :param pool_connections: Number of per-host connection pools to keep.
+        :param pool_maxsize: Maximum number of connections kept open per host.
+        :param pool_block: If True, requests wait for a free connection when
+        the per-host pool is exhausted instead of opening a throwaway one.
+        :param keep_alive: If False, connections are closed after every
+        request instead of being reused.
+        :param compress: If True, compressed responses are requested with
+        every encoding the installed urllib3 can decode (gzip and deflate,
+        plus br and zstd if brotli or zstandard are installed) and decoded
+        transparently. If False, responses are requested uncompressed.
+        :param transfer_log_size: Number of recent requests kept in
+        transfer_log with their response body size on the wire and decoded.
+        :param max_workers: Default number of worker threads used by the bulk
+        methods, should not exceed pool_maxsize.
+        :param cache_dir: Directory for caching historical Price data on disk.
+        If set, get_price_data only requests rows newer than the cached ones.
+        :param response_cache_ttl: Seconds for which responses of
+        get_indicators and get_companies are cached in memory. Caching is
+        disabled if None.
+        :param response_cache_max_entries: Maximum number of cached responses.
+        :param cache_data_endpoints: If True, responses of get_price_data,
+        get_fundamentals_data and get_indicator_data are cached in memory
+        too.
+        :param revalidate: If True, responses of get_fundamentals_data,
+        get_indicators and get_companies are kept in memory with their ETag
+        and Last-Modified validators and requested again conditionally, so
+        unchanged data is neither downloaded nor decoded again.
+        :param json_loads: Function used for decoding response bodies. By
+        default ("auto") orjson or ujson is used if installed, None forces
+        the standard library json module.
+        :param typed: If True, DataFrames are returned with parsed tz-aware
+        dates as index, categorical labels and numeric dtypes as defined in
+        eetc_data_client.schemas, instead of the raw JSON types.
+        :param split_days: Maximum number of days requested at once per
+        endpoint, e.g. {"price": 1825, "indicators": 3650}. Longer
+        from_date/to_date ranges are split and the parts requested in
+        parallel. Only "price" and "indicators" support splitting.
+        :param retry_policy: How requests failing with connection errors or
+        retryable statuses (429, 5xx) are retried, see
+        eetc_data_client.retry.RetryPolicy. Defaults to 3 attempts with
+        exponential backoff.
+        :param rate_limit: Maximum number of requests per second sent by the
+        client across all threads, including retries. Unlimited if None.
+        :param rate_limit_burst: Number of requests which may be sent at once
+        before rate_limit applies, defaults to one second worth of requests.
+        :param timeout: Seconds to wait for a connection and between bytes of
+        the response, either one value for both or a (connect, read) tuple.
+        None waits forever.
+        :param deadline: Seconds a method call may take in total, retries and
+        split date ranges included. DeadlineExceededError is raised once it
+        passes. Unlimited if None.
+        :param hooks: Functions called after every get_price_data,
+        get_price_data_bulk (once per symbol), get_fundamentals_data,
+        get_fundamentals_panel (once per symbol), get_indicator_data,
+        get_indicator_data_bulk (once per name), get_indicators and
+        get_companies call with a dict of the endpoint, params, number of
+        requests, HTTP time, body bytes on the wire and decoded, JSON decode
+        time, DataFrame build time, row count, total time and the name of the
+        exception if the call failed.
+        Hooks run in the calling thread and must not raise.
+        :param collect_stats: If True, call records are collected and
+        aggregated into percentiles available from call_stats.
+        :param output: Default format returned by the data methods: "pandas"
+        DataFrames, "json" records, "polars" DataFrames (requires polars) or
+        "arrow" pyarrow Tables (requires pyarrow).
+        :param sort_order: Order in which the data methods return Price and
+        indicator data: by date "ascending" or "descending", or "unsorted" in
+        the order returned by the server. Data which is already in order is
+        not sorted again. JSON records are always returned unsorted.
+        :param forward_fields: If True, fields selected with the `fields`
+        parameter of the data methods are sent to EETC Data Hub, so only
+        those are transferred. Otherwise they are selected locally.
+        :param coalesce: If True, concurrent calls requesting the same
+        endpoint with the same params from several threads share one
+        request, each gets its own copy of the response, see coalescing_info.
+        """
+
+        super().__init__(
+            api_key,
+            json_loads,
+            typed,
+            retry_policy,
+            rate_limit,
+            rate_limit_burst,
+            timeout,
+            deadline,
+            output,
+            sort_order,
+            forward_fields,
+        )
+
+        self.max_workers = max_workers
+        self.split_days = split_days or {}
+        self.price_data_cache = PriceDataCache(cache_dir) if cache_dir else None
+        self.response_cache = None
+        self.cache_data_endpoints = cache_data_endpoints
+        self.validator_cache = None
+        self.transfer_log = deque(maxlen=transfer_log_size)
+        self.hooks = list(hooks or [])
+        self.stats_collector = None
+        self.single_flight = SingleFlight() if coalesce else None
+
+        self._transfer_stats = {"requests": 0, "wire_bytes": 0, "decoded_bytes": 0}
+        self._transfer_stats_lock = threading.Lock()
+
+        self._revalidation_stats = {"not_modified": 0, "modified": 0}
+        self._revalidation_stats_lock = threading.Lock()
+
+        if revalidate:
+            self.validator_cache = ResponseCache(None, response_cache_max_entries)
+
+        if collect_stats:
+            self.stats_collector = StatsCollector()
+            self.hooks.append(self.stats_collector)
+
+        if response_cache_ttl is not None:
+            self.response_cache = ResponseCache(
+                response_cache_ttl,
+                response_cache_max_entries,
+            )
+
+        self.session = self._create_session(
+            pool_connections,
+            pool_maxsize,
+            pool_block,
+            keep_alive,
+            compress,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Close all pooled connections held by the client.
+        """
+
+        self.session.close()
+
+    def _create_session(
+        self,
+        pool_connections: int,
+        pool_maxsize: int,
+        pool_block: bool,
+        keep_alive: bool,
+        compress: bool,
+    ) -> requests.Session:
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["EETC-API-Key"] = self.api_key
+
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING if compress else "identity"
+
+        return session
+
+    def _send_http_request(
+        self,
+        url: str,
+        params: dict,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline_at: float = None,
+        headers: dict = None,
+    ) -> Response:
+        if params is None:
+            params = {}
+
+        attempt = 1
+
+        while True:
+            if self.rate_limiter is not None:
+                # fail fast instead of waiting for a token past the deadline
+                acquired = self.rate_limiter.acquire(self._check_deadline(deadline_at))
+
+                if not acquired:
+                    raise DeadlineExceededError("Deadline exceeded")
+
+            try:
+                response = self.session.get(
+                    url,
+                    params=params,
+                    timeout=self._get_attempt_timeout(timeout, deadline_at),
+                    headers=headers,
+                    stream=True,
+                )
+                response.wire_bytes = self._read_content(response)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not self.retry_policy.should_retry(attempt):
+                    if attempt > 1:
+                        self._count_retry_stat("exhausted")
+
+                    if isinstance(e, requests.Timeout):
+                        raise RequestTimeoutError(f"Request to {url} timed out") from e
+
+                    raise
+
+                delay = self.retry_policy.get_backoff(attempt)
+            else:
+                if not self.retry_policy.should_retry(attempt, response.status_code):
+                    break
+
+                delay = self.retry_policy.get_backoff(
+                    attempt,
+                    response.headers.get("Retry-After"),
+                )
+                response.close()
+
+            # give up early instead of sleeping past the deadline
+            self._check_deadline(deadline_at, delay)
+
+            if attempt == 1:
+                self._count_retry_stat("retried_requests")
+
+            self._count_retry_stat("retries")
+            time.sleep(delay)
+            attempt += 1
+
+        # 304 answers a conditional request, see _request_revalidated_data
+        if response.status_code not in (200, 304):
+            if attempt > 1:
+                self._count_retry_stat("exhausted")
+
+            response.raise_for_status()
+
+        return response
+
+    def _read_content(self, response: Response) -> int:
+        """
+        Read and decode the body of a streamed response, the same as
+        requests does for responses which are not streamed.
+
+        The body is read undecoded first to count its size on the wire,
+        because raw.tell() of urllib3 1.x does not count chunked bodies.
+
+        :return: Number of body bytes received before decoding.
+        """
+
+        raw = response.raw
+
+        # mapped to the exceptions requests raises while reading a body,
+        # except that a stalled body times out like a stalled response
+        try:
+            content = b"".join(raw.stream(CONTENT_CHUNK_SIZE, decode_content=False))
+        except ReadTimeoutError as e:
+            raise requests.ReadTimeout(e, response=response) from e
+        except ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(e) from e
+
+        wire_bytes = len(content)
+        content_encoding = response.headers.get("Content-Encoding", "").lower()
+        encodings = [
+            encoding.strip()
+            for encoding in content_encoding.split(",")
+            if encoding.strip() in raw.CONTENT_DECODERS
+        ]
+
+        if content and encodings:
+            decoder = _get_decoder(content_encoding)
+
+            try:
+                content = decoder.decompress(content)
+                content += decoder.decompress(b"") + decoder.flush()
+            except raw.DECODER_ERROR_CLASSES as e:
+                raise requests.exceptions.ContentDecodingError(e) from e
+
+        response._content = content
+        response._content_consumed = True
+
+        return wire_bytes
+
+    @property
+    def response_cache_info(self) -> Dict[str, int]:
+        """
+        Hit and miss counters of the in-memory response cache.
+        """
+
+        if self.response_cache is None:
+            return {"hits": 0, "misses": 0, "entries": 0}
+
+        return {
+            "hits": self.response_cache.hits,
+            "misses": self.response_cache.misses,
+            "entries": len(self.response_cache),
+        }
+
+    @property
+    def coalescing_info(self) -> Dict[str, int]:
+        """
+        Number of requests sent on behalf of possibly concurrent calls
+        ("flights") and number of calls which shared the response of one of
+        them instead of sending their own request ("coalesced").
+        """
+
+        if self.single_flight is None:
+            return {"flights": 0, "coalesced": 0}
+
+        return self.single_flight.info
+
+    @property
+    def transfer_stats(self) -> Dict[str, int]:
+        """
+        Number of responses received and their total body size on the wire
+        and after decompression.
+        """
+
+        with self._transfer_stats_lock:
+            return dict(self._transfer_stats)
+
+    def _record_transfer(
+        self,
+        endpoint: str,
+        url: str,
+        params: dict,
+        response: Response,
+        http_time: float,
+        record: CallRecord = None,
+    ):
+        # counted by _read_content before decoding
+        wire_bytes = response.wire_bytes
+        decoded_bytes = len(response.content)
+
+        if record is not None:
+            record.add(
+                requests=1,
+                http_time=http_time,
+                wire_bytes=wire_bytes,
+                decoded_bytes=decoded_bytes,
+            )
+
+        with self._transfer_stats_lock:
+            self._transfer_stats["requests"] += 1
+            self._transfer_stats["wire_bytes"] += wire_bytes
+            self._transfer_stats["decoded_bytes"] += decoded_bytes
+            self.transfer_log.append(
+                {
+                    "endpoint": endpoint,
+                    "url": url,
+                    "params": params,
+                    "content_encoding": response.headers.get("Content-Encoding"),
+                    "wire_bytes": wire_bytes,
+                    "decoded_bytes": decoded_bytes,
+                    "http_time": http_time,
+                }
+            )
+
+    def add_hook(self, hook: Callable[[Dict], None]):
+        """
+        Register a function called with the record of every following call,
+        see the `hooks` parameter of EETCDataClient.
+        """
+
+        self.hooks.append(hook)
+
+    @property
+    def call_stats(self) -> Dict[str, Dict]:
+        """
+        Per endpoint number of calls and p50/p95/p99/mean of their timings,
+        sizes and row counts, see StatsCollector.summary. Empty unless the
+        client was created with collect_stats=True.
+        """
+
+        if self.stats_collector is None:
+            return {}
+
+        return self.stats_collector.summary()
+
+    @contextmanager
+    def _instrument(self, endpoint: str, **params) -> Iterator[Optional[CallRecord]]:
+        if not self.hooks:
+            yield None
+            return
+
+        record = CallRecord(endpoint, {k: v for k, v in params.items() if v})
+
+        try:
+            yield record
+        except Exception as e:
+            self._call_hooks(record.finish(e))
+            raise
+
+        self._call_hooks(record.finish())
+
+    def _call_hooks(self, values: Dict):
+        for hook in self.hooks:
+            hook(values)
+
+    def _build_frame(
+        self,
+        endpoint: str,
+        response_data: List[Dict],
+        output: str,
+        typed: bool = None,
+        path: str = None,
+        record: CallRecord = None,
+        sort_order: str = "ascending",
+        columns: List[str] = None,
+    ):
+        if record is not None:
+            record.set(rows=len(response_data))
+
+        start = time.perf_counter()
+        data = self._convert_records(
+            endpoint,
+            response_data,
+            output,
+            typed,
+            path,
+            sort_order,
+            columns,
+        )
+
+        if record is not None and output != "json":
+            record.add(frame_time=time.perf_counter() - start)
+
+        return data
+
+    @property
+    def revalidation_info(self) -> Dict[str, int]:
+        """
+        Number of conditional requests answered with "304 Not Modified" and
+        with new data, and the number of responses kept for revalidation.
+        """
+
+        with self._revalidation_stats_lock:
+            info = dict(self._revalidation_stats)
+
+        info["entries"] = len(self.validator_cache or ())
+
+        return info
+
+    def invalidate_response_cache(self, endpoint: str = None):
+        """
+        Remove responses from the in-memory response cache and the responses
+        kept for revalidation.
+
+        :param endpoint: Endpoint whose responses are removed, e.g. "price",
+        "indicators/names" or "companies". If None, the whole cache is cleared.
+        """
+
+        for cache in (self.response_cache, self.validator_cache):
+            if cache is None:
+                continue
+
+            if endpoint is None:
+                cache.invalidate()
+            else:
+                cache.invalidate(lambda key: key[0] == endpoint)
+
+    def _request_data(
+        self,
+        endpoint: str,
+        url: str,
+        params: dict,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline_at: float = None,
+        record: CallRecord = None,
+    ):
+        cacheable = self.response_cache is not None and (
+            endpoint in REFERENCE_ENDPOINTS or self.cache_data_endpoints
+        )
+        revalidated = (
+            self.validator_cache is not None and endpoint in REVALIDATED_ENDPOINTS
+        )
+        key = (endpoint, url, tuple(sorted(params.items())))
+        copier = self._get_copier(endpoint)
+
+        if cacheable:
+            found, response_data = self.response_cache.get(key)
+
+            if found:
+                if record is not None:
+                    record.add(cache_hits=1)
+
+                return copier(response_data)
+
+        def fetch():
+            if revalidated:
+                response_data = self._request_revalidated_data(
+                    endpoint,
+                    key,
+                    url,
+                    params,
+                    timeout,
+                    deadline_at,
+                    record,
+                )
+            else:
+                start = time.perf_counter()
+                response = self._send_http_request(url, params, timeout, deadline_at)
+                http_time = time.perf_counter() - start
+                self._record_transfer(
+                    endpoint,
+                    url,
+                    params,
+                    response,
+                    http_time,
+                    record,
+                )
+                response_data = self._decode_response(response, record)
+
+            if cacheable:
+                self.response_cache.set(key, response_data)
+
+            # data kept in a cache is copied, other data is only copied if
+            # it is shared with coalesced calls
+            if cacheable or revalidated:
+                return copier(response_data)
+
+            return response_data
+
+        if self.single_flight is None:
+            return fetch()
+
+        return self._request_coalesced(key, fetch, deadline_at, record, copier)
+
+    def _request_coalesced(
+        self,
+        key: tuple,
+        fetch: Callable[[], List[Dict]],
+        deadline_at: float = None,
+        record: CallRecord = None,
+        copier: Callable[[Any], Any] = None,
+    ):
+        """
+        Call fetch, or wait for the response of a concurrent call of fetch
+        with the same key until the deadline passes. If the concurrent call
+        times out under its own timeout or deadline, the request is sent
+        again within this call's deadline. Callers of a shared call get
+        their own copy of the response made by copier.
+        """
+
+        while True:
+            fetched = []
+
+            def fetch_once():
+                fetched.append(True)
+                return fetch()
+
+            try:
+                response_data = self.single_flight.do(
+                    key,
+                    fetch_once,
+                    self._check_deadline(deadline_at),
+                    copier,
+                )
+            except RequestTimeoutError:
+                if fetched:
+                    raise
 
-        response = requests.get(
+                self._check_deadline(deadline_at)
+                continue
+            # an alias of the built-in TimeoutError since Python 3.11
+            except concurrent.futures.TimeoutError:
+                raise DeadlineExceededError("Deadline exceeded")
+
+            if not fetched and record is not None:
+                record.add(coalesced=1)
+
+            return response_data
+
+    def _request_revalidated_data(
+        self,
+        endpoint: str,
+        key: tuple,
+        url: str,
+        params: dict,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline_at: float = None,
+        record: CallRecord = None,
+    ):
+        found, entry = self.validator_cache.get(key)
+        headers = None
+
+        if found:
+            headers, response_data = entry
+
+        start = time.perf_counter()
+        response = self._send_http_request(
             url,
-            params=params,
-            headers={"EETC-API-Key": self.api_key},
+            params,
+            timeout,
+            deadline_at,
+            headers,
         )
+        http_time = time.perf_counter() - start
+        self._record_transfer(endpoint, url, params, response, http_time, record)
 
-        if response.status_code != 200:
-            response.raise_for_status()
+        # the kept data is still current, nothing was downloaded or decoded
+        if found and response.status_code == 304:
+            self._count_revalidation_stat("not_modified")
+            return response_data
 
-        return response
+        if found:
+            self._count_revalidation_stat("modified")
+
+        response_data = self._decode_response(response, record)
+        headers = {
+            request_header: response.headers[response_header]
+            for response_header, request_header in VALIDATOR_HEADERS.items()
+            if response.headers.get(response_header)
+        }
+
+        if headers:
+            self.validator_cache.set(key, (headers, response_data))
+
+        return response_data
+
+    def _count_revalidation_stat(self, name: str):
+        with self._revalidation_stats_lock:
+            self._revalidation_stats[name] += 1
+
+    def _decode_response(self, response: Response, record: CallRecord = None):
+        start = time.perf_counter()
+
+        if self.json_loads is None:
+            response_data = response.json()
+        else:
+            response_data = self.json_loads(response.content)
+
+        if record is not None:
+            record.add(decode_time=time.perf_counter() - start)
+
+        return response_data
 
     def get_price_data(
         self,
@@ -33,7 +1165,15 @@ class EETCDataClient:
         from_date: str = None,
         to_date: str = None,
         as_json=False,
-    ) -> Union[pd.DataFrame, List[Dict]]:
+        typed: bool = None,
+        split_days: int = None,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline: float = None,
+        output: str = None,
+        path: str = None,
+        sort_order: str = None,
+        fields: Iterable[str] = None,
+    ) -> OutputData:
         """
         Get historical Price data from EETC Data Hub via REST API.
 
@@ -43,36 +1183,509 @@ class EETCDataClient:
         :param to_date: Latest date in string format "yyyy-mm-dd"
         :param as_json: Indicates if caller wants data returned as JSON. False
         by default, if False, it will return the data as a pandas DataFrame.
+        :param typed: Indicates if caller wants a typed DataFrame, see
+        eetc_data_client.schemas. Defaults to the client's `typed` setting.
+        :param split_days: Maximum number of days requested at once, longer
+        ranges are split and requested in parallel. Defaults to the client's
+        `split_days` setting for "price", 0 disables splitting.
+        :param timeout: Connect and read timeout in seconds, defaults to the
+        client's `timeout` setting.
+        :param deadline: Seconds the call may take in total, defaults to the
+        client's `deadline` setting.
+        :param output: "pandas", "json", "polars" (polars DataFrame), "arrow"
+        (pyarrow Table) or "parquet" (pyarrow Table written to `path`, which
+        is returned). Defaults to the client's `output` setting, as_json=True
+        is the same as "json".
+        :param path: File the "parquet" output is written to.
+        :param sort_order: "ascending", "descending" or "unsorted", defaults
+        to the client's `sort_order` setting.
+        :param fields: Fields to return besides "date", e.g. ["close"], all if
+        None.
         :return: Historical Price data as a pandas DataFrame.
         """
 
-        url = f"{self.base_url}/price/?symbol={symbol}"
-        params = {}
+        return self._get_price_data(
+            symbol,
+            date,
+            from_date,
+            to_date,
+            self._get_output(as_json, output, path),
+            typed,
+            split_days,
+            timeout,
+            self._get_deadline_at(deadline),
+            path,
+            self._get_sort_order(sort_order),
+            self._get_columns("price", fields),
+        )
 
-        # add optional query params
-        if date:
-            params["date"] = date
+    def _get_price_data(
+        self,
+        symbol: str,
+        date: str = None,
+        from_date: str = None,
+        to_date: str = None,
+        output: str = "pandas",
+        typed: bool = None,
+        split_days: int = None,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline_at: float = None,
+        path: str = None,
+        sort_order: str = "ascending",
+        columns: List[str] = None,
+    ) -> OutputData:
+        split_days = self._get_split_days("price", split_days)
+
+        with self._instrument(
+            "price",
+            symbol=symbol,
+            date=date,
+            from_date=from_date,
+            to_date=to_date,
+        ) as record:
+            # serve date ranges from the on-disk cache, topping it up if needed
+            if self.price_data_cache is not None and not date:
+                df = self._get_cached_price_data(
+                    symbol,
+                    from_date,
+                    to_date,
+                    split_days,
+                    timeout,
+                    deadline_at,
+                    record,
+                )
+
+                if output == "pandas":
+                    if record is not None:
+                        record.set(rows=len(df))
+
+                    # cached data is sorted in ascending order and complete
+                    if sort_order == "descending":
+                        df = sort_frame(df, "date", descending=True)
+
+                    if columns is not None:
+                        df = df.reindex(columns=columns)
+
+                    if self._is_typed(typed):
+                        df = apply_schema(df, SCHEMAS["price"])
+
+                    return df
+
+                response_data = df.to_dict("records")
+            elif date:
+                url, params = self._price_data_request(
+                    symbol,
+                    date,
+                    from_date,
+                    to_date,
+                    columns,
+                )
+
+                # send the HTTP request to EETC Data Hub
+                response_data = self._request_data(
+                    "price",
+                    url,
+                    params,
+                    timeout,
+                    deadline_at,
+                    record,
+                )
+            else:
+                response_data = self._request_price_records(
+                    symbol,
+                    from_date,
+                    to_date,
+                    split_days,
+                    timeout,
+                    deadline_at,
+                    record,
+                    columns,
+                )
+
+            # process and return response data
+            return self._build_frame(
+                "price",
+                response_data,
+                output,
+                typed,
+                path,
+                record,
+                sort_order,
+                columns,
+            )
+
+    def _get_split_days(self, endpoint: str, split_days: int = None) -> int:
+        if split_days is None:
+            return self.split_days.get(endpoint, 0)
+
+        return split_days
+
+    def _request_split_records(
+        self,
+        fetch: Callable[[Tuple[str, str]], List[Dict]],
+        from_date: str,
+        to_date: str,
+        split_days: int,
+    ) -> List[Dict]:
+        windows = split_date_range(from_date, to_date, split_days)
+
+        with ThreadPoolExecutor(min(self.max_workers, len(windows) or 1)) as executor:
+            chunks = list(executor.map(fetch, windows))
+
+        # windows may share boundary rows, the later window's row is kept
+        records = {}
+
+        for chunk in chunks:
+            for record in chunk:
+                records[record["date"]] = record
+
+        return list(records.values())
+
+    def _get_cached_price_data(
+        self,
+        symbol: str,
+        from_date: str = None,
+        to_date: str = None,
+        split_days: int = 0,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline_at: float = None,
+        record: CallRecord = None,
+    ) -> "pd.DataFrame":
+        import pandas as pd
+
+        # concurrent calls for the same symbol would request the same rows
+        # and overwrite each other's cache files
+        with self.price_data_cache.lock(symbol):
+            df = self._update_cached_price_data(
+                symbol,
+                from_date,
+                to_date,
+                split_days,
+                timeout,
+                deadline_at,
+                record,
+            )
+
+        if df is None:
+            return pd.DataFrame()
+
+        # only return the requested date range
+        dates = df["date"].str[:10]
+        mask = pd.Series(True, index=df.index)
 
         if from_date:
-            params["from_date"] = from_date
+            mask &= dates >= from_date
 
         if to_date:
-            params["to_date"] = to_date
+            mask &= dates <= to_date
 
-        # send the HTTP request to EETC Data Hub
-        response = self._send_http_request(url, params)
+        return df[mask].reset_index(drop=True)
+
+    def _update_cached_price_data(
+        self,
+        symbol: str,
+        from_date: str = None,
+        to_date: str = None,
+        split_days: int = 0,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline_at: float = None,
+        record: CallRecord = None,
+    ) -> Optional["pd.DataFrame"]:
+        """
+        Load the cached Price data of a symbol, request the rows missing for
+        the date range and save the combined data back to the cache.
 
-        # process and return response data
-        response_data = response.json()
+        :return: All cached Price data of the symbol, None if there is none.
+        """
 
-        if as_json:
-            return response_data
+        import pandas as pd
+
+        cached = self.price_data_cache.load(symbol)
+        new_records = []
+
+        if cached is None:
+            cached_df = None
+            cache_from_date = from_date
+            new_records.append(
+                self._request_price_records(
+                    symbol,
+                    from_date,
+                    to_date,
+                    split_days,
+                    timeout,
+                    deadline_at,
+                    record,
+                )
+            )
+        else:
+            cached_df, cache_from_date = cached
+
+            # fill the gap before the earliest cached date
+            if cache_from_date is not None and (
+                from_date is None or from_date < cache_from_date
+            ):
+                new_records.append(
+                    self._request_price_records(
+                        symbol,
+                        from_date,
+                        cache_from_date,
+                        split_days,
+                        timeout,
+                        deadline_at,
+                        record,
+                    )
+                )
+                cache_from_date = from_date
+
+            # the latest cached date is requested again because its bar might
+            # not have been closed when it was cached
+            last_cached_date = cached_df["date"].max()[:10]
 
-        df = pd.json_normalize(response_data)
-        df = df.sort_values(by=["date"])
+            if to_date is None or to_date >= last_cached_date:
+                new_records.append(
+                    self._request_price_records(
+                        symbol,
+                        last_cached_date,
+                        to_date,
+                        split_days,
+                        timeout,
+                        deadline_at,
+                        record,
+                    )
+                )
+
+        frames = [cached_df] if cached_df is not None else []
+        frames += [
+            records_to_frame(records, PRICE_DATA_FIELDS)
+            for records in new_records
+            if records
+        ]
+
+        if not frames:
+            return None
+
+        df = cached_df
+
+        if len(frames) > 1 or cached_df is None:
+            df = pd.concat(frames, ignore_index=True)
+            df = df.drop_duplicates(subset=["date"], keep="last")
+            df = df.sort_values(by=["date"], ignore_index=True)
+            self.price_data_cache.save(symbol, df, cache_from_date)
 
         return df
 
+    def _request_price_records(
+        self,
+        symbol: str,
+        from_date: str = None,
+        to_date: str = None,
+        split_days: int = 0,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline_at: float = None,
+        record: CallRecord = None,
+        columns: List[str] = None,
+    ) -> List[Dict]:
+        if split_days and from_date:
+            return self._request_split_records(
+                lambda window: self._request_price_records(
+                    symbol,
+                    *window,
+                    timeout=timeout,
+                    deadline_at=deadline_at,
+                    record=record,
+                    columns=columns,
+                ),
+                from_date,
+                to_date,
+                split_days,
+            )
+
+        url, params = self._price_data_request(
+            symbol,
+            None,
+            from_date,
+            to_date,
+            columns,
+        )
+
+        # send the HTTP request to EETC Data Hub
+        return self._request_data("price", url, params, timeout, deadline_at, record)
+
+    def iter_price_data(
+        self,
+        symbol: str,
+        from_date: str,
+        to_date: str = None,
+        chunk_days: int = 365,
+        prefetch: bool = True,
+        as_json=False,
+        typed: bool = None,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline: float = None,
+        output: str = None,
+    ) -> Iterator[OutputData]:
+        """
+        Iterate over historical Price data from EETC Data Hub via REST API in
+        chunks, so only one chunk at a time has to be held in memory.
+
+        :param symbol: Symbol of the instrument.
+        :param from_date: Earliest date in string format "yyyy-mm-dd"
+        :param to_date: Latest date in string format "yyyy-mm-dd", today if
+        None.
+        :param chunk_days: Number of days covered by each chunk.
+        :param prefetch: If True, the next chunk is requested in the background
+        while the current one is being processed.
+        :param as_json: Indicates if caller wants data returned as JSON. False
+        by default, if False, it will return the data as a pandas DataFrame.
+        :param typed: Indicates if caller wants a typed DataFrame, see
+        eetc_data_client.schemas. Defaults to the client's `typed` setting.
+        :param timeout: Connect and read timeout in seconds, defaults to the
+        client's `timeout` setting.
+        :param deadline: Seconds each chunk may take to download, defaults to
+        the client's `deadline` setting.
+        :param output: "pandas", "json", "polars" or "arrow", defaults to the
+        client's `output` setting.
+        :return: Iterator over chunks of Historical Price data sorted by date,
+        chunks without data are skipped.
+        """
+
+        output = self._get_output(as_json, output)
+        windows = split_date_range(from_date, to_date, chunk_days)
+
+        # the deadline applies per chunk, time spent by the caller processing
+        # chunks does not count against it
+        for response_data in self._iter_windows(
+            lambda window: self._request_price_records(
+                symbol,
+                *window,
+                timeout=timeout,
+                deadline_at=self._get_deadline_at(deadline),
+            ),
+            windows,
+            prefetch,
+        ):
+            if not response_data:
+                continue
+
+            yield self._convert_records("price", response_data, output, typed)
+
+    def _iter_windows(
+        self,
+        fetch: Callable[[Tuple[str, str]], List[Dict]],
+        windows: List[Tuple[str, str]],
+        prefetch: bool,
+    ) -> Iterator[List[Dict]]:
+        if not prefetch:
+            for window in windows:
+                yield fetch(window)
+
+            return
+
+        # request at most one window ahead so memory use stays bounded
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(fetch, windows[0]) if windows else None
+
+            for next_window in windows[1:]:
+                response_data = future.result()
+                future = executor.submit(fetch, next_window)
+                yield response_data
+
+            if future is not None:
+                yield future.result()
+
+    def get_price_data_bulk(
+        self,
+        symbols: Iterable[str],
+        date: str = None,
+        from_date: str = None,
+        to_date: str = None,
+        as_dict=False,
+        max_workers: int = None,
+        typed: bool = None,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline: float = None,
+    ) -> Tuple[Union["pd.DataFrame", Dict[str, "pd.DataFrame"]], Dict[str, Exception]]:
+        """
+        Get historical Price data for multiple instruments from EETC Data Hub
+        via REST API, sending the requests in parallel. A failed request does
+        not abort the batch, it is reported in the returned failures instead.
+
+        :param symbols: Symbols of the instruments.
+        :param date: Specific date in string format "yyyy-mm-dd"
+        :param from_date: Earliest date in string format "yyyy-mm-dd"
+        :param to_date: Latest date in string format "yyyy-mm-dd"
+        :param as_dict: Indicates if caller wants a pandas DataFrame per
+        symbol. False by default, if False, it will return a single long
+        format pandas DataFrame with a "symbol" column.
+        :param max_workers: Number of parallel requests, defaults to the
+        client's max_workers.
+        :param typed: Indicates if caller wants typed DataFrames, see
+        eetc_data_client.schemas. Defaults to the client's `typed` setting.
+        :param timeout: Connect and read timeout in seconds, defaults to the
+        client's `timeout` setting.
+        :param deadline: Seconds the whole batch may take, defaults to the
+        client's `deadline` setting. Symbols not fetched in time are reported
+        as failed with DeadlineExceededError.
+        :return: Tuple of the Historical Price data and a dict of exceptions
+        raised for the symbols which failed.
+        """
+
+        symbols = list(dict.fromkeys(symbols))
+        deadline_at = self._get_deadline_at(deadline)
+        data = {}
+        failures = {}
+
+        with ThreadPoolExecutor(max_workers or self.max_workers) as executor:
+            futures = {
+                symbol: executor.submit(
+                    self._get_price_data,
+                    symbol,
+                    date,
+                    from_date,
+                    to_date,
+                    output="pandas",
+                    typed=False,
+                    timeout=timeout,
+                    deadline_at=deadline_at,
+                )
+                for symbol in symbols
+            }
+
+            # collect results in the order the symbols were given
+            for symbol, future in futures.items():
+                try:
+                    data[symbol] = future.result()
+                except Exception as e:
+                    failures[symbol] = e
+
+        typed = self._is_typed(typed)
+
+        if as_dict:
+            if typed:
+                data = {
+                    symbol: apply_schema(df, SCHEMAS["price"])
+                    for symbol, df in data.items()
+                }
+
+            return data, failures
+
+        if not data:
+            return self._price_data_to_df([], typed), failures
+
+        for symbol, df in data.items():
+            if "symbol" not in df.columns:
+                df["symbol"] = symbol
+
+        import pandas as pd
+
+        # the long format frame is typed once so categories are shared
+        df = pd.concat(data.values(), ignore_index=True)
+
+        if typed:
+            df = apply_schema(df, SCHEMAS["price"])
+
+        return df, failures
+
     def get_fundamentals_data(
         self,
         symbol: str,
@@ -80,7 +1693,13 @@ class EETCDataClient:
         name: str = None,
         year: int = None,
         as_json=False,
-    ) -> Union[pd.DataFrame, List[Dict]]:
+        typed: bool = None,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline: float = None,
+        output: str = None,
+        path: str = None,
+        fields: Iterable[str] = None,
+    ) -> OutputData:
         """
         Get historical Fundamentals data from EETC Data Hub via REST API.
 
@@ -90,29 +1709,189 @@ class EETCDataClient:
         :param year: Specific year for which the caller wants data.
         :param as_json: Indicates if caller wants data returned as JSON. False
         by default, if False, it will return the data as a pandas DataFrame.
+        :param typed: Indicates if caller wants a typed DataFrame, see
+        eetc_data_client.schemas. Defaults to the client's `typed` setting.
+        :param timeout: Connect and read timeout in seconds, defaults to the
+        client's `timeout` setting.
+        :param deadline: Seconds the call may take in total, defaults to the
+        client's `deadline` setting.
+        :param output: "pandas", "json", "polars" (polars DataFrame), "arrow"
+        (pyarrow Table) or "parquet" (pyarrow Table written to `path`, which
+        is returned). Defaults to the client's `output` setting, as_json=True
+        is the same as "json".
+        :param path: File the "parquet" output is written to.
+        :param fields: Fields to return besides "symbol", "year" and
+        "quarter", e.g. ["revenue", "ebit"], all if None.
         :return: Historical Fundamentals data as a pandas DataFrame.
         """
 
-        url = f"{self.base_url}/fundamentals/?symbol={symbol}&frequency={frequency}"
-        params = {}
+        output = self._get_output(as_json, output, path)
+        columns = self._get_columns("fundamentals", fields)
 
-        # add optional query params
-        if name:
-            params["name"] = name
+        url, params = self._fundamentals_data_request(
+            symbol,
+            frequency,
+            name,
+            year,
+            columns,
+        )
 
-        if year:
-            params["year"] = year
+        with self._instrument(
+            "fundamentals",
+            symbol=symbol,
+            frequency=frequency,
+            name=name,
+            year=year,
+        ) as record:
+            # send the HTTP request to EETC Data Hub
+            response_data = self._request_data(
+                "fundamentals",
+                url,
+                params,
+                timeout,
+                self._get_deadline_at(deadline),
+                record,
+            )
 
-        # send the HTTP request to EETC Data Hub
-        response = self._send_http_request(url, params)
+            # process and return response data
+            return self._build_frame(
+                "fundamentals",
+                response_data,
+                output,
+                typed,
+                path,
+                record,
+                columns=columns,
+            )
 
-        # process and return response data
-        response_data = response.json()
+    def get_fundamentals_panel(
+        self,
+        symbols: Iterable[str],
+        from_year: int = None,
+        to_year: int = None,
+        frequency: str = "Quarterly",
+        as_array=False,
+        max_workers: int = None,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline: float = None,
+        fields: Iterable[str] = None,
+    ) -> Tuple[Union["pd.DataFrame", FundamentalsPanel], Dict[str, Exception]]:
+        """
+        Get the numeric Fundamentals data of multiple instruments over a range
+        of years from EETC Data Hub via REST API, sending the requests in
+        parallel. Each symbol is requested once, for all years unless
+        from_year equals to_year, and filtered to the range locally. A failed
+        request does not abort the batch, it is reported in the returned
+        failures instead.
 
-        if as_json:
-            return response_data
+        :param symbols: Symbols of the instruments.
+        :param from_year: Earliest year, all years if None.
+        :param to_year: Latest year, all years if None.
+        :param frequency: Can be "Yearly" or "Quarterly".
+        :param as_array: Indicates if caller wants a FundamentalsPanel, a 3-D
+        array of shape (symbols, periods, fields). False by default, if
+        False, it will return a pandas DataFrame indexed by (symbol, year,
+        quarter).
+        :param max_workers: Number of parallel requests, defaults to the
+        client's max_workers.
+        :param timeout: Connect and read timeout in seconds, defaults to the
+        client's `timeout` setting.
+        :param deadline: Seconds the whole batch may take, defaults to the
+        client's `deadline` setting. Symbols not fetched in time are reported
+        as failed with DeadlineExceededError.
+        :param fields: Numeric fields to return, e.g. ["revenue", "ebit"],
+        all of eetc_data_client.schemas.FUNDAMENTALS_VALUE_FIELDS if None.
+        :return: Tuple of the Fundamentals data with a float64 column per
+        field, and a dict of exceptions raised for the symbols which failed.
+        """
+
+        if isinstance(fields, str):
+            raise ValueError("fields must be a list of field names")
+
+        fields = FUNDAMENTALS_VALUE_FIELDS if fields is None else tuple(fields)
+        symbols = list(dict.fromkeys(symbols))
+        deadline_at = self._get_deadline_at(deadline)
+        rows = {}
+        failures = {}
+
+        with ThreadPoolExecutor(max_workers or self.max_workers) as executor:
+            futures = {
+                symbol: executor.submit(
+                    self._get_fundamentals_rows,
+                    symbol,
+                    from_year,
+                    to_year,
+                    frequency,
+                    timeout,
+                    deadline_at,
+                    fields,
+                )
+                for symbol in symbols
+            }
+
+            # collect results in the order the symbols were given
+            for symbol, future in futures.items():
+                try:
+                    rows[symbol] = future.result()
+                except Exception as e:
+                    failures[symbol] = e
+
+        if as_array:
+            return FundamentalsPanel.from_rows(rows, fields), failures
+
+        return fundamentals_rows_to_frame(rows, fields), failures
+
+    def _get_fundamentals_rows(
+        self,
+        symbol: str,
+        from_year: int = None,
+        to_year: int = None,
+        frequency: str = "Quarterly",
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline_at: float = None,
+        fields: Tuple[str, ...] = FUNDAMENTALS_VALUE_FIELDS,
+    ) -> FundamentalsRows:
+        year = from_year if from_year is not None and from_year == to_year else None
+        url, params = self._fundamentals_data_request(
+            symbol,
+            frequency,
+            None,
+            year,
+            self._get_columns("fundamentals", fields),
+        )
+
+        # the records are reduced to arrays in the worker thread, so they do
+        # not have to be held in memory until all symbols are fetched
+        with self._instrument(
+            "fundamentals",
+            symbol=symbol,
+            frequency=frequency,
+            year=year,
+        ) as record:
+            response_data = self._request_data(
+                "fundamentals",
+                url,
+                params,
+                timeout,
+                deadline_at,
+                record,
+            )
+
+            if record is not None:
+                record.set(rows=len(response_data))
+
+            start = time.perf_counter()
+            rows = records_to_fundamentals_rows(
+                response_data,
+                from_year,
+                to_year,
+                fields,
+            )
+
+            if record is not None:
+                record.add(frame_time=time.perf_counter() - start)
 
-        return pd.json_normalize(response_data)
+            return rows
 
     def get_indicator_data(
         self,
@@ -121,7 +1900,15 @@ class EETCDataClient:
         from_date: str = None,
         to_date: str = None,
         as_json=False,
-    ) -> Union[pd.DataFrame, List[Dict]]:
+        typed: bool = None,
+        split_days: int = None,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline: float = None,
+        output: str = None,
+        path: str = None,
+        sort_order: str = None,
+        fields: Iterable[str] = None,
+    ) -> OutputData:
         """
         Get historical Macroeconomic data from EETC Data Hub via REST API.
 
@@ -131,73 +1918,319 @@ class EETCDataClient:
         :param to_date: Latest date in string format "yyyy-mm-dd"
         :param as_json: Indicates if caller wants data returned as JSON. False
         by default, if False, it will return the data as a pandas DataFrame.
+        :param typed: Indicates if caller wants a typed DataFrame, see
+        eetc_data_client.schemas. Defaults to the client's `typed` setting.
+        :param split_days: Maximum number of days requested at once, longer
+        ranges are split and requested in parallel. Defaults to the client's
+        `split_days` setting for "indicators", 0 disables splitting.
+        :param timeout: Connect and read timeout in seconds, defaults to the
+        client's `timeout` setting.
+        :param deadline: Seconds the call may take in total, defaults to the
+        client's `deadline` setting.
+        :param output: "pandas", "json", "polars" (polars DataFrame), "arrow"
+        (pyarrow Table) or "parquet" (pyarrow Table written to `path`, which
+        is returned). Defaults to the client's `output` setting, as_json=True
+        is the same as "json".
+        :param path: File the "parquet" output is written to.
+        :param sort_order: "ascending", "descending" or "unsorted", defaults
+        to the client's `sort_order` setting.
+        :param fields: Fields to return besides "date", e.g. ["value"], all if
+        None.
         :return: Historical Macroeconomic data as a pandas DataFrame.
         """
 
-        url = f"{self.base_url}/indicators/?name={name}"
-        params = {}
+        output = self._get_output(as_json, output, path)
+        sort_order = self._get_sort_order(sort_order)
+        columns = self._get_columns("indicators", fields)
 
-        # add optional query params
-        if frequency:
-            params["frequency"] = frequency
+        with self._instrument(
+            "indicators",
+            name=name,
+            frequency=frequency,
+            from_date=from_date,
+            to_date=to_date,
+        ) as record:
+            response_data = self._request_indicator_records(
+                name,
+                frequency,
+                from_date,
+                to_date,
+                self._get_split_days("indicators", split_days),
+                timeout,
+                self._get_deadline_at(deadline),
+                record,
+                columns,
+            )
 
-        if from_date:
-            params["from_date"] = from_date
+            # process and return response data
+            return self._build_frame(
+                "indicators",
+                response_data,
+                output,
+                typed,
+                path,
+                record,
+                sort_order,
+                columns,
+            )
 
-        if to_date:
-            params["to_date"] = to_date
+    def _request_indicator_records(
+        self,
+        name: str,
+        frequency: str = None,
+        from_date: str = None,
+        to_date: str = None,
+        split_days: int = 0,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline_at: float = None,
+        record: CallRecord = None,
+        columns: List[str] = None,
+    ) -> List[Dict]:
+        if split_days and from_date:
+            return self._request_split_records(
+                lambda window: self._request_indicator_records(
+                    name,
+                    frequency,
+                    *window,
+                    timeout=timeout,
+                    deadline_at=deadline_at,
+                    record=record,
+                    columns=columns,
+                ),
+                from_date,
+                to_date,
+                split_days,
+            )
+
+        url, params = self._indicator_data_request(
+            name,
+            frequency,
+            from_date,
+            to_date,
+            columns,
+        )
 
         # send the HTTP request to EETC Data Hub
-        response = self._send_http_request(url, params)
+        return self._request_data(
+            "indicators",
+            url,
+            params,
+            timeout,
+            deadline_at,
+            record,
+        )
 
-        # process and return response data
-        response_data = response.json()
+    def get_indicator_data_bulk(
+        self,
+        names: Iterable[str],
+        from_date: str = None,
+        to_date: str = None,
+        align: str = None,
+        max_workers: int = None,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline: float = None,
+    ) -> Tuple["pd.DataFrame", Dict[str, Exception]]:
+        """
+        Get historical Macroeconomic data for multiple indicators from EETC
+        Data Hub via REST API as one wide DataFrame, sending the requests in
+        parallel. A failed request does not abort the batch, it is reported
+        in the returned failures instead.
 
-        if as_json:
-            return response_data
+        :param names: Names of the macroeconomic data points.
+        :param from_date: Earliest date in string format "yyyy-mm-dd"
+        :param to_date: Latest date in string format "yyyy-mm-dd"
+        :param align: How the indicators are aligned: None keeps every date
+        of any indicator with NaN where an indicator has no value, "ffill"
+        forward fills those gaps. A frequency ("Daily", "Weekly", "Monthly",
+        "Quarterly" or "Yearly") resamples all indicators to it, keeping the
+        last value per period and forward filling periods without one.
+        "auto" resamples to the lowest frequency of the indicators according
+        to get_indicators, or forward fills if it fails or knows none of them.
+        :param max_workers: Number of parallel requests, defaults to the
+        client's max_workers.
+        :param timeout: Connect and read timeout in seconds, defaults to the
+        client's `timeout` setting.
+        :param deadline: Seconds the whole batch may take, defaults to the
+        client's `deadline` setting. Indicators not fetched in time are
+        reported as failed with DeadlineExceededError.
+        :return: Tuple of a DataFrame with a column per indicator, in the
+        order the names were given, indexed by tz-aware date, and a dict of
+        exceptions raised for the indicators which failed.
+        """
 
-        df = pd.json_normalize(response_data)
-        df = df.sort_values(by=["date"])
+        if align not in (None, "ffill", "auto", *INDICATOR_FREQUENCIES):
+            raise ValueError(f"Unsupported align: {align}")
 
-        return df
+        names = list(dict.fromkeys(names))
+        deadline_at = self._get_deadline_at(deadline)
+        series = {}
+        failures = {}
+
+        with ThreadPoolExecutor(max_workers or self.max_workers) as executor:
+            if align == "auto":
+                indicators_future = executor.submit(
+                    self.get_indicators,
+                    timeout,
+                    deadline,
+                )
+
+            futures = {
+                name: executor.submit(
+                    self._get_indicator_series,
+                    name,
+                    from_date,
+                    to_date,
+                    timeout,
+                    deadline_at,
+                )
+                for name in names
+            }
+
+            # collect results in the order the names were given
+            for name, future in futures.items():
+                try:
+                    series[name] = future.result()
+                except Exception as e:
+                    failures[name] = e
+
+            if align == "auto":
+                # the indicators are still aligned if their frequencies
+                # cannot be looked up, the same as if they were unknown
+                try:
+                    indicators = indicators_future.result()
+                except Exception:
+                    indicators = {}
 
-    def get_indicators(self) -> Dict[str, List[str]]:
+                align = self._get_lowest_frequency(indicators, names)
+
+        df = series_to_wide_frame(series)
+
+        if align == "ffill":
+            df = df.ffill()
+        elif align is not None:
+            df = resample_frame(df, INDICATOR_FREQUENCIES[align])
+
+        return df, failures
+
+    def _get_indicator_series(
+        self,
+        name: str,
+        from_date: str = None,
+        to_date: str = None,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline_at: float = None,
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        # the records are reduced to arrays in the worker thread, so they do
+        # not have to be held in memory until all indicators are fetched
+        with self._instrument(
+            "indicators",
+            name=name,
+            from_date=from_date,
+            to_date=to_date,
+        ) as record:
+            response_data = self._request_indicator_records(
+                name,
+                None,
+                from_date,
+                to_date,
+                self._get_split_days("indicators"),
+                timeout,
+                deadline_at,
+                record,
+            )
+
+            if record is not None:
+                record.set(rows=len(response_data))
+
+            start = time.perf_counter()
+            dates_and_values = records_to_series(response_data)
+
+            if record is not None:
+                record.add(frame_time=time.perf_counter() - start)
+
+            return dates_and_values
+
+    def _get_lowest_frequency(
+        self,
+        indicators: Dict[str, List[str]],
+        names: List[str],
+    ) -> str:
+        """
+        :param indicators: Indicator names grouped by frequency, as returned
+        by get_indicators.
+        :param names: Names of the indicators.
+        :return: Lowest frequency of the indicators, "ffill" if none of them
+        has a known frequency.
+        """
+
+        lowest = "ffill"
+        names = set(names)
+
+        for frequency in INDICATOR_FREQUENCIES:
+            if names.intersection(indicators.get(frequency, ())):
+                lowest = frequency
+
+        return lowest
+
+    def get_indicators(
+        self,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline: float = None,
+    ) -> Dict[str, List[str]]:
         """
         Get supported indicators grouped by frequency from EETC Data Hub via
         REST API.
 
+        :param timeout: Connect and read timeout in seconds, defaults to the
+        client's `timeout` setting.
+        :param deadline: Seconds the call may take in total, defaults to the
+        client's `deadline` setting.
         :return: List of indicator names grouped by frequency.
         """
 
-        url = f"{self.base_url}/indicators/names/"
-
-        # send the HTTP request to EETC Data Hub
-        response = self._send_http_request(url, {})
+        url, params = self._indicators_request()
 
-        # process and return response data
-        response_data = response.json()
+        with self._instrument("indicators/names") as record:
+            # send the HTTP request to EETC Data Hub
+            response_data = self._request_data(
+                "indicators/names",
+                url,
+                params,
+                timeout,
+                self._get_deadline_at(deadline),
+                record,
+            )
 
         return response_data
 
-    def get_companies(self, index: str = None) -> Dict[str, List[str]]:
+    def get_companies(
+        self,
+        index: str = None,
+        timeout: Union[float, Tuple[float, float]] = None,
+        deadline: float = None,
+    ) -> Dict[str, List[str]]:
         """
         Get supported companies from EETC Data Hub via REST API.
 
         :param index: Index which contains the Company.
+        :param timeout: Connect and read timeout in seconds, defaults to the
+        client's `timeout` setting.
+        :param deadline: Seconds the call may take in total, defaults to the
+        client's `deadline` setting.
         :return: List of companies in the EETC Data Hub database.
         """
 
-        url = f"{self.base_url}/companies/"
-        params = {}
-
-        # add optional query params
-        if index:
-            params["index"] = index
-
-        # send the HTTP request to EETC Data Hub
-        response = self._send_http_request(url, params)
+        url, params = self._companies_request(index)
 
-        # process and return response data
-        response_data = response.json()
+        with self._instrument("companies", index=index) as record:
+            # send the HTTP request to EETC Data Hub
+            response_data = self._request_data(
+                "companies",
+                url,
+                params,
+                timeout,
+                self._get_deadline_at(deadline),
+                record,
+            )
 
         return response_data
@@ -0,0 +1,182 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key, usable from threads and
+    asyncio tasks alike: the first caller runs the function, callers
+    arriving while it is still running wait for and share its result or
+    exception instead of running it again.
+
+    Threads and asyncio tasks are coalesced separately, a key is only
+    shared by callers of the same kind.
+    """
+
+    def __init__(self):
+        self._stats = {"flights": 0, "coalesced": 0}
+        self._futures = {}
+        self._async_futures = {}
+        # number of callers waiting for the running call of a key
+        self._followers = {}
+        self._async_followers = {}
+        self._lock = threading.Lock()
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Any],
+        timeout: float = None,
+        share: Callable[[Any], Any] = None,
+    ) -> Any:
+        """
+        Run fn in the calling thread, or wait for the running call with the
+        same key.
+
+        :param key: Identifies calls which may share their result.
+        :param fn: Function called without arguments.
+        :param timeout: Seconds to wait for a running call, forever if None.
+        :param share: Applied to the result for every caller of a call which
+        was shared with others, e.g. copy.deepcopy, so callers may modify
+        their results. Callers of a call which was not shared get the result
+        itself. None shares the result as is.
+        :return: Result of fn.
+        :raises concurrent.futures.TimeoutError: If the running call did not
+        finish within timeout.
+        """
+
+        with self._lock:
+            future = self._futures.get(key)
+
+            if future is None:
+                future = self._futures[key] = Future()
+                self._followers[key] = 0
+                self._stats["flights"] += 1
+                leader = True
+            else:
+                self._followers[key] += 1
+                self._stats["coalesced"] += 1
+                leader = False
+
+        if not leader:
+            return _share(future.result(timeout), share)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._land(key)
+            future.set_exception(e)
+            raise
+
+        # calls arriving from now on run fn again
+        followers = self._land(key)
+        future.set_result(result)
+
+        if followers:
+            return _share(result, share)
+
+        return result
+
+    def _land(self, key: Hashable) -> int:
+        """
+        :return: Number of callers which waited for the call.
+        """
+
+        with self._lock:
+            del self._futures[key]
+            return self._followers.pop(key)
+
+    async def do_async(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        timeout: float = None,
+        share: Callable[[Any], Any] = None,
+    ) -> Any:
+        """
+        Await fn(), or the running call with the same key, without blocking
+        the event loop. A caller waiting for a call which gets cancelled
+        runs fn itself.
+
+        :param key: Identifies calls which may share their result.
+        :param fn: Coroutine function called without arguments.
+        :param timeout: Seconds to wait for a running call, forever if None.
+        :param share: Applied to the result for every caller of a call which
+        was shared with others, see do.
+        :return: Result of fn.
+        :raises asyncio.TimeoutError: If the running call did not finish
+        within timeout.
+        """
+
+        # already imported by the running event loop, sync use skips it
+        import asyncio
+
+        while True:
+            future = self._async_futures.get(key)
+
+            if future is None:
+                break
+
+            self._async_followers[key] += 1
+            self._count("coalesced")
+
+            try:
+                # shielded, so a cancelled waiter does not cancel the call
+                result = await asyncio.wait_for(asyncio.shield(future), timeout)
+                return _share(result, share)
+            except asyncio.CancelledError:
+                # only the running call was cancelled, not this caller
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._async_futures[key] = future
+        self._async_followers[key] = 0
+        self._count("flights")
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            self._land_async(key)
+            future.cancel()
+            raise
+        except Exception as e:
+            self._land_async(key)
+            future.set_exception(e)
+            # retrieved, so asyncio does not log it if nobody was waiting
+            future.exception()
+            raise
+
+        followers = self._land_async(key)
+        future.set_result(result)
+
+        if followers:
+            return _share(result, share)
+
+        return result
+
+    def _land_async(self, key: Hashable) -> int:
+        del self._async_futures[key]
+        return self._async_followers.pop(key)
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    @property
+    def info(self) -> Dict[str, int]:
+        """
+        Number of calls which ran the function and of calls which waited for
+        another call's result instead.
+        """
+
+        with self._lock:
+            return dict(self._stats)
+
+
+def _share(result: Any, share: Callable[[Any], Any] = None) -> Any:
+    if share is None:
+        return result
+
+    return share(result)
@@ -0,0 +1,44 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Tuple
+
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def split_date_range(
+    from_date: str,
+    to_date: str = None,
+    days: int = 365,
+) -> List[Tuple[str, str]]:
+    """
+    Split an inclusive date range into consecutive, non-overlapping windows.
+
+    :param from_date: Earliest date in string format "yyyy-mm-dd"
+    :param to_date: Latest date in string format "yyyy-mm-dd", today (UTC) if
+    None.
+    :param days: Number of days in each window, the last one may be shorter.
+    :return: List of (from_date, to_date) tuples in string format
+    "yyyy-mm-dd".
+    """
+
+    if days < 1:
+        raise ValueError("days must be a positive number")
+
+    start = datetime.strptime(from_date, DATE_FORMAT).date()
+
+    if to_date is None:
+        end = datetime.now(timezone.utc).date()
+    else:
+        end = datetime.strptime(to_date, DATE_FORMAT).date()
+
+    windows = []
+
+    while start <= end:
+        window_end = min(start + timedelta(days=days - 1), end)
+        windows.append((_format(start), _format(window_end)))
+        start = window_end + timedelta(days=1)
+
+    return windows
+
+
+def _format(day: date) -> str:
+    return day.strftime(DATE_FORMAT)
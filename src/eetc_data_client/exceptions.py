@@ -0,0 +1,17 @@
+class EETCDataClientError(Exception):
+    """
+    Base class of the exceptions raised by the EETC Data Hub clients.
+    """
+
+
+class RequestTimeoutError(EETCDataClientError, TimeoutError):
+    """
+    A request to EETC Data Hub timed out on its last attempt.
+    """
+
+
+class DeadlineExceededError(RequestTimeoutError):
+    """
+    A client method call did not complete before its deadline, retries and
+    split date ranges included.
+    """
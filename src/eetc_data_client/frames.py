@@ -0,0 +1,444 @@
+"""
+Builders of DataFrames and tables from the flat JSON records of EETC Data
+Hub.
+
+NumPy and pandas take hundreds of milliseconds to import, so they are only
+imported by the functions using them, once data is actually converted.
+"""
+
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from .schemas import (
+    FLOAT,
+    INT,
+    STR,
+    FLOAT32,
+    NULLABLE_INT,
+    DATETIME,
+    CATEGORY,
+    Schema,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+def import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Arrow and Parquet output require pyarrow, install it with "
+            "`pip install eetc_data_client[parquet]`."
+        ) from e
+
+    return pyarrow
+
+
+def import_polars():
+    try:
+        import polars
+    except ImportError as e:
+        raise ImportError(
+            "Polars output requires polars, install it with "
+            "`pip install eetc_data_client[polars]`."
+        ) from e
+
+    return polars
+
+
+def _record_keys(
+    records: List[Dict],
+    fields: Dict[str, str],
+    columns: List[str] = None,
+) -> List[str]:
+    # only the selected columns are built, even if they are missing
+    if columns is not None:
+        return columns
+
+    if not records:
+        return list(fields)
+
+    # flat records of one endpoint nearly always share the same keys, so
+    # only records with different keys are merged into the column list
+    keys = dict.fromkeys(records[0])
+    first_keys = records[0].keys()
+
+    for record in records:
+        if record.keys() != first_keys:
+            keys.update(dict.fromkeys(record))
+
+    return list(keys)
+
+
+# Python types of JSON numbers and null
+NUMBER_TYPES = {int, float, type(None)}
+
+
+def _typed_column(values: list, dtype: str):
+    import numpy as np
+
+    # strings are left for pandas to infer
+    if dtype not in (INT, FLOAT):
+        return values
+
+    types = set(map(type, values))
+
+    # so are numeric fields holding strings, booleans or no value at all,
+    # e.g. "3.5" stays a string and True a boolean
+    if not types <= NUMBER_TYPES or types == {type(None)}:
+        return values
+
+    # the same dtypes pandas infers: int64 for ints only, float64 with NaN
+    # for ints mixed with floats or missing values
+    try:
+        if types == {int}:
+            return np.array(values, dtype=np.int64)
+
+        return np.array(values, dtype=np.float64)
+    except OverflowError:
+        return values
+
+
+def records_to_frame(
+    records: List[Dict],
+    fields: Dict[str, str],
+    columns: List[str] = None,
+) -> "pd.DataFrame":
+    """
+    Build a pandas DataFrame from flat JSON records, one column at a time.
+
+    Equivalent to pd.json_normalize for the flat records returned by EETC
+    Data Hub, but builds the numeric columns listed in `fields` directly as
+    typed NumPy arrays instead of copying and inferring every record.
+
+    :param records: Flat JSON records.
+    :param fields: Known fields of the endpoint mapped to their dtype, see
+    eetc_data_client.schemas.
+    :param columns: Fields to build columns of, all fields of the records if
+    None.
+    :return: Records as a pandas DataFrame.
+    """
+
+    import pandas as pd
+
+    if not records:
+        return pd.DataFrame(columns=_record_keys(records, fields, columns))
+
+    data = {}
+
+    for key in _record_keys(records, fields, columns):
+        values = [record.get(key) for record in records]
+        dtype = fields.get(key)
+        data[key] = values if dtype is None else _typed_column(values, dtype)
+
+    return pd.DataFrame(data)
+
+
+def apply_schema(df: "pd.DataFrame", schema: Schema) -> "pd.DataFrame":
+    """
+    Convert a DataFrame built by records_to_frame to the typed layout of a
+    schema: parsed tz-aware datetimes, categorical labels, numeric columns
+    and the schema's index.
+
+    :param df: DataFrame with the endpoint's data.
+    :param schema: Schema of the endpoint's data.
+    :return: Typed pandas DataFrame.
+    """
+
+    import pandas as pd
+
+    for column, dtype in schema.dtypes.items():
+        if column not in df.columns or dtype == STR:
+            continue
+
+        if dtype == DATETIME:
+            df[column] = pd.to_datetime(df[column], utc=True)
+        elif df[column].dtype != dtype:
+            df[column] = df[column].astype(dtype)
+
+    if schema.index is not None and schema.index in df.columns:
+        df = df.set_index(schema.index)
+
+    return df
+
+
+def sort_frame(df: "pd.DataFrame", column: str, descending=False) -> "pd.DataFrame":
+    """
+    Sort a DataFrame by one column in place, unless it is already sorted.
+
+    EETC Data Hub nearly always returns rows in date order, checking for it
+    is much cheaper than sorting, which copies every column.
+
+    :param df: DataFrame to sort.
+    :param column: Column by which the frame is sorted, if present.
+    :param descending: If True, the frame is sorted in descending order.
+    :return: The sorted DataFrame.
+    """
+
+    if column not in df.columns or len(df) < 2:
+        return df
+
+    values = df[column]
+
+    if values.is_monotonic_decreasing if descending else values.is_monotonic_increasing:
+        return df
+
+    df.sort_values(by=[column], ascending=not descending, inplace=True)
+
+    return df
+
+
+def records_to_series(
+    records: List[Dict],
+    value: str = "value",
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Extract the dates and values of one series, e.g. an indicator, from its
+    flat JSON records, so the records can be freed before the series are
+    combined by series_to_wide_frame.
+
+    :param records: Flat JSON records.
+    :param value: Field of the records holding the values.
+    :return: Tuple of the date strings and float64 values.
+    """
+
+    import numpy as np
+
+    dates = np.array([record["date"] for record in records], dtype=object)
+    values = np.array([record.get(value) for record in records], dtype=np.float64)
+
+    return dates, values
+
+
+def series_to_wide_frame(
+    series: Dict[str, Tuple["np.ndarray", "np.ndarray"]],
+) -> "pd.DataFrame":
+    """
+    Build one date indexed DataFrame with a column per series.
+
+    All values are placed into a preallocated array in one pass, instead of
+    building a DataFrame per series and joining them on date, and each
+    distinct date is parsed once.
+
+    :param series: Dates and values returned by records_to_series mapped to
+    the name of their column.
+    :return: DataFrame with the sorted union of all dates as tz-aware index
+    and NaN where a series has no value for a date.
+    """
+
+    import numpy as np
+    import pandas as pd
+
+    columns = list(series)
+    lengths = [len(dates) for dates, _ in series.values()]
+    # the empty lists keep np.concatenate from failing without any series
+    dates = np.concatenate([dates for dates, _ in series.values()] + [[]])
+    values = np.concatenate([values for _, values in series.values()] + [[]])
+    column_indexes = np.repeat(np.arange(len(columns)), lengths)
+
+    row_indexes, unique_dates = pd.factorize(dates, sort=True)
+    data = np.full((len(unique_dates), len(columns)), np.nan)
+    # a later value of the same series and date overwrites an earlier one
+    data[row_indexes, column_indexes] = values
+
+    index = pd.DatetimeIndex(pd.to_datetime(unique_dates, utc=True), name="date")
+
+    return pd.DataFrame(data, index=index, columns=pd.Index(columns, name="name"))
+
+
+def resample_frame(df: "pd.DataFrame", period: str) -> "pd.DataFrame":
+    """
+    Resample a DataFrame built by series_to_wide_frame to a fixed
+    frequency, keeping the last value of each series in every period and
+    forward filling periods without one.
+
+    :param df: DataFrame with a tz-aware DatetimeIndex.
+    :param period: pandas period alias, e.g. "D", "W", "M", "Q" or "Y".
+    :return: DataFrame indexed by the UTC start of each period.
+    """
+
+    import pandas as pd
+
+    if df.empty:
+        return df
+
+    periods = df.index.tz_convert(None).to_period(period)
+    # GroupBy.last skips NaN, so series reported on different days of the
+    # same period are combined into one row
+    df = df.groupby(periods).last()
+    df = df.reindex(pd.period_range(df.index[0], df.index[-1], freq=period)).ffill()
+    df.index = pd.DatetimeIndex(df.index.to_timestamp(), name="date").tz_localize("UTC")
+
+    return df
+
+
+def _arrow_type(pa, dtype: str):
+    if dtype in (INT, NULLABLE_INT):
+        return pa.int64()
+
+    if dtype == DATETIME:
+        return pa.timestamp("ns", tz="UTC")
+
+    return {FLOAT: pa.float64(), FLOAT32: pa.float32()}.get(dtype, pa.string())
+
+
+def _arrow_timestamps(pa, column):
+    """
+    Cast date strings to UTC timestamps. Dates without a zone offset, e.g.
+    "2020-01-02", are taken as UTC like pandas and polars do.
+    """
+
+    import pyarrow.compute as pc
+
+    try:
+        return column.cast(_arrow_type(pa, DATETIME))
+    except pa.ArrowInvalid:
+        # Arrow only parses strings with a zone offset as zoned timestamps
+        return pc.assume_timezone(column.cast(pa.timestamp("ns")), "UTC")
+
+
+def _is_sorted_arrow(pa, column, descending=False) -> bool:
+    import pyarrow.compute as pc
+
+    previous, following = column[:-1], column[1:]
+
+    if descending:
+        in_order = pc.greater_equal(previous, following)
+    else:
+        in_order = pc.less_equal(previous, following)
+
+    # comparisons with nulls are null, so columns with nulls are sorted
+    return pc.all(in_order, skip_nulls=False).as_py() is True
+
+
+def records_to_table(
+    records: List[Dict],
+    fields: Dict[str, str],
+    sort_by: str = None,
+    descending=False,
+    columns: List[str] = None,
+):
+    """
+    Build a pyarrow Table from flat JSON records, one column at a time,
+    without an intermediate pandas DataFrame.
+
+    :param records: Flat JSON records.
+    :param fields: Known fields of the endpoint mapped to their dtype, see
+    eetc_data_client.schemas. Schema.dtypes of a schema gives typed tables
+    with timestamps and dictionary encoded categories.
+    :param sort_by: Column by which the table is sorted, if present and not
+    sorted already.
+    :param descending: If True, the table is sorted in descending order.
+    :param columns: Fields to build columns of, all fields of the records if
+    None.
+    :return: Records as a pyarrow Table.
+    """
+
+    pa = import_pyarrow()
+
+    keys = _record_keys(records, fields, columns)
+    columns = {}
+
+    for key in keys:
+        values = [record.get(key) for record in records]
+        dtype = fields.get(key)
+
+        if dtype is None:
+            columns[key] = pa.array(values)
+        elif dtype in (DATETIME, CATEGORY):
+            # JSON dates and labels are strings, converted by Arrow's casts
+            column = pa.array(values, type=pa.string())
+
+            if dtype == DATETIME:
+                columns[key] = _arrow_timestamps(pa, column)
+            else:
+                columns[key] = column.dictionary_encode()
+        else:
+            columns[key] = pa.array(values, type=_arrow_type(pa, dtype))
+
+    table = pa.table(columns)
+
+    if (
+        sort_by in columns
+        and table.num_rows > 1
+        and not _is_sorted_arrow(pa, columns[sort_by], descending)
+    ):
+        table = table.sort_by([(sort_by, "descending" if descending else "ascending")])
+
+    return table
+
+
+def _polars_type(pl, dtype: str):
+    if dtype in (INT, NULLABLE_INT):
+        return pl.Int64
+
+    return {FLOAT: pl.Float64, FLOAT32: pl.Float32}.get(dtype, pl.String)
+
+
+def records_to_polars(
+    records: List[Dict],
+    fields: Dict[str, str],
+    sort_by: str = None,
+    descending=False,
+    columns: List[str] = None,
+):
+    """
+    Build a polars DataFrame from flat JSON records, one column at a time,
+    without an intermediate pandas DataFrame.
+
+    :param records: Flat JSON records.
+    :param fields: Known fields of the endpoint mapped to their dtype, see
+    eetc_data_client.schemas. Schema.dtypes of a schema gives typed frames
+    with UTC datetimes and categorical labels.
+    :param sort_by: Column by which the frame is sorted, if present and not
+    sorted already.
+    :param descending: If True, the frame is sorted in descending order.
+    :param columns: Fields to build columns of, all fields of the records if
+    None.
+    :return: Records as a polars DataFrame.
+    """
+
+    pl = import_polars()
+
+    keys = _record_keys(records, fields, columns)
+    columns = []
+
+    for key in keys:
+        values = [record.get(key) for record in records]
+        dtype = fields.get(key)
+
+        if dtype is None:
+            column = pl.Series(key, values, strict=False)
+        elif dtype == DATETIME:
+            column = pl.Series(key, values, dtype=pl.String).str.to_datetime(
+                time_unit="ns",
+                time_zone="UTC",
+            )
+        elif dtype == CATEGORY:
+            column = pl.Series(key, values, dtype=pl.String).cast(pl.Categorical)
+        else:
+            try:
+                column = pl.Series(
+                    key,
+                    values,
+                    dtype=_polars_type(pl, dtype),
+                    strict=True,
+                )
+            except TypeError:
+                # unexpected values are kept, like records_to_frame does
+                column = pl.Series(key, values, strict=False)
+
+        columns.append(column)
+
+    df = pl.DataFrame(columns)
+
+    if (
+        sort_by in df.columns
+        and len(df) > 1
+        and not df[sort_by].is_sorted(descending=descending)
+    ):
+        df = df.sort(sort_by, descending=descending)
+
+    return df
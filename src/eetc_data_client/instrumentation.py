@@ -0,0 +1,152 @@
+import threading
+import time
+from collections import deque
+from typing import Dict, Any
+
+# values of a call record which are aggregated into percentiles
+TIMING_FIELDS = (
+    "total_time",
+    "http_time",
+    "decode_time",
+    "frame_time",
+    "wire_bytes",
+    "decoded_bytes",
+    "rows",
+)
+
+
+class CallRecord:
+    """
+    Timings and sizes collected during one client method call. Requests of
+    a call may be sent from several threads, so values are added under a
+    lock.
+    """
+
+    def __init__(self, endpoint: str, params: dict):
+        self.values = {
+            "endpoint": endpoint,
+            "params": params,
+            "requests": 0,
+            "cache_hits": 0,
+            "coalesced": 0,
+            "http_time": 0.0,
+            "decode_time": 0.0,
+            "frame_time": 0.0,
+            "wire_bytes": 0,
+            "decoded_bytes": 0,
+            "rows": None,
+            "total_time": None,
+            "error": None,
+        }
+
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, **values):
+        """
+        Add to the record's counters, e.g. add(requests=1, http_time=0.2).
+        """
+
+        with self._lock:
+            for name, value in values.items():
+                self.values[name] += value
+
+    def set(self, **values):
+        with self._lock:
+            self.values.update(values)
+
+    def finish(self, error: Exception = None) -> Dict[str, Any]:
+        """
+        :param error: Exception raised by the call, if any.
+        :return: Recorded values with the call's total time.
+        """
+
+        with self._lock:
+            self.values["total_time"] = time.perf_counter() - self._start
+
+            if error is not None:
+                self.values["error"] = type(error).__name__
+
+            return dict(self.values)
+
+
+class StatsCollector:
+    """
+    Hook which keeps the most recent call records per endpoint and
+    aggregates them into percentiles.
+    """
+
+    def __init__(self, max_records: int = 1000):
+        """
+        :param max_records: Number of most recent calls kept per endpoint.
+        """
+
+        self.max_records = max_records
+
+        self._records = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, record: Dict[str, Any]):
+        with self._lock:
+            if record["endpoint"] not in self._records:
+                self._records[record["endpoint"]] = deque(maxlen=self.max_records)
+
+            self._records[record["endpoint"]].append(record)
+
+    def records(self, endpoint: str = None) -> list:
+        """
+        :param endpoint: Endpoint whose records are returned, all if None.
+        :return: Kept call records, oldest first.
+        """
+
+        with self._lock:
+            if endpoint is not None:
+                return list(self._records.get(endpoint, ()))
+
+            return [record for records in self._records.values() for record in records]
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        :return: Per endpoint number of calls, failed calls and requests sent,
+        and p50/p95/p99/mean of the recorded timings, sizes and row counts of
+        successful calls.
+        """
+
+        import numpy as np
+
+        with self._lock:
+            records = {endpoint: list(r) for endpoint, r in self._records.items()}
+
+        summary = {}
+
+        for endpoint, endpoint_records in records.items():
+            succeeded = [r for r in endpoint_records if r["error"] is None]
+            endpoint_summary = {
+                "calls": len(endpoint_records),
+                "errors": len(endpoint_records) - len(succeeded),
+                "requests": sum(r["requests"] for r in endpoint_records),
+                "cache_hits": sum(r["cache_hits"] for r in endpoint_records),
+                "coalesced": sum(r["coalesced"] for r in endpoint_records),
+            }
+
+            for field in TIMING_FIELDS:
+                values = [r[field] for r in succeeded if r[field] is not None]
+
+                if not values:
+                    continue
+
+                p50, p95, p99 = np.percentile(values, [50, 95, 99])
+                endpoint_summary[field] = {
+                    "p50": float(p50),
+                    "p95": float(p95),
+                    "p99": float(p99),
+                    "mean": float(np.mean(values)),
+                }
+
+            summary[endpoint] = endpoint_summary
+
+        return summary
+
+    def reset(self):
+        with self._lock:
+            self._records.clear()
@@ -0,0 +1,68 @@
+import json
+from typing import Any, Callable, Optional
+
+JSONLoads = Callable[[bytes], Any]
+
+
+def get_fast_json_loads() -> Optional[JSONLoads]:
+    """
+    Get the `loads` function of the fastest installed JSON library.
+
+    :return: orjson.loads or ujson.loads, None if neither is installed.
+    """
+
+    try:
+        import orjson
+
+        return orjson.loads
+    except ImportError:
+        pass
+
+    try:
+        import ujson
+
+        return ujson.loads
+    except ImportError:
+        pass
+
+    return None
+
+
+def with_stdlib_fallback(json_loads: JSONLoads) -> JSONLoads:
+    """
+    :param json_loads: Function decoding bytes.
+    :return: Function decoding bytes with json_loads, and with the standard
+    library json module if json_loads rejects them. orjson rejects the NaN
+    and Infinity tokens the standard library accepts.
+    """
+
+    def loads(data: bytes) -> Any:
+        try:
+            return json_loads(data)
+        except ValueError:
+            return json.loads(data)
+
+    return loads
+
+
+def resolve_json_loads(json_loads: Any = "auto") -> Optional[JSONLoads]:
+    """
+    :param json_loads: "auto" to pick the fastest installed JSON library,
+    falling back to the standard library for bodies it rejects, None to use
+    the standard library, or a function decoding bytes.
+    :return: Function for decoding response bodies, None for the standard
+    library.
+    """
+
+    if json_loads == "auto":
+        fast_json_loads = get_fast_json_loads()
+
+        if fast_json_loads is None:
+            return None
+
+        return with_stdlib_fallback(fast_json_loads)
+
+    if json_loads is None or callable(json_loads):
+        return json_loads
+
+    raise ValueError(f"Unsupported json_loads: {json_loads!r}")
@@ -0,0 +1,218 @@
+"""
+Compact panels of fundamentals data across symbols and periods.
+
+NumPy and pandas are only imported by the functions using them, see
+eetc_data_client.frames.
+"""
+
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple
+
+from .schemas import FUNDAMENTALS_VALUE_FIELDS
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# arrays extracted from the fundamentals records of one symbol: years,
+# quarters (NaN for yearly data) and values with a column per field
+FundamentalsRows = Tuple["np.ndarray", "np.ndarray", "np.ndarray"]
+
+
+def records_to_fundamentals_rows(
+    records: List[Dict],
+    from_year: int = None,
+    to_year: int = None,
+    fields: Sequence[str] = FUNDAMENTALS_VALUE_FIELDS,
+) -> FundamentalsRows:
+    """
+    Extract the periods and numeric values of one symbol's fundamentals
+    records, so the records can be freed before the symbols are combined.
+
+    :param records: Flat JSON records returned by the fundamentals endpoint.
+    :param from_year: Earliest year kept, all if None.
+    :param to_year: Latest year kept, all if None.
+    :param fields: Fields whose values are extracted.
+    :return: Tuple of the years, quarters and float64 values.
+    """
+
+    import numpy as np
+
+    records = [
+        record
+        for record in records
+        if (from_year is None or record["year"] >= from_year)
+        and (to_year is None or record["year"] <= to_year)
+    ]
+
+    years = np.array([record["year"] for record in records], dtype=np.int64)
+    quarters = np.array([record.get("quarter") for record in records], dtype=np.float64)
+    values = np.array(
+        [[record.get(field) for field in fields] for record in records],
+        dtype=np.float64,
+    ).reshape(len(records), len(fields))
+
+    return years, quarters, values
+
+
+def _period_index(years: "np.ndarray", quarters: "np.ndarray") -> "pd.MultiIndex":
+    import pandas as pd
+
+    return pd.MultiIndex.from_arrays(
+        [years, pd.array(quarters, dtype="Int64")],
+        names=["year", "quarter"],
+    )
+
+
+def fundamentals_rows_to_frame(
+    rows_by_symbol: Dict[str, FundamentalsRows],
+    fields: Sequence[str] = FUNDAMENTALS_VALUE_FIELDS,
+) -> "pd.DataFrame":
+    """
+    Build one DataFrame indexed by (symbol, year, quarter) from the rows of
+    several symbols, concatenating their value arrays once instead of
+    building and concatenating a DataFrame per symbol.
+
+    :param rows_by_symbol: Rows returned by records_to_fundamentals_rows
+    mapped to their symbol.
+    :param fields: Fields the rows were extracted with.
+    :return: Sorted DataFrame with a float64 column per field, the quarter
+    is <NA> for yearly data. Of duplicate periods the last one is kept.
+    """
+
+    import numpy as np
+    import pandas as pd
+
+    symbols = list(rows_by_symbol)
+    rows = list(rows_by_symbol.values())
+    lengths = [len(years) for years, _, _ in rows]
+
+    index = pd.MultiIndex.from_arrays(
+        [
+            pd.Categorical.from_codes(
+                np.repeat(np.arange(len(symbols)), lengths),
+                symbols,
+            ),
+            np.concatenate([years for years, _, _ in rows] + [[]]).astype(np.int64),
+            pd.array(
+                np.concatenate([quarters for _, quarters, _ in rows] + [[]]),
+                dtype="Int64",
+            ),
+        ],
+        names=["symbol", "year", "quarter"],
+    )
+    values = np.concatenate([v for _, _, v in rows] + [np.empty((0, len(fields)))])
+
+    df = pd.DataFrame(values, index=index, columns=list(fields))
+    df = df[~df.index.duplicated(keep="last")]
+
+    return df.sort_index()
+
+
+class FundamentalsPanel:
+    """
+    Fundamentals data of several symbols as one 3-D float64 array of shape
+    (symbols, periods, fields), NaN where a symbol has no value for a period.
+    """
+
+    def __init__(
+        self,
+        values: "np.ndarray",
+        symbols: List[str],
+        periods: "pd.MultiIndex",
+        fields: List[str],
+    ):
+        """
+        :param values: Array of shape (len(symbols), len(periods),
+        len(fields)).
+        :param symbols: Symbols along the first axis.
+        :param periods: (year, quarter) MultiIndex along the second axis.
+        :param fields: Field names along the third axis.
+        """
+
+        self.values = values
+        self.symbols = symbols
+        self.periods = periods
+        self.fields = fields
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows_by_symbol: Dict[str, FundamentalsRows],
+        fields: Sequence[str] = FUNDAMENTALS_VALUE_FIELDS,
+    ) -> "FundamentalsPanel":
+        """
+        :param rows_by_symbol: Rows returned by records_to_fundamentals_rows
+        mapped to their symbol.
+        :param fields: Fields the rows were extracted with.
+        :return: Panel of the sorted union of all periods. Of duplicate
+        periods the last one is kept.
+        """
+
+        import numpy as np
+        import pandas as pd
+
+        symbols = list(rows_by_symbol)
+        rows = list(rows_by_symbol.values())
+        years = np.concatenate([years for years, _, _ in rows] + [[]]).astype(np.int64)
+        quarters = np.concatenate([quarters for _, quarters, _ in rows] + [[]])
+
+        # yearly data (quarter 0) is ordered before the quarters of its year
+        keys = years * 10 + np.nan_to_num(quarters).astype(np.int64)
+        period_indexes, period_keys = pd.factorize(keys, sort=True)
+        first_rows = np.unique(period_indexes, return_index=True)[1]
+
+        values = np.full((len(symbols), len(period_keys), len(fields)), np.nan)
+        symbol_indexes = np.repeat(
+            np.arange(len(symbols)),
+            [len(years) for years, _, _ in rows],
+        )
+
+        if rows:
+            values[symbol_indexes, period_indexes] = np.concatenate(
+                [v for _, _, v in rows],
+            )
+
+        return cls(
+            values,
+            symbols,
+            _period_index(years[first_rows], quarters[first_rows]),
+            list(fields),
+        )
+
+    def field(self, name: str) -> "pd.DataFrame":
+        """
+        :param name: Name of the field.
+        :return: Values of the field with a row per period and a column per
+        symbol.
+        """
+
+        import pandas as pd
+
+        return pd.DataFrame(
+            self.values[:, :, self.fields.index(name)].T,
+            index=self.periods,
+            columns=self.symbols,
+        )
+
+    def to_frame(self) -> "pd.DataFrame":
+        """
+        :return: The panel as a DataFrame indexed by (symbol, year, quarter),
+        without periods for which a symbol has no values.
+        """
+
+        import numpy as np
+        import pandas as pd
+
+        has_values = ~np.isnan(self.values).all(axis=2)
+        symbol_indexes, period_indexes = np.nonzero(has_values)
+
+        index = pd.MultiIndex.from_arrays(
+            [
+                pd.Categorical.from_codes(symbol_indexes, self.symbols),
+                self.periods.get_level_values("year")[period_indexes],
+                self.periods.get_level_values("quarter")[period_indexes],
+            ],
+            names=["symbol", "year", "quarter"],
+        )
+
+        return pd.DataFrame(self.values[has_values], index=index, columns=self.fields)
@@ -0,0 +1,92 @@
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting the rate of requests, usable from
+    threads and asyncio tasks alike.
+
+    Every request takes one token, tokens are refilled at `rate` per second
+    up to `burst`. Callers reserve their token up front and then wait until
+    it becomes available, so concurrent callers are served in order.
+    """
+
+    def __init__(self, rate: float, burst: int = None):
+        """
+        :param rate: Sustained number of requests per second.
+        :param burst: Maximum number of requests sent at once after a quiet
+        period, defaults to one second worth of requests.
+        """
+
+        if rate <= 0:
+            raise ValueError("rate must be a positive number")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, timeout: float = None) -> Optional[float]:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._updated_at) * self.rate,
+            )
+            self._updated_at = now
+
+            # a negative balance is the queue of callers waiting for tokens
+            delay = max(0.0, (1 - self._tokens) / self.rate)
+
+            # the token is left to later callers if it comes too late
+            if delay > 0 and timeout is not None and delay >= timeout:
+                return None
+
+            self._tokens -= 1
+
+            return delay
+
+    def acquire(self, timeout: float = None) -> bool:
+        """
+        Block the calling thread until a token is available.
+
+        :param timeout: Maximum number of seconds to wait, forever if None.
+        :return: False without waiting or taking a token if none becomes
+        available within `timeout`, True otherwise.
+        """
+
+        delay = self._reserve(timeout)
+
+        if delay is None:
+            return False
+
+        if delay > 0:
+            time.sleep(delay)
+
+        return True
+
+    async def acquire_async(self, timeout: float = None) -> bool:
+        """
+        Wait without blocking the event loop until a token is available.
+
+        :param timeout: Maximum number of seconds to wait, forever if None.
+        :return: False without waiting or taking a token if none becomes
+        available within `timeout`, True otherwise.
+        """
+
+        # already imported by the running event loop, sync use skips it
+        import asyncio
+
+        delay = self._reserve(timeout)
+
+        if delay is None:
+            return False
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        return True
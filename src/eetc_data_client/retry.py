@@ -0,0 +1,102 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+# statuses returned by EETC Data Hub during cold starts and overload
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RetryPolicy:
+    """
+    Describes how failed requests are retried. Only GET requests are sent by
+    the clients, so every request is idempotent and safe to retry.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        respect_retry_after: bool = True,
+    ):
+        """
+        :param max_attempts: Maximum number of attempts per request, including
+        the first one. 1 disables retries.
+        :param backoff_factor: Delay in seconds before the first retry, doubled
+        for every following retry.
+        :param max_backoff: Upper bound of the delay in seconds.
+        :param jitter: If True, a random delay between 0 and the backoff is
+        used ("full jitter") so concurrent clients do not retry in lockstep.
+        :param retry_statuses: HTTP status codes which are retried, connection
+        errors and timeouts are always retried.
+        :param respect_retry_after: If True, the delay requested by the
+        server's Retry-After header is used when present.
+        """
+
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+
+    def should_retry(self, attempt: int, status_code: int = None) -> bool:
+        """
+        :param attempt: Number of the attempt which just failed, starting at 1.
+        :param status_code: HTTP status code of the failed attempt, None for
+        connection errors and timeouts.
+        :return: True if the request should be sent again.
+        """
+
+        if attempt >= self.max_attempts:
+            return False
+
+        return status_code is None or status_code in self.retry_statuses
+
+    def get_backoff(self, attempt: int, retry_after: str = None) -> float:
+        """
+        :param attempt: Number of the attempt which just failed, starting at 1.
+        :param retry_after: Value of the response's Retry-After header.
+        :return: Seconds to wait before the next attempt.
+        """
+
+        if self.respect_retry_after and retry_after is not None:
+            delay = parse_retry_after(retry_after)
+
+            if delay is not None:
+                return min(delay, self.max_backoff)
+
+        delay = min(self.backoff_factor * 2 ** (attempt - 1), self.max_backoff)
+
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        return delay
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """
+    :param value: Retry-After header value, either seconds or an HTTP date.
+    :return: Seconds to wait, None if the value can't be parsed.
+    """
+
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+    if retry_at is None:
+        return None
+
+    return max(retry_at.timestamp() - time.time(), 0.0)
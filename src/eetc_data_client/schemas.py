@@ -0,0 +1,241 @@
+"""
+Fields returned by the EETC Data Hub data endpoints and their dtypes.
+"""
+
+from typing import Dict
+
+FLOAT = "float64"
+INT = "int64"
+STR = "str"
+
+# dtypes only used for typed DataFrames
+FLOAT32 = "float32"
+NULLABLE_INT = "Int64"
+DATETIME = "datetime64[ns, UTC]"
+CATEGORY = "category"
+
+PRICE_DATA_FIELDS = {
+    "date": STR,
+    "symbol": STR,
+    "open": FLOAT,
+    "high": FLOAT,
+    "low": FLOAT,
+    "close": FLOAT,
+    "volume": FLOAT,
+    "name": STR,
+}
+
+INDICATOR_DATA_FIELDS = {
+    "date": STR,
+    "name": STR,
+    "value": FLOAT,
+    "frequency": STR,
+}
+
+# numeric values reported for every fundamentals period
+FUNDAMENTALS_VALUE_FIELDS = (
+    "revenue",
+    "cogs",
+    "cogs_excluding_deprecation_and_amortization",
+    "deprecation_and_amortization_expense",
+    "gross_profit",
+    "gross_profit_margin",
+    "sga_expenses",
+    "research_and_development_expenses",
+    "unusual_expense",
+    "ebit",
+    "non_operating_income",
+    "non_operating_interest_income",
+    "interest_expense",
+    "net_income_before_tax",
+    "income_tax",
+    "equity_in_affiliates",
+    "net_income_after_tax",
+    "other_after_tax_income",
+    "consolidated_net_income",
+    "minority_interest",
+    "net_income_before_extraordinaries",
+    "preferred_dividends",
+    "net_income_available_to_common",
+    "eps_basic",
+    "basic_shares_outstanding",
+    "eps_diluted",
+    "diluted_shares_outstanding",
+    "ebitda",
+    "net_income",
+    "deprecation_depletion_and_amortization",
+    "deprecation_depletion",
+    "amortization",
+    "deferred_taxes",
+    "investment_tax_credit",
+    "extraordinaries",
+    "changes_in_working_capital",
+    "accounts_receivables",
+    "accounts_payable",
+    "cash_from_operating_activities",
+    "capex",
+    "net_assets_from_acquisitions",
+    "sale_of_fixed_assets_and_businesses",
+    "purchase_of_investments",
+    "sale_of_investments",
+    "cash_from_investing_activities",
+    "cash_dividends_paid",
+    "change_in_capital_stock",
+    "repurchase_of_common_and_preferred_stock",
+    "sale_of_common_and_preferred_stock",
+    "proceeds_from_stock_options",
+    "other_proceeds_from_sale_of_stock",
+    "change_in_debt",
+    "change_in_current_debt",
+    "change_in_long_term_debt",
+    "other_funds",
+    "cash_from_financing_activities",
+    "foreign_exchange_effect",
+    "miscellaneous_funds",
+    "net_change_in_cash",
+    "free_cash_flow",
+    "cash_and_short_term_investments",
+    "cash",
+    "short_term_investments",
+    "accounts_receivable",
+    "accounts_receivables_net",
+    "bad_debt_doubtful_accounts",
+    "other_receivable",
+    "accounts_receivable_turnover",
+    "inventories",
+    "other_current_assets",
+    "total_current_assets",
+    "property_plant_equipment_net",
+    "property_plant_equipment_gross",
+    "buildings",
+    "land_and_improvements",
+    "computer_software_and_equipment",
+    "other_property_plant_equipment",
+    "accumulated_deprecation",
+    "total_investments_and_advances",
+    "long_term_note_receivables",
+    "intangible_assets",
+    "goodwill",
+    "other_intangibles",
+    "other_assets",
+    "total_assets",
+    "short_term_debt",
+    "current_portion_of_long_term_debt",
+    "accounts_payable_1",
+    "income_tax_payable",
+    "other_current_liabilities",
+    "total_current_liabilities",
+    "long_term_debt",
+    "provision_for_risks_and_charges",
+    "deferred_taxes_1",
+    "other_liabilities",
+    "deferred_income",
+    "total_liabilities",
+    "non_equity_reserves",
+    "preferred_stock",
+    "redeemable_preferred_stock",
+    "non_redeemable_preferred_stock",
+    "common_equity",
+    "retained_earnings",
+    "unrealized_gains_in_marketable_securities",
+    "treasury_stock",
+    "total_shareholders_equity",
+    "accumulated_minority_interest",
+    "total_equity",
+    "liabilities_and_shareholders_equity",
+)
+
+FUNDAMENTALS_DATA_FIELDS = {
+    "symbol": STR,
+    "year": INT,
+    "quarter": INT,
+    "name": STR,
+    "inserted_at": STR,
+    "frequency": STR,
+    "source": STR,
+    **{field: FLOAT for field in FUNDAMENTALS_VALUE_FIELDS},
+}
+
+
+# fields identifying the rows of an endpoint, always returned when only some
+# fields are selected
+KEY_FIELDS = {
+    "price": ("date",),
+    "fundamentals": ("symbol", "year", "quarter"),
+    "indicators": ("date",),
+}
+
+
+class Schema:
+    """
+    Typed DataFrame layout of an endpoint's data.
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, str],
+        typed_fields: Dict[str, str],
+        index: str = None,
+    ):
+        """
+        :param fields: Fields returned by the endpoint mapped to their dtype.
+        :param typed_fields: dtypes of typed DataFrames which differ from the
+        ones in `fields`.
+        :param index: Field used as index of typed DataFrames.
+        """
+
+        self.fields = fields
+        self.typed_fields = typed_fields
+        self.index = index
+
+    @property
+    def dtypes(self) -> Dict[str, str]:
+        """
+        dtypes of all fields in typed DataFrames.
+        """
+
+        dtypes = {**self.fields, **self.typed_fields}
+
+        return {
+            field: NULLABLE_INT if dtype == INT else dtype
+            for field, dtype in dtypes.items()
+        }
+
+
+SCHEMAS = {
+    "price": Schema(
+        PRICE_DATA_FIELDS,
+        {"date": DATETIME, "symbol": CATEGORY, "name": CATEGORY},
+        index="date",
+    ),
+    "fundamentals": Schema(
+        FUNDAMENTALS_DATA_FIELDS,
+        {
+            "inserted_at": DATETIME,
+            "symbol": CATEGORY,
+            "name": CATEGORY,
+            "frequency": CATEGORY,
+            "source": CATEGORY,
+        },
+    ),
+    "indicators": Schema(
+        INDICATOR_DATA_FIELDS,
+        {"date": DATETIME, "name": CATEGORY, "frequency": CATEGORY},
+        index="date",
+    ),
+}
+
+
+def register_schema(endpoint: str, schema: Schema):
+    """
+    Replace the schema used for typed DataFrames of an endpoint, e.g. to
+    store prices as float32.
+
+    :param endpoint: "price", "fundamentals" or "indicators".
+    :param schema: Schema of the endpoint's data.
+    """
+
+    if endpoint not in SCHEMAS:
+        raise ValueError(f"Unknown endpoint: {endpoint}")
+
+    SCHEMAS[endpoint] = schema
@@ -0,0 +1,314 @@
+import asyncio
+import json
+import time
+import unittest
+from unittest import mock
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+from pandas._testing import assert_frame_equal
+
+from benchmarks.mock_server import MockDataHubServer
+from src.eetc_data_client.async_client import AsyncEETCDataClient
+from src.eetc_data_client.client import EETCDataClient
+from src.eetc_data_client.exceptions import (
+    DeadlineExceededError,
+    RequestTimeoutError,
+)
+from src.eetc_data_client.retry import RetryPolicy
+
+PRICE_DATA = [
+    {
+        "date": "2012-04-27T00:00:00Z",
+        "symbol": "AAPL",
+        "open": 21.85,
+        "high": 21.91,
+        "low": 21.61,
+        "close": 21.65,
+        "volume": 403036400.0,
+        "name": "Apple Inc.",
+    },
+    {
+        "date": "2012-04-26T00:00:00Z",
+        "symbol": "AAPL",
+        "open": 21.94,
+        "high": 21.95,
+        "low": 21.5,
+        "close": 21.7,
+        "volume": 536068400.0,
+        "name": "Apple Inc.",
+    },
+]
+
+INDICATOR_DATA = [
+    {
+        "date": "2020-01-01T00:00:00Z",
+        "name": "US Real GDP",
+        "value": -3.4,
+        "frequency": "Yearly",
+    },
+]
+
+
+class TestAsyncEETCDataClient(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.async_client = AsyncEETCDataClient("test_api_key")
+        # mocked sync responses only implement Response.json()
+        self.sync_client = EETCDataClient("test_api_key", json_loads=None)
+
+    def sync_result(self, method: str, response_data, *args, **kwargs):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json = MagicMock(return_value=response_data)
+
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            return_value=mock_response,
+        ):
+            return getattr(self.sync_client, method)(*args, **kwargs)
+
+    async def test_get_price_data_matches_sync_client(self):
+        # given
+        expected = self.sync_result("get_price_data", PRICE_DATA, "AAPL")
+
+        # when
+        with mock.patch.object(
+            self.async_client,
+            "_send_http_request",
+            AsyncMock(return_value=json.dumps(PRICE_DATA).encode()),
+        ):
+            data = await self.async_client.get_price_data("AAPL")
+
+        # then
+        assert_frame_equal(expected, data)
+
+    async def test_get_indicator_data_matches_sync_client(self):
+        # given
+        expected = self.sync_result(
+            "get_indicator_data",
+            INDICATOR_DATA,
+            "US Real GDP",
+            "Yearly",
+        )
+
+        # when
+        with mock.patch.object(
+            self.async_client,
+            "_send_http_request",
+            AsyncMock(return_value=json.dumps(INDICATOR_DATA).encode()),
+        ) as send_http_request:
+            data = await self.async_client.get_indicator_data(
+                "US Real GDP",
+                "Yearly",
+            )
+
+        # then
+        assert_frame_equal(expected, data)
+        send_http_request.assert_awaited_once_with(
+            f"{self.async_client.base_url}/indicators/?name=US Real GDP",
+            {"frequency": "Yearly"},
+            None,
+            None,
+        )
+
+    async def test_get_companies(self):
+        # given
+        companies = [{"symbol": "AAPL", "name": "Apple Inc."}]
+
+        # when
+        with mock.patch.object(
+            self.async_client,
+            "_send_http_request",
+            AsyncMock(return_value=json.dumps(companies).encode()),
+        ) as send_http_request:
+            data = await self.async_client.get_companies(index="S&P 500")
+
+        # then
+        self.assertEqual(companies, data)
+        send_http_request.assert_awaited_once_with(
+            f"{self.async_client.base_url}/companies/",
+            {"index": "S&P 500"},
+            None,
+            None,
+        )
+
+    async def test_get_companies_coalesced(self):
+        # given
+        companies = [{"symbol": "AAPL", "name": "Apple Inc."}]
+
+        async def send_http_request(url, params, timeout=None, deadline_at=None):
+            await asyncio.sleep(0.01)
+            return json.dumps(companies).encode()
+
+        # when
+        with mock.patch.object(
+            self.async_client,
+            "_send_http_request",
+            AsyncMock(side_effect=send_http_request),
+        ) as send_http_request_mock:
+            results = await asyncio.gather(
+                *[self.async_client.get_companies() for _ in range(3)]
+            )
+
+        # then
+        self.assertEqual([companies] * 3, results)
+        send_http_request_mock.assert_awaited_once()
+        self.assertEqual(
+            {"flights": 1, "coalesced": 2},
+            self.async_client.coalescing_info,
+        )
+
+        # every caller gets its own copy
+        results[0][0]["name"] = "Apple"
+        self.assertEqual([companies] * 2, results[1:])
+
+    async def test_close_without_session(self):
+        # given
+        # when
+        async with self.async_client as client:
+            pass
+
+        # then
+        self.assertIsNone(client.session)
+
+    async def test__send_http_request_retries(self):
+        # given
+        # the backoff would take 30 seconds without the Retry-After header
+        retry_policy = RetryPolicy(max_attempts=3, backoff_factor=30, jitter=False)
+
+        with MockDataHubServer(rows=2, unavailable=2, retry_after="0") as server:
+            async with AsyncEETCDataClient(
+                "test_api_key",
+                retry_policy=retry_policy,
+            ) as client:
+                client.base_url = server.base_url
+                start = time.monotonic()
+
+                # when
+                companies = await client.get_companies()
+
+            # then
+            self.assertLess(time.monotonic() - start, 5.0)
+            self.assertEqual(2, len(companies))
+            self.assertEqual(3, server.requests)
+            self.assertEqual(
+                {"retries": 2, "retried_requests": 1, "exhausted": 0},
+                client.retry_stats,
+            )
+
+    async def test__send_http_request_retries_exhausted(self):
+        # given
+        with MockDataHubServer(unavailable=5, retry_after="0") as server:
+            async with AsyncEETCDataClient(
+                "test_api_key",
+                retry_policy=RetryPolicy(max_attempts=2),
+            ) as client:
+                client.base_url = server.base_url
+
+                # when
+                # then
+                with self.assertRaises(aiohttp.ClientResponseError) as context:
+                    await client.get_companies()
+
+            self.assertEqual(2, server.requests)
+
+        self.assertEqual(503, context.exception.status)
+        self.assertEqual(
+            {"retries": 1, "retried_requests": 1, "exhausted": 1},
+            client.retry_stats,
+        )
+
+    async def test__send_http_request_rate_limit(self):
+        # given
+        with MockDataHubServer(rows=2) as server:
+            async with AsyncEETCDataClient(
+                "test_api_key",
+                rate_limit=10,
+                rate_limit_burst=1,
+            ) as client:
+                client.base_url = server.base_url
+                start = time.monotonic()
+
+                # when
+                for index in ("S&P 500", "NASDAQ 100", "DJIA"):
+                    await client.get_companies(index=index)
+
+            # then
+            # the second and third request wait 0.1 seconds for their tokens
+            self.assertGreaterEqual(time.monotonic() - start, 0.18)
+            self.assertEqual(3, server.requests)
+
+    async def test__send_http_request_rate_limit_deadline(self):
+        # given
+        with MockDataHubServer(rows=2) as server:
+            async with AsyncEETCDataClient(
+                "test_api_key",
+                rate_limit=0.2,
+                rate_limit_burst=1,
+            ) as client:
+                client.base_url = server.base_url
+                await client.get_companies()
+                start = time.monotonic()
+
+                # when
+                # then
+                # the next token comes after 5 seconds, past the deadline
+                with self.assertRaises(DeadlineExceededError):
+                    await client.get_companies(index="S&P 500", deadline=0.5)
+
+            self.assertLess(time.monotonic() - start, 0.5)
+            self.assertEqual(1, server.requests)
+
+    async def test__send_http_request_timeout(self):
+        # given
+        with MockDataHubServer(latency=1.0) as server:
+            async with AsyncEETCDataClient(
+                "test_api_key",
+                retry_policy=RetryPolicy(max_attempts=1),
+            ) as client:
+                client.base_url = server.base_url
+
+                # when
+                # then
+                with self.assertRaises(RequestTimeoutError) as context:
+                    await client.get_companies(timeout=0.2)
+
+        self.assertNotIsInstance(context.exception, DeadlineExceededError)
+        self.assertIsInstance(context.exception, TimeoutError)
+
+    async def test__send_http_request_deadline(self):
+        # given
+        with MockDataHubServer(latency=1.0) as server:
+            async with AsyncEETCDataClient("test_api_key") as client:
+                client.base_url = server.base_url
+                start = time.monotonic()
+
+                # when
+                # then
+                with self.assertRaises(DeadlineExceededError):
+                    await client.get_companies(deadline=0.3)
+
+            self.assertLess(time.monotonic() - start, 1.0)
+
+    async def test__send_http_request_deadline_passed_while_queued(self):
+        # given
+        with MockDataHubServer(rows=2, latency=0.5) as server:
+            async with AsyncEETCDataClient(
+                "test_api_key",
+                concurrency=1,
+                retry_policy=RetryPolicy(max_attempts=1),
+            ) as client:
+                client.base_url = server.base_url
+
+                # when
+                results = await asyncio.gather(
+                    client.get_companies(),
+                    client.get_companies(index="S&P 500", deadline=0.2),
+                    return_exceptions=True,
+                )
+
+            # then
+            # the second request was never sent, so it did not time out
+            self.assertEqual(2, len(results[0]))
+            self.assertIs(DeadlineExceededError, type(results[1]))
+            self.assertEqual(1, server.requests)
@@ -0,0 +1,140 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pandas as pd
+from pandas._testing import assert_frame_equal
+
+from src.eetc_data_client.cache import PriceDataCache, ResponseCache
+
+
+class TestPriceDataCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = PriceDataCache(self.temp_dir.name, file_format="pickle")
+        self.df = pd.DataFrame(
+            {
+                "date": ["2012-04-26T00:00:00Z", "2012-04-27T00:00:00Z"],
+                "symbol": ["BRK/B", "BRK/B"],
+                "close": [21.7, 21.65],
+            }
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_save_and_load(self):
+        # given
+        self.cache.save("BRK/B", self.df, "2012-01-01")
+
+        # when
+        df, from_date = self.cache.load("BRK/B")
+
+        # then
+        assert_frame_equal(self.df, df)
+        self.assertEqual("2012-01-01", from_date)
+        self.assertIsNone(self.cache.load("AAPL"))
+
+    def test_invalidate(self):
+        # given
+        self.cache.save("AAPL", self.df, None)
+        self.cache.save("MSFT", self.df, None)
+
+        # when
+        self.cache.invalidate("AAPL")
+
+        # then
+        self.assertIsNone(self.cache.load("AAPL"))
+        self.assertIsNotNone(self.cache.load("MSFT"))
+
+        # when
+        self.cache.invalidate()
+
+        # then
+        self.assertEqual([], os.listdir(self.temp_dir.name))
+
+    def test_concurrent_saves(self):
+        # given
+        dfs = [self.df.assign(close=float(i)) for i in range(16)]
+
+        # when
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(lambda df: self.cache.save("AAPL", df, None), dfs))
+
+        # then
+        # every writer used its own temporary files
+        self.assertEqual(
+            ["AAPL.json", "AAPL.pickle"],
+            sorted(os.listdir(self.temp_dir.name)),
+        )
+        df, _ = self.cache.load("AAPL")
+        self.assertIn(df["close"][0], range(16))
+
+    def test_lock(self):
+        # given
+        # when
+        lock = self.cache.lock("AAPL")
+
+        # then
+        self.assertIs(lock, self.cache.lock("AAPL"))
+        self.assertIsNot(lock, self.cache.lock("MSFT"))
+
+    def test_unsupported_file_format(self):
+        # given
+        # when
+        # then
+        with self.assertRaises(ValueError):
+            PriceDataCache(self.temp_dir.name, file_format="csv")
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_ttl_expiry(self):
+        # given
+        cache = ResponseCache(ttl=60)
+
+        with mock.patch("time.monotonic", return_value=1000.0):
+            cache.set("key", {"Daily": []})
+
+        # when
+        with mock.patch("time.monotonic", return_value=1059.0):
+            fresh = cache.get("key")
+
+        with mock.patch("time.monotonic", return_value=1061.0):
+            expired = cache.get("key")
+
+        # then
+        self.assertEqual((True, {"Daily": []}), fresh)
+        self.assertEqual((False, None), expired)
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(0, len(cache))
+
+    def test_lru_eviction(self):
+        # given
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # when
+        cache.get("a")
+        cache.set("c", 3)
+
+        # then
+        self.assertEqual((True, 1), cache.get("a"))
+        self.assertEqual((False, None), cache.get("b"))
+        self.assertEqual((True, 3), cache.get("c"))
+
+    def test_invalidate(self):
+        # given
+        cache = ResponseCache()
+        cache.set(("companies", 1), 1)
+        cache.set(("price", 2), 2)
+
+        # when
+        cache.invalidate(lambda key: key[0] == "companies")
+
+        # then
+        self.assertEqual((False, None), cache.get(("companies", 1)))
+        self.assertEqual((True, 2), cache.get(("price", 2)))
@@ -1,11 +1,28 @@
+import importlib.util
+import json
+import os
+import tempfile
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 from unittest.mock import MagicMock
 
 import pandas as pd
-from pandas._testing import assert_frame_equal
+import requests
+from pandas._testing import assert_frame_equal, assert_index_equal
 
+from benchmarks.mock_server import MockDataHubServer
 from src.eetc_data_client.client import EETCDataClient
+from src.eetc_data_client.exceptions import (
+    DeadlineExceededError,
+    RequestTimeoutError,
+)
+from src.eetc_data_client.retry import RetryPolicy
+from src.eetc_data_client.schemas import (
+    FUNDAMENTALS_DATA_FIELDS,
+    FUNDAMENTALS_VALUE_FIELDS,
+)
 
 
 class TestEETCDataClient(unittest.TestCase):
@@ -18,7 +35,8 @@ class TestEETCDataClient(unittest.TestCase):
     def setUp(self):
         # set up a custom method for checking pandas DataFrame equality
         self.addTypeEqualityFunc(pd.DataFrame, self.assertDataFrameEqual)
-        self.eetc_data_client = EETCDataClient("test_api_key")
+        # mocked responses only implement Response.json()
+        self.eetc_data_client = EETCDataClient("test_api_key", json_loads=None)
 
     def test_get_price_data(self):
         # given
@@ -64,6 +82,237 @@ class TestEETCDataClient(unittest.TestCase):
         # then
         self.assertEqual(data, expected)
 
+    @unittest.skipIf(importlib.util.find_spec("pyarrow") is None, "no pyarrow")
+    def test_get_price_data_output_arrow(self):
+        # given
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        records = [
+            {
+                "date": "2012-04-27T00:00:00Z",
+                "symbol": "AAPL",
+                "open": 21.85,
+                "high": 21.95,
+                "low": 21.61,
+                "close": 21.65,
+                "volume": 403036400.0,
+                "name": "Apple Inc.",
+            },
+            {
+                "date": "2012-04-26T00:00:00Z",
+                "symbol": "AAPL",
+                "open": 21.94,
+                "high": 21.95,
+                "low": 21.5,
+                "close": 21.7,
+                "volume": 536068400.0,
+                "name": "Apple Inc.",
+            },
+        ]
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json = MagicMock(return_value=records)
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            return_value=mock_response,
+        ), tempfile.TemporaryDirectory() as cache_dir:
+            table = self.eetc_data_client.get_price_data("AAPL", output="arrow")
+            path = self.eetc_data_client.get_price_data(
+                "AAPL",
+                output="parquet",
+                path=f"{cache_dir}/AAPL.parquet",
+            )
+            parquet_table = pq.read_table(path)
+
+        # then
+        self.assertIsInstance(table, pa.Table)
+        self.assertEqual(
+            self.eetc_data_client._price_data_to_df(records).reset_index(drop=True),
+            table.to_pandas(),
+        )
+        self.assertTrue(table.equals(parquet_table))
+
+    @unittest.skipIf(importlib.util.find_spec("polars") is None, "no polars")
+    def test_get_indicator_data_output_polars(self):
+        # given
+        import polars as pl
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json = MagicMock(
+            return_value=[
+                {
+                    "date": "2022-01-01T00:00:00Z",
+                    "name": "US Real GDP",
+                    "value": 2.1,
+                    "frequency": "Yearly",
+                },
+                {
+                    "date": "2021-01-01T00:00:00Z",
+                    "name": "US Real GDP",
+                    "value": 5.9,
+                    "frequency": "Yearly",
+                },
+            ],
+        )
+        client = EETCDataClient("test_api_key", json_loads=None, output="polars")
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            return_value=mock_response,
+        ):
+            df = client.get_indicator_data("US Real GDP", typed=True)
+            pandas_df = client.get_indicator_data("US Real GDP", output="pandas")
+
+        # then
+        self.assertIsInstance(df, pl.DataFrame)
+        self.assertEqual(pl.Datetime("ns", "UTC"), df.schema["date"])
+        self.assertEqual([5.9, 2.1], df["value"].to_list())
+        # the per-call output overrides the client's
+        self.assertIsInstance(pandas_df, pd.DataFrame)
+
+    def test_get_price_data_output_invalid(self):
+        # given
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+        ) as send_http_request:
+            # then
+            with self.assertRaises(ValueError):
+                self.eetc_data_client.get_price_data("AAPL", output="csv")
+
+            with self.assertRaises(ValueError):
+                self.eetc_data_client.get_fundamentals_data("AAPL", output="parquet")
+
+        send_http_request.assert_not_called()
+
+    def test_get_indicator_data_sort_order(self):
+        # given
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json = MagicMock(
+            return_value=[
+                {
+                    "date": "2022-01-01T00:00:00Z",
+                    "name": "US Real GDP",
+                    "value": 2.1,
+                    "frequency": "Yearly",
+                },
+                {
+                    "date": "2021-01-01T00:00:00Z",
+                    "name": "US Real GDP",
+                    "value": 5.9,
+                    "frequency": "Yearly",
+                },
+            ],
+        )
+        client = EETCDataClient(
+            "test_api_key",
+            json_loads=None,
+            sort_order="descending",
+        )
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            return_value=mock_response,
+        ):
+            descending_df = client.get_indicator_data("US Real GDP")
+            ascending_df = client.get_indicator_data(
+                "US Real GDP",
+                sort_order="ascending",
+            )
+            unsorted_df = client.get_indicator_data(
+                "US Real GDP",
+                sort_order="unsorted",
+            )
+
+        # then
+        # the server's descending order is kept without sorting
+        self.assertEqual([0, 1], descending_df.index.tolist())
+        self.assertEqual([2.1, 5.9], descending_df["value"].tolist())
+        self.assertEqual([5.9, 2.1], ascending_df["value"].tolist())
+        self.assertEqual([2.1, 5.9], unsorted_df["value"].tolist())
+
+    def test_get_price_data_sort_order_invalid(self):
+        # given
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+        ) as send_http_request:
+            # then
+            with self.assertRaises(ValueError):
+                self.eetc_data_client.get_price_data("AAPL", sort_order="newest")
+
+            with self.assertRaises(ValueError):
+                EETCDataClient("test_api_key", sort_order="newest")
+
+        send_http_request.assert_not_called()
+
+    def test_get_fundamentals_data_fields(self):
+        # given
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json = MagicMock(
+            return_value=[
+                {
+                    "symbol": "AAPL",
+                    "year": 2021,
+                    "quarter": 4,
+                    "name": "Apple Inc.",
+                    "revenue": 123.9,
+                    "ebit": 41.5,
+                    "cogs": 69.7,
+                },
+            ],
+        )
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            return_value=mock_response,
+        ) as send_http_request:
+            df = self.eetc_data_client.get_fundamentals_data(
+                "AAPL",
+                fields=["revenue", "ebit"],
+            )
+            records = self.eetc_data_client.get_fundamentals_data(
+                "AAPL",
+                as_json=True,
+                fields=["revenue"],
+            )
+
+        # then
+        self.assertEqual(
+            ["symbol", "year", "quarter", "revenue", "ebit"],
+            df.columns.tolist(),
+        )
+        self.assertEqual(
+            [{"symbol": "AAPL", "year": 2021, "quarter": 4, "revenue": 123.9}],
+            records,
+        )
+        # fields are only sent to the server with forward_fields=True
+        self.assertEqual({}, send_http_request.call_args[0][1])
+
+    def test_get_price_data_forward_fields(self):
+        # given
+        client = EETCDataClient("test_api_key", typed=True, forward_fields=True)
+
+        with MockDataHubServer(rows=5) as server:
+            client.base_url = server.base_url
+
+            # when
+            df = client.get_price_data("AAPL", fields=["close"])
+
+        # then
+        self.assertEqual("date", df.index.name)
+        self.assertEqual(["close"], df.columns.tolist())
+        self.assertEqual({"fields": "date,close"}, client.transfer_log[-1]["params"])
+
     def test_get_price_data_as_json(self):
         # given
         mock_response = MagicMock()
@@ -910,8 +1159,1269 @@ class TestEETCDataClient(unittest.TestCase):
         # then
         self.assertEqual(expected, data)
 
-    def test__send_http_request(self):
+    def test_get_price_data_typed(self):
         # given
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json = MagicMock(
+            return_value=[
+                {
+                    "date": "2012-04-27T00:00:00Z",
+                    "symbol": "AAPL",
+                    "open": 21.85,
+                    "high": 21.91,
+                    "low": 21.61,
+                    "close": 21.65,
+                    "volume": 403036400.0,
+                    "name": "Apple Inc.",
+                },
+                {
+                    "date": "2012-04-26T00:00:00Z",
+                    "symbol": "AAPL",
+                    "open": 21.94,
+                    "high": 21.95,
+                    "low": 21.5,
+                    "close": 21.7,
+                    "volume": 536068400.0,
+                    "name": "Apple Inc.",
+                },
+            ],
+        )
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            return_value=mock_response,
+        ):
+            data = self.eetc_data_client.get_price_data("AAPL", typed=True)
+
+        # then
+        assert_index_equal(
+            pd.DatetimeIndex(["2012-04-26", "2012-04-27"], tz="UTC", name="date"),
+            data.index,
+        )
+        self.assertEqual([21.7, 21.65], data["close"].tolist())
+        self.assertEqual("category", data["symbol"].dtype)
+
+    def test_iter_price_data(self):
+        # given
+        def send_http_request(url, params, timeout=None, deadline_at=None):
+            # one row per window, except for the empty middle window
+            records = []
+
+            if params["from_date"] != "2012-04-21":
+                records.append(
+                    {
+                        "date": f"{params['to_date']}T00:00:00Z",
+                        "symbol": "AAPL",
+                        "open": 21.94,
+                        "high": 21.95,
+                        "low": 21.5,
+                        "close": 21.7,
+                        "volume": 536068400.0,
+                        "name": "Apple Inc.",
+                    }
+                )
+
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json = MagicMock(return_value=records)
+            return mock_response
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            side_effect=send_http_request,
+        ) as send_http_request_mock:
+            chunks = list(
+                self.eetc_data_client.iter_price_data(
+                    "AAPL",
+                    "2012-04-16",
+                    "2012-04-30",
+                    chunk_days=5,
+                )
+            )
+            json_chunks = list(
+                self.eetc_data_client.iter_price_data(
+                    "AAPL",
+                    "2012-04-16",
+                    "2012-04-30",
+                    chunk_days=5,
+                    prefetch=False,
+                    as_json=True,
+                )
+            )
+
+        # then
+        self.assertEqual(
+            [
+                {"from_date": "2012-04-16", "to_date": "2012-04-20"},
+                {"from_date": "2012-04-21", "to_date": "2012-04-25"},
+                {"from_date": "2012-04-26", "to_date": "2012-04-30"},
+            ],
+            [c.args[1] for c in send_http_request_mock.call_args_list[:3]],
+        )
+        self.assertEqual(2, len(chunks))
+        self.assertEqual(["2012-04-20T00:00:00Z"], chunks[0]["date"].tolist())
+        self.assertEqual(["2012-04-30T00:00:00Z"], chunks[1]["date"].tolist())
+        self.assertEqual(
+            [chunk["date"].tolist() for chunk in chunks],
+            [[record["date"] for record in chunk] for chunk in json_chunks],
+        )
+
+    def test_get_price_data_split_days(self):
+        # given
+        def send_http_request(url, params, timeout=None, deadline_at=None):
+            # every window also returns the row of the previous window's end
+            records = [
+                {
+                    "date": f"{day}T00:00:00Z",
+                    "symbol": "AAPL",
+                    "open": 21.94,
+                    "high": 21.95,
+                    "low": 21.5,
+                    "close": 21.7,
+                    "volume": 536068400.0,
+                    "name": "Apple Inc.",
+                }
+                for day in ("2012-04-20", params["to_date"])
+            ]
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json = MagicMock(return_value=records)
+            return mock_response
+
+        client = EETCDataClient(
+            "test_api_key",
+            json_loads=None,
+            split_days={"price": 5},
+        )
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            side_effect=send_http_request,
+        ) as send_http_request_mock:
+            data = client.get_price_data(
+                "AAPL",
+                from_date="2012-04-16",
+                to_date="2012-04-30",
+            )
+            unsplit_calls = send_http_request_mock.call_count
+            client.get_price_data(
+                "AAPL",
+                from_date="2012-04-16",
+                to_date="2012-04-30",
+                split_days=0,
+            )
+
+        # then
+        self.assertEqual(3, unsplit_calls)
+        self.assertEqual(4, send_http_request_mock.call_count)
+        self.assertEqual(
+            [
+                "2012-04-20T00:00:00Z",
+                "2012-04-25T00:00:00Z",
+                "2012-04-30T00:00:00Z",
+            ],
+            data["date"].tolist(),
+        )
+
+    def test_get_indicator_data_split_days(self):
+        # given
+        def send_http_request(url, params, timeout=None, deadline_at=None):
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json = MagicMock(
+                return_value=[
+                    {
+                        "date": f"{params['from_date']}T00:00:00Z",
+                        "name": "US Real GDP",
+                        "value": -3.4,
+                        "frequency": "Yearly",
+                    },
+                ],
+            )
+            return mock_response
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            side_effect=send_http_request,
+        ):
+            data = self.eetc_data_client.get_indicator_data(
+                "US Real GDP",
+                "Yearly",
+                from_date="2020-01-01",
+                to_date="2020-01-09",
+                split_days=3,
+            )
+
+        # then
+        self.assertEqual(
+            [
+                "2020-01-01T00:00:00Z",
+                "2020-01-04T00:00:00Z",
+                "2020-01-07T00:00:00Z",
+            ],
+            data["date"].tolist(),
+        )
+
+    def test_get_price_data_bulk(self):
+        # given
+        def send_http_request(url, params, timeout=None, deadline_at=None):
+            symbol = url.split("symbol=")[1]
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json = MagicMock(
+                return_value=[
+                    {
+                        "date": "2012-04-26T00:00:00Z",
+                        "symbol": symbol,
+                        "open": 21.94,
+                        "high": 21.95,
+                        "low": 21.5,
+                        "close": 21.7,
+                        "volume": 536068400.0,
+                        "name": f"{symbol} Inc.",
+                    },
+                ],
+            )
+            return mock_response
+
+        symbols = ["MSFT", "AAPL"]
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            side_effect=send_http_request,
+        ):
+            data, failures = self.eetc_data_client.get_price_data_bulk(symbols)
+            data_dict, _ = self.eetc_data_client.get_price_data_bulk(
+                symbols,
+                as_dict=True,
+            )
+
+        # then
+        self.assertEqual({}, failures)
+        self.assertEqual(["MSFT", "AAPL"], data["symbol"].tolist())
+        self.assertEqual([0, 1], data.index.tolist())
+        self.assertEqual(["MSFT", "AAPL"], list(data_dict.keys()))
+        self.assertEqual(["AAPL Inc."], data_dict["AAPL"]["name"].tolist())
+
+    def test_get_price_data_bulk_reports_failures(self):
+        # given
+        def send_http_request(url, params, timeout=None, deadline_at=None):
+            if url.endswith("=BAD"):
+                raise requests.HTTPError("404 Client Error")
+
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json = MagicMock(
+                return_value=[
+                    {
+                        "date": "2012-04-26T00:00:00Z",
+                        "symbol": "AAPL",
+                        "open": 21.94,
+                        "high": 21.95,
+                        "low": 21.5,
+                        "close": 21.7,
+                        "volume": 536068400.0,
+                        "name": "Apple Inc.",
+                    },
+                ],
+            )
+            return mock_response
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            side_effect=send_http_request,
+        ):
+            data, failures = self.eetc_data_client.get_price_data_bulk(
+                ["AAPL", "BAD"],
+                from_date="2012-01-01",
+            )
+
+        # then
+        self.assertEqual(["AAPL"], data["symbol"].tolist())
+        self.assertEqual(["BAD"], list(failures.keys()))
+        self.assertIsInstance(failures["BAD"], requests.HTTPError)
+
+    def test_get_fundamentals_panel(self):
+        # given
+        def send_http_request(url, params, timeout=None, deadline_at=None):
+            symbol = url.split("symbol=")[1].split("&")[0]
+
+            if symbol == "BAD":
+                raise requests.HTTPError("404 Client Error")
+
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json = MagicMock(
+                return_value=[
+                    {"symbol": symbol, "year": year, "quarter": 1, "revenue": 1.5}
+                    for year in (2020, 2021, 2022)
+                ],
+            )
+            return mock_response
+
         # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            side_effect=send_http_request,
+        ) as send_http_request_mock:
+            df, failures = self.eetc_data_client.get_fundamentals_panel(
+                ["AAPL", "MSFT", "BAD"],
+                from_year=2021,
+            )
+            panel, _ = self.eetc_data_client.get_fundamentals_panel(
+                ["AAPL"],
+                from_year=2022,
+                to_year=2022,
+                as_array=True,
+            )
+
+        # then
+        self.assertEqual(
+            [
+                ("AAPL", 2021, 1),
+                ("AAPL", 2022, 1),
+                ("MSFT", 2021, 1),
+                ("MSFT", 2022, 1),
+            ],
+            df.index.tolist(),
+        )
+        self.assertEqual([1.5] * 4, df["revenue"].tolist())
+        self.assertEqual(["BAD"], list(failures.keys()))
+        self.assertIsInstance(failures["BAD"], requests.HTTPError)
+        # a single year is requested from the API
+        self.assertEqual({"year": 2022}, send_http_request_mock.call_args[0][1])
+        self.assertEqual((1, 1, len(FUNDAMENTALS_VALUE_FIELDS)), panel.values.shape)
+
+    def test_get_indicator_data_bulk(self):
+        # given
+        series = {
+            "US Real GDP": [("2021-01-01", 5.9), ("2022-01-01", 2.1)],
+            "US CPI": [("2021-12-01", 7.0), ("2022-01-01", 7.5), ("2022-02-01", 7.9)],
+        }
+
+        def send_http_request(url, params, timeout=None, deadline_at=None):
+            name = url.split("name=")[1]
+
+            if name not in series:
+                raise requests.HTTPError("404 Client Error")
+
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json = MagicMock(
+                return_value=[
+                    {"date": f"{date}T00:00:00Z", "name": name, "value": value}
+                    for date, value in series[name]
+                ],
+            )
+            return mock_response
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            side_effect=send_http_request,
+        ):
+            df, failures = self.eetc_data_client.get_indicator_data_bulk(
+                ["US Real GDP", "US CPI", "BAD"],
+            )
+            filled_df, _ = self.eetc_data_client.get_indicator_data_bulk(
+                ["US Real GDP", "US CPI"],
+                align="ffill",
+            )
+
+        # then
+        assert_index_equal(
+            pd.DatetimeIndex(
+                ["2021-01-01", "2021-12-01", "2022-01-01", "2022-02-01"],
+                tz="UTC",
+                name="date",
+            ),
+            df.index,
+        )
+        self.assertEqual(["US Real GDP", "US CPI"], df.columns.tolist())
+        self.assertEqual([5.9, 2.1], df["US Real GDP"].dropna().tolist())
+        self.assertTrue(pd.isna(df.loc["2021-12-01", "US Real GDP"]))
+        self.assertEqual(["BAD"], list(failures.keys()))
+        self.assertIsInstance(failures["BAD"], requests.HTTPError)
+        self.assertEqual([5.9, 5.9, 2.1, 2.1], filled_df["US Real GDP"].tolist())
+
+    def test_get_indicator_data_bulk_align_auto(self):
+        # given
+        with MockDataHubServer(rows=24) as server:
+            self.eetc_data_client.base_url = server.base_url
+
+            # when
+            with mock.patch.object(
+                self.eetc_data_client,
+                "get_indicators",
+                return_value={
+                    "Daily": ["Daily Indicator 0"],
+                    "Monthly": ["Monthly Indicator 0"],
+                },
+            ):
+                df, failures = self.eetc_data_client.get_indicator_data_bulk(
+                    ["Daily Indicator 0", "Monthly Indicator 0"],
+                    align="auto",
+                )
+
+        # then
+        # the stand-in server returns 24 daily values for every indicator,
+        # which are resampled to the monthly indicator's frequency
+        assert_index_equal(
+            pd.DatetimeIndex(["1950-01-01"], tz="UTC", name="date"),
+            df.index,
+        )
+        self.assertEqual({}, failures)
+
+    def test_get_indicator_data_bulk_align_auto_get_indicators_fails(self):
+        # given
+        with MockDataHubServer(rows=24) as server:
+            self.eetc_data_client.base_url = server.base_url
+
+            # when
+            with mock.patch.object(
+                self.eetc_data_client,
+                "get_indicators",
+                side_effect=requests.HTTPError("503 Server Error"),
+            ):
+                df, failures = self.eetc_data_client.get_indicator_data_bulk(
+                    ["Daily Indicator 0", "Monthly Indicator 0"],
+                    align="auto",
+                )
+
+        # then
+        # the indicators are forward filled instead of resampled
+        self.assertEqual(24, len(df))
+        self.assertFalse(df.isna().any().any())
+        self.assertEqual({}, failures)
+
+    def test_get_indicator_data_bulk_align_invalid(self):
+        # given
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+        ) as send_http_request:
+            # then
+            with self.assertRaises(ValueError):
+                self.eetc_data_client.get_indicator_data_bulk(
+                    ["US Real GDP"],
+                    align="Hourly",
+                )
+
+        send_http_request.assert_not_called()
+
+    def test_get_price_data_with_cache_dir(self):
+        # given
+        def price_record(date, close):
+            return {
+                "date": f"{date}T00:00:00Z",
+                "symbol": "AAPL",
+                "open": close,
+                "high": close,
+                "low": close,
+                "close": close,
+                "volume": 1000.0,
+                "name": "Apple Inc.",
+            }
+
+        def mock_response(records):
+            response = MagicMock()
+            response.status_code = 200
+            response.json = MagicMock(return_value=records)
+            return response
+
+        responses = [
+            # initial fetch
+            mock_response(
+                [
+                    price_record("2012-04-25", 21.0),
+                    price_record("2012-04-26", 21.5),
+                ]
+            ),
+            # top-up from the latest cached date
+            mock_response(
+                [
+                    price_record("2012-04-26", 21.7),
+                    price_record("2012-04-27", 21.65),
+                ]
+            ),
+            # gap before the earliest cached date
+            mock_response([price_record("2012-04-24", 20.9)]),
+            # top-up from the latest cached date
+            mock_response([price_record("2012-04-27", 21.65)]),
+        ]
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = EETCDataClient(
+                "test_api_key",
+                cache_dir=cache_dir,
+                json_loads=None,
+            )
+
+            # when
+            with mock.patch(
+                "src.eetc_data_client.client.EETCDataClient._send_http_request",
+                side_effect=responses,
+            ) as send_http_request:
+                first = client.get_price_data("AAPL", from_date="2012-04-25")
+                second = client.get_price_data("AAPL", from_date="2012-04-25")
+                third = client.get_price_data("AAPL", as_json=True)
+                fourth = client.get_price_data(
+                    "AAPL",
+                    from_date="2012-04-25",
+                    to_date="2012-04-25",
+                )
+
+        # then
+        params = [c.args[1] for c in send_http_request.call_args_list]
+        self.assertEqual(
+            [
+                {"from_date": "2012-04-25"},
+                {"from_date": "2012-04-26"},
+                {"to_date": "2012-04-25"},
+                {"from_date": "2012-04-27"},
+            ],
+            params,
+        )
+        self.assertEqual([21.0, 21.5], first["close"].tolist())
+        self.assertEqual([21.0, 21.7, 21.65], second["close"].tolist())
+        self.assertEqual([20.9, 21.0, 21.7, 21.65], [r["close"] for r in third])
+        self.assertEqual([21.0], fourth["close"].tolist())
+
+    def test_get_price_data_with_cache_dir_concurrent(self):
+        # given
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        client = EETCDataClient("test_api_key", cache_dir=cache_dir.name)
+
+        # when
+        with MockDataHubServer(rows=500) as server, ThreadPoolExecutor(
+            max_workers=16
+        ) as executor:
+            client.base_url = server.base_url
+
+            for _ in range(5):
+                futures = [
+                    executor.submit(client.get_price_data, "SPY") for _ in range(16)
+                ]
+                results = [future.result() for future in futures]
+
+            client.close()
+
+        # then
+        self.assertEqual(500, len(results[0]))
+
+        for df in results:
+            self.assertEqual(results[0], df)
+
+        # no temporary files are left behind
+        self.assertEqual(
+            ["SPY.json", "SPY.parquet"], sorted(os.listdir(cache_dir.name))
+        )
+
+    def test_response_cache(self):
+        # given
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json = MagicMock(return_value={"Yearly": ["US Real GDP"]})
+        client = EETCDataClient(
+            "test_api_key",
+            response_cache_ttl=60,
+            json_loads=None,
+        )
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            return_value=mock_response,
+        ) as send_http_request:
+            first = client.get_indicators()
+            second = client.get_indicators()
+            client.get_price_data("AAPL", as_json=True)
+            client.get_price_data("AAPL", as_json=True)
+            client.invalidate_response_cache("indicators/names")
+            client.get_indicators()
+
+        # then
+        self.assertEqual({"Yearly": ["US Real GDP"]}, first)
+        self.assertEqual(first, second)
+        # price data is not cached unless cache_data_endpoints is set
+        self.assertEqual(4, send_http_request.call_count)
+        self.assertEqual(
+            {"hits": 1, "misses": 2, "entries": 1},
+            client.response_cache_info,
+        )
+
+    def test_get_indicators_coalesced(self):
+        # given
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json = MagicMock(return_value={"Yearly": ["US Real GDP"]})
+        records = []
+        client = EETCDataClient("test_api_key", json_loads=None, hooks=[records.append])
+
+        def send_http_request(url, params, timeout=None, deadline_at=None):
+            time.sleep(0.2)
+            return mock_response
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            side_effect=send_http_request,
+        ) as mock_send, ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(client.get_indicators) for _ in range(4)]
+            results = [future.result() for future in futures]
+
+        # then
+        self.assertEqual(1, mock_send.call_count)
+        self.assertEqual([{"Yearly": ["US Real GDP"]}] * 4, results)
+        self.assertEqual({"flights": 1, "coalesced": 3}, client.coalescing_info)
+        self.assertEqual([0, 1, 1, 1], sorted(r["coalesced"] for r in records))
+
+        # every caller gets its own copy
+        results[0]["Yearly"].append("US CPI")
+        self.assertEqual([{"Yearly": ["US Real GDP"]}] * 3, results[1:])
+
+    def test_get_price_data_json_coalesced(self):
+        # given
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json = MagicMock(
+            return_value=[{"date": "2020-01-01T00:00:00Z", "close": 1.0}]
+        )
+        client = EETCDataClient(
+            "test_api_key",
+            response_cache_ttl=60,
+            cache_data_endpoints=True,
+            json_loads=None,
+        )
+
+        def send_http_request(url, params, timeout=None, deadline_at=None):
+            time.sleep(0.2)
+            return mock_response
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            side_effect=send_http_request,
+        ) as mock_send, ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(client.get_price_data, "AAPL", as_json=True)
+                for _ in range(2)
+            ]
+            results = [future.result() for future in futures]
+            results[0][0]["close"] = 2.0
+            cached = client.get_price_data("AAPL", as_json=True)
+
+        # then
+        # neither the other caller nor the response cache see the change
+        self.assertEqual(1, mock_send.call_count)
+        self.assertEqual(1.0, results[1][0]["close"])
+        self.assertEqual(1.0, cached[0]["close"])
+
+    def test_get_price_data_as_json_not_shared(self):
+        # given
+        records = [{"date": "2020-01-01T00:00:00Z", "close": 1.0}]
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json = MagicMock(return_value=records)
+        client = EETCDataClient("test_api_key", json_loads=None)
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            return_value=mock_response,
+        ):
+            data = client.get_price_data("AAPL", as_json=True)
+
+        # then
+        # records shared with nobody are not copied
+        self.assertIs(records, data)
+
+    def test_get_indicators_coalesced_deadline(self):
+        # given
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json = MagicMock(return_value={"Yearly": ["US Real GDP"]})
+
+        def send_http_request(url, params, timeout=None, deadline_at=None):
+            time.sleep(0.3)
+            return mock_response
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            side_effect=send_http_request,
+        ) as mock_send, ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self.eetc_data_client.get_indicators)
+            time.sleep(0.05)
+
+            # then
+            # the waiting call keeps its own deadline
+            with self.assertRaises(DeadlineExceededError):
+                self.eetc_data_client.get_indicators(deadline=0.05)
+
+            self.assertEqual({"Yearly": ["US Real GDP"]}, future.result())
+
+        self.assertEqual(1, mock_send.call_count)
+
+    def test_coalesce_disabled(self):
+        # given
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json = MagicMock(return_value=[])
+        client = EETCDataClient("test_api_key", json_loads=None, coalesce=False)
+
+        def send_http_request(url, params, timeout=None, deadline_at=None):
+            time.sleep(0.1)
+            return mock_response
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            side_effect=send_http_request,
+        ) as mock_send, ThreadPoolExecutor(max_workers=2) as executor:
+            for _ in range(2):
+                executor.submit(client.get_companies)
+
+        # then
+        self.assertEqual(2, mock_send.call_count)
+        self.assertEqual({"flights": 0, "coalesced": 0}, client.coalescing_info)
+
+    def test_json_loads(self):
+        # given
+        response_data = [
+            {
+                "date": "2020-01-01T00:00:00Z",
+                "name": "US Real GDP",
+                "value": -3.4,
+                "frequency": "Yearly",
+            },
+        ]
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(response_data).encode()
+        json_loads = MagicMock(side_effect=json.loads)
+        client = EETCDataClient("test_api_key", json_loads=json_loads)
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            return_value=mock_response,
+        ):
+            data = client.get_indicator_data("US Real GDP", as_json=True)
+
+        # then
+        self.assertEqual(response_data, data)
+        json_loads.assert_called_once_with(mock_response.content)
+        mock_response.json.assert_not_called()
+
+    def test__send_http_request(self):
+        # given
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        url = f"{self.eetc_data_client.base_url}/price/?symbol=AAPL"
+        params = {"from_date": "2022-01-01"}
+
+        # when
+        with mock.patch.object(
+            self.eetc_data_client.session,
+            "get",
+            return_value=mock_response,
+        ) as mock_get:
+            response = self.eetc_data_client._send_http_request(url, params)
+
+        # then
+        mock_get.assert_called_once_with(
+            url,
+            params=params,
+            timeout=(5.0, 60.0),
+            headers=None,
+            stream=True,
+        )
+        self.assertEqual(mock_response, response)
+        self.assertEqual(
+            "test_api_key",
+            self.eetc_data_client.session.headers["EETC-API-Key"],
+        )
+
+    def test__send_http_request_raises_for_status(self):
+        # given
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_response.raise_for_status = MagicMock(
+            side_effect=requests.HTTPError("404 Client Error"),
+        )
+        url = f"{self.eetc_data_client.base_url}/indicators/names/"
+
+        # when
+        with mock.patch.object(
+            self.eetc_data_client.session,
+            "get",
+            return_value=mock_response,
+        ):
+            # then
+            with self.assertRaises(requests.HTTPError):
+                self.eetc_data_client._send_http_request(url, {})
+
+    def test__send_http_request_retries(self):
+        # given
+        unavailable_response = MagicMock()
+        unavailable_response.status_code = 503
+        unavailable_response.headers = {"Retry-After": "2"}
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        url = f"{self.eetc_data_client.base_url}/indicators/names/"
+
+        # when
+        with mock.patch.object(
+            self.eetc_data_client.session,
+            "get",
+            side_effect=[
+                requests.ConnectionError("Connection reset by peer"),
+                unavailable_response,
+                mock_response,
+            ],
+        ) as mock_get, mock.patch("time.sleep") as sleep:
+            response = self.eetc_data_client._send_http_request(url, {})
+
+        # then
+        self.assertEqual(mock_response, response)
+        self.assertEqual(3, mock_get.call_count)
+        self.assertEqual(2, sleep.call_count)
+        # the Retry-After header overrides the backoff
+        sleep.assert_called_with(2.0)
+        self.assertEqual(
+            {"retries": 2, "retried_requests": 1, "exhausted": 0},
+            self.eetc_data_client.retry_stats,
+        )
+
+    def test__send_http_request_retries_exhausted(self):
+        # given
+        mock_response = MagicMock()
+        mock_response.status_code = 429
+        mock_response.headers = {}
+        mock_response.raise_for_status = MagicMock(
+            side_effect=requests.HTTPError("429 Too Many Requests"),
+        )
+        client = EETCDataClient(
+            "test_api_key",
+            retry_policy=RetryPolicy(max_attempts=4),
+        )
+        url = f"{client.base_url}/indicators/names/"
+
+        # when
+        with mock.patch.object(
+            client.session,
+            "get",
+            return_value=mock_response,
+        ) as mock_get, mock.patch("time.sleep"):
+            # then
+            with self.assertRaises(requests.HTTPError):
+                client._send_http_request(url, {})
+
+        self.assertEqual(4, mock_get.call_count)
+        self.assertEqual(
+            {"retries": 3, "retried_requests": 1, "exhausted": 1},
+            client.retry_stats,
+        )
+
+    def test__send_http_request_rate_limit(self):
+        # given
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        client = EETCDataClient("test_api_key", rate_limit=5, rate_limit_burst=10)
+        url = f"{client.base_url}/indicators/names/"
+
+        # when
+        with mock.patch.object(
+            client.session,
+            "get",
+            return_value=mock_response,
+        ), mock.patch.object(client.rate_limiter, "acquire") as acquire:
+            client._send_http_request(url, {})
+            client._send_http_request(url, {})
+
+        # then
+        self.assertEqual(2, acquire.call_count)
+        self.assertEqual(5, client.rate_limiter.rate)
+        self.assertEqual(10, client.rate_limiter.burst)
+
+    def test__send_http_request_rate_limit_deadline(self):
+        # given
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json = MagicMock(return_value=[])
+        client = EETCDataClient(
+            "test_api_key",
+            rate_limit=0.2,
+            rate_limit_burst=1,
+            json_loads=None,
+        )
+
+        # when
+        with mock.patch.object(
+            client.session,
+            "get",
+            return_value=mock_response,
+        ) as mock_get:
+            client.get_companies()
+            start = time.monotonic()
+
+            # then
+            # the next token comes after 5 seconds, past the deadline
+            with self.assertRaises(DeadlineExceededError):
+                client.get_companies(index="S&P 500", deadline=0.5)
+
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(1, mock_get.call_count)
+        # the token was not taken, the balance would be -1 otherwise
+        self.assertGreater(client.rate_limiter._tokens, -0.5)
+
+    def test__send_http_request_timeout(self):
+        # given
+        client = EETCDataClient(
+            "test_api_key",
+            timeout=2.0,
+            retry_policy=RetryPolicy(max_attempts=2),
+        )
+        url = f"{client.base_url}/indicators/names/"
+
+        # when
+        with mock.patch.object(
+            client.session,
+            "get",
+            side_effect=requests.ReadTimeout("Read timed out"),
+        ) as mock_get, mock.patch("time.sleep"):
+            # then
+            with self.assertRaises(RequestTimeoutError) as context:
+                client._send_http_request(url, {}, timeout=(1.0, 3.0))
+
+        self.assertIsInstance(context.exception, TimeoutError)
+        self.assertIsInstance(context.exception.__cause__, requests.ReadTimeout)
+        self.assertEqual(2, mock_get.call_count)
+        # the per-call timeout overrides the client's
+        self.assertEqual((1.0, 3.0), mock_get.call_args.kwargs["timeout"])
+
+    def test__send_http_request_body_timeout(self):
+        # given
+        client = EETCDataClient(
+            "test_api_key",
+            retry_policy=RetryPolicy(max_attempts=2, backoff_factor=0.01),
+        )
+
+        with MockDataHubServer(rows=5, stall=2.0) as server:
+            url = f"{server.base_url}/companies/"
+
+            # when
+            # then
+            with self.assertRaises(RequestTimeoutError) as context:
+                client._send_http_request(url, {}, timeout=(1.0, 0.3))
+
+            self.assertEqual(2, server.requests)
+
+        # the headers arrived in time, the body did not
+        self.assertIsInstance(context.exception.__cause__, requests.ReadTimeout)
+        self.assertEqual(
+            {"retries": 1, "retried_requests": 1, "exhausted": 1},
+            client.retry_stats,
+        )
+
+    def test__send_http_request_deadline(self):
+        # given
+        unavailable_response = MagicMock()
+        unavailable_response.status_code = 503
+        unavailable_response.headers = {"Retry-After": "10"}
+        client = EETCDataClient("test_api_key", deadline=3.0)
+        url = f"{client.base_url}/indicators/names/"
+
+        # when
+        with mock.patch.object(
+            client.session,
+            "get",
+            return_value=unavailable_response,
+        ) as mock_get, mock.patch("time.sleep") as sleep:
+            # then
+            with self.assertRaises(DeadlineExceededError):
+                client.get_indicators()
+
+        # the retry is not sent because its backoff would pass the deadline
+        self.assertEqual(1, mock_get.call_count)
+        sleep.assert_not_called()
+        connect_timeout, read_timeout = mock_get.call_args.kwargs["timeout"]
+        self.assertLessEqual(connect_timeout, 3.0)
+        self.assertLessEqual(read_timeout, 3.0)
+
+    def test_get_price_data_split_days_deadline(self):
+        # given
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json = MagicMock(return_value=[])
+        client = EETCDataClient("test_api_key", max_workers=1, json_loads=None)
+
+        def get(url, **kwargs):
+            time.sleep(0.2)
+            return mock_response
+
+        # when
+        with mock.patch.object(client.session, "get", side_effect=get) as mock_get:
+            # then
+            with self.assertRaises(DeadlineExceededError):
+                client.get_price_data(
+                    "AAPL",
+                    from_date="2020-01-01",
+                    to_date="2020-01-15",
+                    split_days=5,
+                    deadline=0.3,
+                )
+
+        # one deadline covers all split date ranges
+        self.assertEqual(2, mock_get.call_count)
+
+    def test_get_fundamentals_data_revalidate(self):
+        # given
+        with MockDataHubServer(rows=8) as server:
+            client = EETCDataClient("test_api_key", revalidate=True)
+            client.base_url = server.base_url
+
+            # when
+            first_df = client.get_fundamentals_data("AAPL")
+            first_bytes_sent = server.bytes_sent
+            second_df = client.get_fundamentals_data("AAPL")
+            second_bytes_sent = server.bytes_sent - first_bytes_sent
+            client.close()
+
+        # then
+        self.assertEqual(first_df, second_df)
+        self.assertEqual((8, len(FUNDAMENTALS_DATA_FIELDS)), first_df.shape)
+        self.assertGreater(first_bytes_sent, 10000)
+        # the unchanged data was answered with an empty "304 Not Modified"
+        self.assertEqual(0, second_bytes_sent)
+        self.assertEqual(
+            {"not_modified": 1, "modified": 0, "entries": 1},
+            client.revalidation_info,
+        )
+
+    def test_get_fundamentals_data_revalidate_as_json(self):
+        # given
+        with MockDataHubServer(rows=2) as server:
+            client = EETCDataClient("test_api_key", revalidate=True)
+            client.base_url = server.base_url
+
+            # when
+            first = client.get_fundamentals_data("AAPL", as_json=True)
+            first[0]["revenue"] = None
+            second = client.get_fundamentals_data("AAPL", as_json=True)
+            client.close()
+
+        # then
+        # the data kept for revalidation is not changed through the first
+        # call's records
+        self.assertIsNotNone(second[0]["revenue"])
+        self.assertEqual(
+            {"not_modified": 1, "modified": 0, "entries": 1},
+            client.revalidation_info,
+        )
+
+    def test_get_companies_without_revalidate(self):
+        # given
+        with MockDataHubServer(rows=5) as server:
+            client = EETCDataClient("test_api_key")
+            client.base_url = server.base_url
+
+            # when
+            client.get_companies()
+            first_bytes_sent = server.bytes_sent
+            client.get_companies()
+            client.close()
+
+        # then
+        self.assertEqual(2 * first_bytes_sent, server.bytes_sent)
+        self.assertEqual(
+            {"not_modified": 0, "modified": 0, "entries": 0},
+            client.revalidation_info,
+        )
+
+    def test__request_data_revalidate_modified(self):
+        # given
+        client = EETCDataClient("test_api_key", revalidate=True, json_loads=None)
+        url = f"{client.base_url}/companies/"
+        old_response = MagicMock()
+        old_response.status_code = 200
+        old_response.headers = {"Last-Modified": "Mon, 02 Jan 2023 00:00:00 GMT"}
+        old_response.json = MagicMock(return_value=[{"symbol": "AAPL"}])
+        new_response = MagicMock()
+        new_response.status_code = 200
+        new_response.headers = {"ETag": '"v2"'}
+        new_response.json = MagicMock(return_value=[{"symbol": "MSFT"}])
+
+        # when
+        with mock.patch.object(
+            client.session,
+            "get",
+            side_effect=[old_response, new_response],
+        ) as mock_get:
+            client.get_companies()
+            data = client.get_companies()
+
+        # then
+        self.assertEqual([{"symbol": "MSFT"}], data)
+        self.assertEqual(
+            {"If-Modified-Since": "Mon, 02 Jan 2023 00:00:00 GMT"},
+            mock_get.call_args.kwargs["headers"],
+        )
+        self.assertEqual(
+            {"not_modified": 0, "modified": 1, "entries": 1},
+            client.revalidation_info,
+        )
+
+    def test_get_price_data_compressed(self):
+        # given
+        with MockDataHubServer(rows=200, compress=True) as server:
+            client = EETCDataClient("test_api_key")
+            client.base_url = server.base_url
+
+            # when
+            df = client.get_price_data("AAPL")
+            client.close()
+
+        # then
+        self.assertEqual(200, len(df))
+        transfer = client.transfer_log[-1]
+        self.assertEqual("price", transfer["endpoint"])
+        self.assertEqual("gzip", transfer["content_encoding"])
+        self.assertEqual(server.bytes_sent, transfer["wire_bytes"])
+        self.assertLess(5 * transfer["wire_bytes"], transfer["decoded_bytes"])
+        self.assertEqual(
+            {
+                "requests": 1,
+                "wire_bytes": transfer["wire_bytes"],
+                "decoded_bytes": transfer["decoded_bytes"],
+            },
+            client.transfer_stats,
+        )
+
+    def test_get_price_data_compressed_chunked(self):
+        # given
+        with MockDataHubServer(rows=200, compress=True, chunked=True) as server:
+            client = EETCDataClient("test_api_key")
+            client.base_url = server.base_url
+
+            # when
+            df = client.get_price_data("AAPL")
+            client.close()
+
+        # then
+        self.assertEqual(200, len(df))
+        transfer = client.transfer_log[-1]
+        self.assertEqual("gzip", transfer["content_encoding"])
+        self.assertEqual(server.bytes_sent, transfer["wire_bytes"])
+        self.assertLess(5 * transfer["wire_bytes"], transfer["decoded_bytes"])
+
+    def test_get_price_data_uncompressed(self):
+        # given
+        with MockDataHubServer(rows=200, compress=True) as server:
+            client = EETCDataClient("test_api_key", compress=False)
+            client.base_url = server.base_url
+
+            # when
+            client.get_price_data("AAPL")
+            client.close()
+
+        # then
+        transfer = client.transfer_log[-1]
+        self.assertEqual("identity", client.session.headers["Accept-Encoding"])
+        self.assertIsNone(transfer["content_encoding"])
+        self.assertEqual(transfer["decoded_bytes"], transfer["wire_bytes"])
+
+    def test_get_price_data_hooks(self):
+        # given
+        records = []
+
+        with MockDataHubServer(rows=50) as server:
+            client = EETCDataClient(
+                "test_api_key",
+                hooks=[records.append],
+                collect_stats=True,
+            )
+            client.base_url = server.base_url
+
+            # when
+            client.get_price_data("AAPL", from_date="2020-01-01")
+            client.get_price_data("MSFT", from_date="2020-01-01", as_json=True)
+            client.get_companies()
+            client.close()
+
+        # then
+        self.assertEqual(3, len(records))
+        record = records[0]
+        self.assertEqual("price", record["endpoint"])
+        self.assertEqual(
+            {"symbol": "AAPL", "from_date": "2020-01-01"},
+            record["params"],
+        )
+        self.assertEqual(1, record["requests"])
+        self.assertEqual(50, record["rows"])
+        self.assertGreater(record["wire_bytes"], 0)
+        self.assertIsNone(record["error"])
+
+        for name in ("http_time", "decode_time", "frame_time"):
+            self.assertGreater(record[name], 0.0)
+            self.assertLess(record[name], record["total_time"])
+
+        # nothing is built for JSON results
+        self.assertEqual(0.0, records[1]["frame_time"])
+        self.assertEqual(2, client.call_stats["price"]["calls"])
+        self.assertEqual(1, client.call_stats["companies"]["calls"])
+
+    def test_get_indicator_data_hooks_error(self):
+        # given
+        hook = MagicMock()
+        self.eetc_data_client.add_hook(hook)
+
+        # when
+        with mock.patch(
+            "src.eetc_data_client.client.EETCDataClient._send_http_request",
+            side_effect=requests.HTTPError("404 Not Found"),
+        ):
+            with self.assertRaises(requests.HTTPError):
+                self.eetc_data_client.get_indicator_data("US Real GDP")
+
+        # then
+        record = hook.call_args.args[0]
+        self.assertEqual("indicators", record["endpoint"])
+        self.assertEqual("HTTPError", record["error"])
+        self.assertEqual({}, self.eetc_data_client.call_stats)
+
+    def test_close(self):
+        # given
+        # when
+        with mock.patch.object(self.eetc_data_client.session, "close") as close:
+            with self.eetc_data_client as client:
+                self.assertIs(self.eetc_data_client, client)
+
+        # then
+        close.assert_called_once_with()
+
+    def test_session_pool_configuration(self):
+        # given
+        client = EETCDataClient(
+            "test_api_key",
+            pool_connections=2,
+            pool_maxsize=32,
+            keep_alive=False,
+        )
+
+        # when
+        adapter = client.session.get_adapter("https://example.com")
+
         # then
-        pass  # TODO implement test__send_http_request
+        self.assertEqual(32, adapter._pool_maxsize)
+        self.assertEqual(2, adapter._pool_connections)
+        self.assertEqual("close", client.session.headers["Connection"])
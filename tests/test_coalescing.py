@@ -0,0 +1,188 @@
+import asyncio
+import copy
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.eetc_data_client.coalescing import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_concurrent_calls_share_one_call(self):
+        # given
+        single_flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            release.wait(5)
+            return [{"value": 1}]
+
+        # when
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(single_flight.do, "key", fn) for _ in range(4)]
+
+            # every caller but the first one joins the running call
+            while single_flight.info["coalesced"] < 3:
+                time.sleep(0.001)
+
+            release.set()
+            results = [future.result() for future in futures]
+
+        # then
+        self.assertEqual(1, len(calls))
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual({"flights": 1, "coalesced": 3}, single_flight.info)
+
+    def test_shared_result_is_copied(self):
+        # given
+        single_flight = SingleFlight()
+        release = threading.Event()
+        result = [{"value": 1}]
+
+        def fn():
+            release.wait(5)
+            return result
+
+        # when
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(single_flight.do, "key", fn, None, copy.deepcopy)
+                for _ in range(2)
+            ]
+
+            while single_flight.info["coalesced"] < 1:
+                time.sleep(0.001)
+
+            release.set()
+            results = [future.result() for future in futures]
+
+        # then
+        # every caller of the shared call gets its own copy
+        self.assertEqual([result, result], results)
+        self.assertIsNot(results[0], results[1])
+        self.assertTrue(all(r is not result for r in results))
+
+        # a call which was not shared is not copied
+        self.assertIs(result, single_flight.do("key", fn, None, copy.deepcopy))
+
+    def test_exception_is_shared(self):
+        # given
+        single_flight = SingleFlight()
+        release = threading.Event()
+
+        def fn():
+            release.wait(5)
+            raise ValueError("failed")
+
+        # when
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(single_flight.do, "key", fn) for _ in range(2)]
+
+            while single_flight.info["coalesced"] < 1:
+                time.sleep(0.001)
+
+            release.set()
+
+        # then
+        for future in futures:
+            self.assertRaises(ValueError, future.result)
+
+    def test_sequential_calls_are_not_coalesced(self):
+        # given
+        single_flight = SingleFlight()
+
+        # when
+        results = [single_flight.do("key", lambda: i) for i in range(2)]
+
+        # then
+        self.assertEqual([0, 1], results)
+        self.assertEqual({"flights": 2, "coalesced": 0}, single_flight.info)
+
+
+class TestSingleFlightAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_calls_share_one_call(self):
+        # given
+        single_flight = SingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return [{"value": 1}]
+
+        # when
+        results = await asyncio.gather(
+            *[single_flight.do_async("key", fn) for _ in range(4)]
+        )
+
+        # then
+        self.assertEqual(1, len(calls))
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual({"flights": 1, "coalesced": 3}, single_flight.info)
+
+    async def test_shared_result_is_copied(self):
+        # given
+        single_flight = SingleFlight()
+        result = [{"value": 1}]
+
+        async def fn():
+            await asyncio.sleep(0.01)
+            return result
+
+        # when
+        results = await asyncio.gather(
+            *[single_flight.do_async("key", fn, None, copy.deepcopy) for _ in range(2)]
+        )
+
+        # then
+        self.assertEqual([result, result], results)
+        self.assertIsNot(results[0], results[1])
+        self.assertTrue(all(r is not result for r in results))
+        self.assertIs(
+            result, await single_flight.do_async("key", fn, None, copy.deepcopy)
+        )
+
+    async def test_cancelled_call_is_run_again(self):
+        # given
+        single_flight = SingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return len(calls)
+
+        first = asyncio.ensure_future(single_flight.do_async("key", fn))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(single_flight.do_async("key", fn))
+        await asyncio.sleep(0)
+
+        # when
+        first.cancel()
+        result = await second
+
+        # then
+        self.assertEqual(2, result)
+        self.assertTrue(first.cancelled())
+
+    async def test_waiting_call_times_out(self):
+        # given
+        single_flight = SingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.05)
+
+        first = asyncio.ensure_future(single_flight.do_async("key", fn))
+        await asyncio.sleep(0)
+
+        # when
+        with self.assertRaises(asyncio.TimeoutError):
+            await single_flight.do_async("key", fn, timeout=0.001)
+
+        # then
+        # the running call is not cancelled by the waiting one
+        await first
+        self.assertFalse(first.cancelled())
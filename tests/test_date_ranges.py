@@ -0,0 +1,44 @@
+import unittest
+from datetime import datetime, timezone
+
+from src.eetc_data_client.date_ranges import split_date_range
+
+
+class TestSplitDateRange(unittest.TestCase):
+    def test_split_date_range(self):
+        # given
+        # when
+        windows = split_date_range("2020-01-01", "2020-01-10", days=4)
+
+        # then
+        self.assertEqual(
+            [
+                ("2020-01-01", "2020-01-04"),
+                ("2020-01-05", "2020-01-08"),
+                ("2020-01-09", "2020-01-10"),
+            ],
+            windows,
+        )
+
+    def test_split_date_range_until_today(self):
+        # given
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+        # when
+        windows = split_date_range("2020-01-01", days=30)
+
+        # then
+        self.assertEqual("2020-01-01", windows[0][0])
+        self.assertEqual(today, windows[-1][1])
+
+    def test_split_date_range_single_day(self):
+        # given
+        # when
+        windows = split_date_range("2020-01-01", "2020-01-01")
+
+        # then
+        self.assertEqual([("2020-01-01", "2020-01-01")], windows)
+        self.assertEqual([], split_date_range("2020-01-02", "2020-01-01"))
+
+        with self.assertRaises(ValueError):
+            split_date_range("2020-01-01", "2020-01-10", days=0)
@@ -0,0 +1,525 @@
+import importlib.util
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+from pandas._testing import assert_frame_equal, assert_index_equal
+
+from src.eetc_data_client.frames import (
+    apply_schema,
+    records_to_frame,
+    records_to_polars,
+    records_to_table,
+    records_to_series,
+    resample_frame,
+    series_to_wide_frame,
+    sort_frame,
+)
+from src.eetc_data_client.schemas import (
+    FUNDAMENTALS_DATA_FIELDS,
+    INDICATOR_DATA_FIELDS,
+    PRICE_DATA_FIELDS,
+    SCHEMAS,
+)
+
+
+class TestRecordsToFrame(unittest.TestCase):
+    def test_price_data_matches_json_normalize(self):
+        # given
+        records = [
+            {
+                "date": "2012-04-26T00:00:00Z",
+                "symbol": "AAPL",
+                "open": 21.94,
+                "high": 21.95,
+                "low": 21.5,
+                "close": 21.7,
+                "volume": 536068400.0,
+                "name": "Apple Inc.",
+            },
+            {
+                "date": "2012-04-27T00:00:00Z",
+                "symbol": "AAPL",
+                "open": 21.85,
+                "high": None,
+                "low": 21.61,
+                "close": 21.65,
+                "volume": 403036400.0,
+                "name": None,
+            },
+        ]
+
+        # when
+        df = records_to_frame(records, PRICE_DATA_FIELDS)
+
+        # then
+        assert_frame_equal(pd.json_normalize(records), df)
+
+    def test_fundamentals_data_matches_json_normalize(self):
+        # given
+        records = [
+            {
+                "symbol": "AAPL",
+                "year": 2021,
+                "quarter": None,
+                "name": "Apple",
+                "revenue": 365820000000.0,
+                "ebit": None,
+            },
+            {
+                "symbol": "AAPL",
+                "year": 2022,
+                "quarter": 1,
+                "name": "Apple",
+                "revenue": 97280000000.0,
+                "ebit": None,
+            },
+        ]
+
+        # when
+        df = records_to_frame(records, FUNDAMENTALS_DATA_FIELDS)
+
+        # then
+        assert_frame_equal(pd.json_normalize(records), df)
+        self.assertEqual("int64", df["year"].dtype)
+        self.assertEqual("float64", df["quarter"].dtype)
+        self.assertEqual("object", df["ebit"].dtype)
+
+    def test_unexpected_value_types_match_json_normalize(self):
+        # given
+        records = [
+            {"date": "2012-04-26T00:00:00Z", "open": "21.94", "high": True},
+            {"date": "2012-04-27T00:00:00Z", "open": "21.85", "high": False},
+        ]
+        records_with_ints = [
+            {"date": "2012-04-26T00:00:00Z", "open": 21, "volume": 1},
+            {"date": "2012-04-27T00:00:00Z", "open": 21.85, "volume": 2},
+        ]
+
+        # when
+        df = records_to_frame(records, PRICE_DATA_FIELDS)
+        df_with_ints = records_to_frame(records_with_ints, PRICE_DATA_FIELDS)
+
+        # then
+        assert_frame_equal(pd.json_normalize(records), df)
+        assert_frame_equal(pd.json_normalize(records_with_ints), df_with_ints)
+
+    def test_records_with_different_keys(self):
+        # given
+        records = [
+            {"date": "2020-01-01T00:00:00Z", "name": "US Real GDP", "value": 1.0},
+            {"date": "2021-01-01T00:00:00Z", "value": 2.0, "unit": "%"},
+        ]
+
+        # when
+        df = records_to_frame(records, INDICATOR_DATA_FIELDS)
+
+        # then
+        assert_frame_equal(pd.json_normalize(records), df)
+
+    def test_selected_columns(self):
+        # given
+        records = [
+            {"date": "2012-04-26T00:00:00Z", "close": 21.7, "volume": 536068400.0},
+            {"date": "2012-04-27T00:00:00Z", "close": 21.65, "volume": 403036400.0},
+        ]
+
+        # when
+        df = records_to_frame(records, PRICE_DATA_FIELDS, ["date", "close", "open"])
+
+        # then
+        self.assertEqual(["date", "close", "open"], df.columns.tolist())
+        self.assertEqual("float64", df["close"].dtype)
+        # selected fields missing from the records are built as empty columns
+        self.assertTrue(df["open"].isna().all())
+
+    def test_no_records(self):
+        # given
+        # when
+        df = records_to_frame([], INDICATOR_DATA_FIELDS)
+
+        # then
+        self.assertTrue(df.empty)
+        self.assertEqual(list(INDICATOR_DATA_FIELDS), df.columns.tolist())
+
+
+class TestApplySchema(unittest.TestCase):
+    def test_price_data(self):
+        # given
+        df = records_to_frame(
+            [
+                {
+                    "date": "2012-04-26T00:00:00Z",
+                    "symbol": "AAPL",
+                    "open": 21.94,
+                    "high": None,
+                    "low": 21.5,
+                    "close": 21.7,
+                    "volume": 536068400.0,
+                    "name": "Apple Inc.",
+                },
+            ],
+            PRICE_DATA_FIELDS,
+        )
+
+        # when
+        typed_df = apply_schema(df, SCHEMAS["price"])
+
+        # then
+        assert_index_equal(
+            pd.DatetimeIndex(["2012-04-26"], tz="UTC", name="date"),
+            typed_df.index,
+        )
+        self.assertEqual("category", typed_df["symbol"].dtype)
+        self.assertEqual("category", typed_df["name"].dtype)
+        self.assertEqual("float64", typed_df["high"].dtype)
+        self.assertNotIn("date", typed_df.columns)
+
+    def test_fundamentals_data(self):
+        # given
+        df = records_to_frame(
+            [
+                {
+                    "symbol": "AAPL",
+                    "year": 2021,
+                    "quarter": None,
+                    "inserted_at": None,
+                    "frequency": "Yearly",
+                    "source": "MarketWatch",
+                    "ebit": None,
+                },
+            ],
+            FUNDAMENTALS_DATA_FIELDS,
+        )
+
+        # when
+        typed_df = apply_schema(df, SCHEMAS["fundamentals"])
+
+        # then
+        self.assertEqual("Int64", typed_df["year"].dtype)
+        self.assertTrue(typed_df["quarter"].isna().all())
+        self.assertEqual("Int64", typed_df["quarter"].dtype)
+        self.assertEqual("datetime64[ns, UTC]", typed_df["inserted_at"].dtype)
+        self.assertEqual("float64", typed_df["ebit"].dtype)
+        self.assertEqual("category", typed_df["source"].dtype)
+
+
+class TestSortFrame(unittest.TestCase):
+    def test_sorted_frame_is_not_sorted_again(self):
+        # given
+        df = pd.DataFrame({"date": ["2012-04-26", "2012-04-27"], "close": [1.0, 2.0]})
+
+        # when
+        with patch.object(pd.DataFrame, "sort_values") as sort_values:
+            sorted_df = sort_frame(df, "date")
+
+        # then
+        sort_values.assert_not_called()
+        self.assertIs(df, sorted_df)
+
+    def test_unsorted_frame_is_sorted_in_place(self):
+        # given
+        df = pd.DataFrame({"date": ["2012-04-27", "2012-04-26"], "close": [2.0, 1.0]})
+
+        # when
+        sorted_df = sort_frame(df, "date")
+
+        # then
+        self.assertIs(df, sorted_df)
+        self.assertEqual(["2012-04-26", "2012-04-27"], df["date"].tolist())
+        self.assertEqual([1, 0], df.index.tolist())
+
+    def test_descending(self):
+        # given
+        df = pd.DataFrame({"date": ["2012-04-26", "2012-04-27"], "close": [1.0, 2.0]})
+
+        # when
+        sorted_df = sort_frame(df, "date", descending=True)
+
+        # then
+        self.assertEqual(["2012-04-27", "2012-04-26"], sorted_df["date"].tolist())
+        self.assertEqual([2.0, 1.0], sorted_df["close"].tolist())
+
+
+class TestSeriesToWideFrame(unittest.TestCase):
+    def test_columns_are_aligned_on_date(self):
+        # given
+        records = {
+            "US Real GDP": [
+                {"date": "2022-01-01T00:00:00Z", "value": 2.1},
+                {"date": "2021-01-01T00:00:00Z", "value": 5.9},
+            ],
+            "US CPI": [
+                {"date": "2021-06-01T00:00:00Z", "value": 5.4},
+                {"date": "2022-01-01T00:00:00Z", "value": None},
+            ],
+        }
+
+        # when
+        df = series_to_wide_frame(
+            {name: records_to_series(rs) for name, rs in records.items()},
+        )
+
+        # then
+        expected = pd.DataFrame(
+            {"US Real GDP": [5.9, None, 2.1], "US CPI": [None, 5.4, None]},
+            index=pd.DatetimeIndex(
+                ["2021-01-01", "2021-06-01", "2022-01-01"],
+                tz="UTC",
+                name="date",
+            ),
+        )
+        expected.columns.name = "name"
+        assert_frame_equal(expected, df)
+
+    def test_no_records(self):
+        # given
+        # when
+        df = series_to_wide_frame({"US Real GDP": records_to_series([])})
+        no_series_df = series_to_wide_frame({})
+
+        # then
+        self.assertTrue(df.empty)
+        self.assertEqual(["US Real GDP"], df.columns.tolist())
+        self.assertTrue(no_series_df.empty)
+
+
+class TestResampleFrame(unittest.TestCase):
+    def test_last_value_per_period_is_forward_filled(self):
+        # given
+        df = pd.DataFrame(
+            {"daily": [1.0, 2.0, None, 4.0], "quarterly": [10.0, None, None, None]},
+            index=pd.DatetimeIndex(
+                ["2021-01-04", "2021-01-29", "2021-02-01", "2021-04-01"],
+                tz="UTC",
+                name="date",
+            ),
+        )
+
+        # when
+        resampled_df = resample_frame(df, "M")
+
+        # then
+        assert_index_equal(
+            pd.DatetimeIndex(
+                ["2021-01-01", "2021-02-01", "2021-03-01", "2021-04-01"],
+                tz="UTC",
+                name="date",
+            ),
+            resampled_df.index,
+        )
+        self.assertEqual([2.0, 2.0, 2.0, 4.0], resampled_df["daily"].tolist())
+        self.assertEqual([10.0] * 4, resampled_df["quarterly"].tolist())
+
+
+@unittest.skipIf(importlib.util.find_spec("pyarrow") is None, "pyarrow not installed")
+class TestRecordsToTable(unittest.TestCase):
+    records = [
+        {
+            "date": "2012-04-27T00:00:00Z",
+            "symbol": "AAPL",
+            "open": 21.85,
+            "high": None,
+            "low": 21.61,
+            "close": 21.65,
+            "volume": 403036400.0,
+            "name": "Apple Inc.",
+        },
+        {
+            "date": "2012-04-26T00:00:00Z",
+            "symbol": "AAPL",
+            "open": 21.94,
+            "high": 21.95,
+            "low": 21.5,
+            "close": 21.7,
+            "volume": 536068400.0,
+            "name": "Apple Inc.",
+        },
+    ]
+
+    def test_price_data(self):
+        # given
+        import pyarrow as pa
+
+        # when
+        table = records_to_table(self.records, PRICE_DATA_FIELDS, sort_by="date")
+
+        # then
+        self.assertEqual(list(PRICE_DATA_FIELDS), table.column_names)
+        self.assertEqual(pa.string(), table.schema.field("date").type)
+        self.assertEqual(pa.float64(), table.schema.field("high").type)
+        self.assertEqual(
+            ["2012-04-26T00:00:00Z", "2012-04-27T00:00:00Z"],
+            table.column("date").to_pylist(),
+        )
+        self.assertEqual([21.95, None], table.column("high").to_pylist())
+
+    def test_typed_price_data(self):
+        # given
+        import pyarrow as pa
+
+        # when
+        table = records_to_table(
+            self.records,
+            SCHEMAS["price"].dtypes,
+            sort_by="date",
+        )
+
+        # then
+        self.assertEqual(
+            pa.timestamp("ns", tz="UTC"),
+            table.schema.field("date").type,
+        )
+        self.assertTrue(pa.types.is_dictionary(table.schema.field("symbol").type))
+        # the typed table holds the same values as the typed DataFrame
+        df = apply_schema(
+            records_to_frame(self.records, PRICE_DATA_FIELDS).sort_values(by=["date"]),
+            SCHEMAS["price"],
+        )
+        assert_frame_equal(
+            df.reset_index(),
+            table.to_pandas(),
+            check_categorical=False,
+            check_dtype=False,
+        )
+
+    def test_typed_date_only_values(self):
+        # given
+        records = [
+            {"date": "2020-01-02", "name": "US CPI", "value": 1.5},
+            {"date": "2020-01-03", "name": "US CPI", "value": None},
+        ]
+
+        # when
+        table = records_to_table(records, SCHEMAS["indicators"].dtypes, "date")
+
+        # then
+        # dates without a zone offset are taken as UTC, like typed pandas does
+        expected = pd.to_datetime(
+            pd.Series([record["date"] for record in records]),
+            utc=True,
+        )
+        self.assertEqual(
+            expected.tolist(),
+            table.column("date").to_pandas().tolist(),
+        )
+
+    def test_descending(self):
+        # given
+        records = list(reversed(self.records))
+
+        # when
+        table = records_to_table(
+            records,
+            PRICE_DATA_FIELDS,
+            sort_by="date",
+            descending=True,
+        )
+
+        # then
+        self.assertEqual(
+            ["2012-04-27T00:00:00Z", "2012-04-26T00:00:00Z"],
+            table.column("date").to_pylist(),
+        )
+
+    def test_no_records(self):
+        # given
+        # when
+        table = records_to_table([], INDICATOR_DATA_FIELDS, sort_by="date")
+
+        # then
+        self.assertEqual(0, table.num_rows)
+        self.assertEqual(list(INDICATOR_DATA_FIELDS), table.column_names)
+
+
+@unittest.skipIf(importlib.util.find_spec("polars") is None, "polars not installed")
+class TestRecordsToPolars(unittest.TestCase):
+    records = TestRecordsToTable.records
+
+    def test_price_data(self):
+        # given
+        import polars as pl
+
+        # when
+        df = records_to_polars(self.records, PRICE_DATA_FIELDS, sort_by="date")
+
+        # then
+        self.assertEqual(list(PRICE_DATA_FIELDS), df.columns)
+        self.assertEqual(pl.String, df.schema["date"])
+        self.assertEqual(pl.Float64, df.schema["volume"])
+        self.assertEqual(
+            ["2012-04-26T00:00:00Z", "2012-04-27T00:00:00Z"],
+            df["date"].to_list(),
+        )
+        self.assertEqual([21.95, None], df["high"].to_list())
+
+    def test_descending(self):
+        # given
+        records = list(reversed(self.records))
+
+        # when
+        df = records_to_polars(
+            records,
+            SCHEMAS["price"].dtypes,
+            sort_by="date",
+            descending=True,
+        )
+
+        # then
+        self.assertEqual([21.65, 21.7], df["close"].to_list())
+
+    def test_unexpected_value_types_are_kept(self):
+        # given
+        records = [
+            {"symbol": "AAPL", "year": 2022, "revenue": 1.5},
+            {"symbol": "AAPL", "year": 2021.5, "revenue": "n/a"},
+        ]
+
+        # when
+        df = records_to_polars(records, FUNDAMENTALS_DATA_FIELDS)
+
+        # then
+        self.assertEqual([2022.0, 2021.5], df["year"].to_list())
+        self.assertEqual(["1.5", "n/a"], df["revenue"].to_list())
+
+    def test_typed_fundamentals_data(self):
+        # given
+        import polars as pl
+
+        records = [
+            {"symbol": "AAPL", "year": 2022, "quarter": None, "revenue": 1.5},
+            {"symbol": "AAPL", "year": 2021, "quarter": 4, "revenue": None},
+        ]
+
+        # when
+        df = records_to_polars(records, SCHEMAS["fundamentals"].dtypes)
+
+        # then
+        self.assertEqual(pl.Categorical, df.schema["symbol"])
+        self.assertEqual(pl.Int64, df.schema["quarter"])
+        self.assertEqual([None, 4], df["quarter"].to_list())
+        # fundamentals keep the order returned by the API
+        self.assertEqual([2022, 2021], df["year"].to_list())
+
+    def test_typed_indicator_data(self):
+        # given
+        import polars as pl
+
+        records = [
+            {
+                "date": "2021-01-01T00:00:00Z",
+                "name": "US Real GDP",
+                "value": 2.5,
+                "frequency": "Yearly",
+            },
+        ]
+
+        # when
+        df = records_to_polars(records, SCHEMAS["indicators"].dtypes, "date")
+
+        # then
+        self.assertEqual(pl.Datetime("ns", "UTC"), df.schema["date"])
+        self.assertEqual(
+            pd.Timestamp("2021-01-01", tz="UTC"),
+            pd.Timestamp(df["date"][0]),
+        )
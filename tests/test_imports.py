@@ -0,0 +1,80 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("numpy", "pandas", "pyarrow", "polars")
+
+
+def modules_loaded_by(code: str) -> list:
+    # a new interpreter, modules imported by other tests are not counted
+    script = (
+        "import json, sys\n"
+        f"{code}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    return json.loads(output)
+
+
+class TestImports(unittest.TestCase):
+    def test_import_does_not_load_dataframe_libraries(self):
+        # given
+        code = (
+            "import src.eetc_data_client.client\n"
+            "import src.eetc_data_client.async_client"
+        )
+
+        # when
+        loaded = modules_loaded_by(code)
+
+        # then
+        self.assertEqual([], loaded)
+
+    def test_json_calls_do_not_load_dataframe_libraries(self):
+        # given
+        code = (
+            "from benchmarks.mock_server import MockDataHubServer\n"
+            "from src.eetc_data_client.client import EETCDataClient\n"
+            "with MockDataHubServer(rows=10) as server:\n"
+            "    client = EETCDataClient('test_api_key')\n"
+            "    client.base_url = server.base_url\n"
+            "    client.get_indicators()\n"
+            "    client.get_companies()\n"
+            "    client.get_price_data('AAPL', as_json=True)\n"
+            "    client.close()"
+        )
+
+        # when
+        loaded = modules_loaded_by(code)
+
+        # then
+        self.assertEqual([], loaded)
+
+    def test_dataframe_call_loads_pandas(self):
+        # given
+        code = (
+            "from benchmarks.mock_server import MockDataHubServer\n"
+            "from src.eetc_data_client.client import EETCDataClient\n"
+            "with MockDataHubServer(rows=10) as server:\n"
+            "    client = EETCDataClient('test_api_key')\n"
+            "    client.base_url = server.base_url\n"
+            "    client.get_price_data('AAPL')\n"
+            "    client.close()"
+        )
+
+        # when
+        loaded = modules_loaded_by(code)
+
+        # then
+        self.assertIn("pandas", loaded)
@@ -0,0 +1,84 @@
+import unittest
+
+from src.eetc_data_client.instrumentation import CallRecord, StatsCollector
+
+
+def make_record(endpoint: str, total_time: float, error: str = None) -> dict:
+    record = CallRecord(endpoint, {"symbol": "AAPL"}).finish()
+    record.update(total_time=total_time, rows=10, requests=1, error=error)
+
+    return record
+
+
+class TestCallRecord(unittest.TestCase):
+    def test_finish(self):
+        # given
+        record = CallRecord("price", {"symbol": "AAPL"})
+
+        # when
+        record.add(requests=1, http_time=0.25, wire_bytes=100)
+        record.add(requests=1, http_time=0.5, wire_bytes=50)
+        record.set(rows=20)
+        values = record.finish(ValueError("invalid"))
+
+        # then
+        self.assertEqual("price", values["endpoint"])
+        self.assertEqual({"symbol": "AAPL"}, values["params"])
+        self.assertEqual(2, values["requests"])
+        self.assertEqual(0.75, values["http_time"])
+        self.assertEqual(150, values["wire_bytes"])
+        self.assertEqual(20, values["rows"])
+        self.assertEqual("ValueError", values["error"])
+        self.assertGreaterEqual(values["total_time"], 0.0)
+
+
+class TestStatsCollector(unittest.TestCase):
+    def test_summary(self):
+        # given
+        stats_collector = StatsCollector()
+
+        # when
+        for i in range(1, 101):
+            stats_collector(make_record("price", float(i)))
+
+        stats_collector(make_record("price", 1000.0, error="RequestTimeoutError"))
+        stats_collector(make_record("companies", 2.0))
+        summary = stats_collector.summary()
+
+        # then
+        self.assertEqual({"price", "companies"}, set(summary))
+        self.assertEqual(101, summary["price"]["calls"])
+        self.assertEqual(1, summary["price"]["errors"])
+        self.assertEqual(101, summary["price"]["requests"])
+        # failed calls are left out of the percentiles
+        self.assertAlmostEqual(50.5, summary["price"]["total_time"]["p50"])
+        self.assertAlmostEqual(95.05, summary["price"]["total_time"]["p95"])
+        self.assertAlmostEqual(99.01, summary["price"]["total_time"]["p99"])
+        self.assertAlmostEqual(50.5, summary["price"]["total_time"]["mean"])
+        self.assertEqual(10.0, summary["companies"]["rows"]["p99"])
+
+    def test_max_records(self):
+        # given
+        stats_collector = StatsCollector(max_records=2)
+
+        # when
+        for i in range(5):
+            stats_collector(make_record("price", float(i)))
+
+        # then
+        self.assertEqual(
+            [3.0, 4.0],
+            [record["total_time"] for record in stats_collector.records("price")],
+        )
+
+    def test_reset(self):
+        # given
+        stats_collector = StatsCollector()
+        stats_collector(make_record("price", 1.0))
+
+        # when
+        stats_collector.reset()
+
+        # then
+        self.assertEqual({}, stats_collector.summary())
+        self.assertEqual([], stats_collector.records())
@@ -0,0 +1,92 @@
+import json
+import math
+import unittest
+from unittest import mock
+
+from src.eetc_data_client.json_decoding import (
+    get_fast_json_loads,
+    resolve_json_loads,
+    with_stdlib_fallback,
+)
+
+
+class TestJSONDecoding(unittest.TestCase):
+    def test_resolve_json_loads(self):
+        # given
+        def json_loads(data):
+            return json.loads(data)
+
+        # when
+        # then
+        self.assertEqual(
+            get_fast_json_loads() is None,
+            resolve_json_loads("auto") is None,
+        )
+        self.assertIsNone(resolve_json_loads(None))
+        self.assertIs(json_loads, resolve_json_loads(json_loads))
+
+        with self.assertRaises(ValueError):
+            resolve_json_loads("simplejson")
+
+    def test_get_fast_json_loads_without_fast_libraries(self):
+        # given
+        # when
+        with mock.patch.dict("sys.modules", {"orjson": None, "ujson": None}):
+            json_loads = get_fast_json_loads()
+
+        # then
+        self.assertIsNone(json_loads)
+
+    def test_fast_json_loads_matches_stdlib(self):
+        # given
+        json_loads = get_fast_json_loads()
+
+        if json_loads is None:
+            self.skipTest("no fast JSON library installed")
+
+        body = json.dumps(
+            [
+                {
+                    "date": "2012-04-26T00:00:00Z",
+                    "symbol": "AAPL",
+                    "open": 21.94,
+                    "close": 0.1 + 0.2,
+                    "volume": 536068400.0,
+                    "name": "Apple Inc. é",
+                    "quarter": None,
+                },
+            ]
+        ).encode()
+
+        # when
+        data = json_loads(body)
+
+        # then
+        self.assertEqual(json.loads(body), data)
+
+    def test_with_stdlib_fallback(self):
+        # given
+        def json_loads(data):
+            raise ValueError("NaN is not valid JSON")
+
+        body = b'[{"value": NaN}, {"value": Infinity}]'
+
+        # when
+        data = with_stdlib_fallback(json_loads)(body)
+
+        # then
+        self.assertTrue(math.isnan(data[0]["value"]))
+        self.assertEqual(math.inf, data[1]["value"])
+
+    def test_auto_json_loads_accepts_nan(self):
+        # given
+        json_loads = resolve_json_loads("auto")
+
+        if json_loads is None:
+            self.skipTest("no fast JSON library installed")
+
+        # when
+        data = json_loads(b'[{"date": "2020-01-01T00:00:00Z", "value": NaN}]')
+
+        # then
+        self.assertTrue(math.isnan(data[0]["value"]))
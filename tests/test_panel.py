@@ -0,0 +1,142 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from pandas._testing import assert_frame_equal, assert_index_equal
+
+from src.eetc_data_client.panel import (
+    FundamentalsPanel,
+    fundamentals_rows_to_frame,
+    records_to_fundamentals_rows,
+)
+
+FIELDS = ("revenue", "ebit")
+
+RECORDS = {
+    "AAPL": [
+        {"symbol": "AAPL", "year": 2020, "quarter": None, "revenue": 9.0},
+        {"symbol": "AAPL", "year": 2021, "quarter": 2, "revenue": 2.0, "ebit": 1.0},
+        {"symbol": "AAPL", "year": 2021, "quarter": 1, "revenue": 1.0, "ebit": 0.5},
+    ],
+    "MSFT": [
+        {"symbol": "MSFT", "year": 2019, "quarter": 4, "revenue": 7.0},
+        {"symbol": "MSFT", "year": 2021, "quarter": 2, "revenue": 5.0},
+    ],
+}
+
+
+def make_rows(from_year: int = None, to_year: int = None) -> dict:
+    return {
+        symbol: records_to_fundamentals_rows(records, from_year, to_year, FIELDS)
+        for symbol, records in RECORDS.items()
+    }
+
+
+class TestRecordsToFundamentalsRows(unittest.TestCase):
+    def test_years_are_filtered(self):
+        # given
+        # when
+        years, quarters, values = records_to_fundamentals_rows(
+            RECORDS["AAPL"],
+            from_year=2021,
+            fields=FIELDS,
+        )
+
+        # then
+        self.assertEqual([2021, 2021], years.tolist())
+        self.assertEqual([2.0, 1.0], quarters.tolist())
+        np.testing.assert_array_equal(np.array([[2.0, 1.0], [1.0, 0.5]]), values)
+
+    def test_no_records(self):
+        # given
+        # when
+        years, quarters, values = records_to_fundamentals_rows([], fields=FIELDS)
+
+        # then
+        self.assertEqual(0, len(years))
+        self.assertEqual((0, 2), values.shape)
+
+
+class TestFundamentalsRowsToFrame(unittest.TestCase):
+    def test_frame(self):
+        # given
+        rows = make_rows(to_year=2021)
+
+        # when
+        df = fundamentals_rows_to_frame(rows, FIELDS)
+
+        # then
+        expected = pd.DataFrame(
+            {
+                "revenue": [9.0, 1.0, 2.0, 7.0, 5.0],
+                "ebit": [np.nan, 0.5, 1.0, np.nan, np.nan],
+            },
+            index=pd.MultiIndex.from_arrays(
+                [
+                    pd.Categorical(
+                        ["AAPL", "AAPL", "AAPL", "MSFT", "MSFT"],
+                        categories=["AAPL", "MSFT"],
+                    ),
+                    [2020, 2021, 2021, 2019, 2021],
+                    pd.array([None, 1, 2, 4, 2], dtype="Int64"),
+                ],
+                names=["symbol", "year", "quarter"],
+            ),
+        )
+        assert_frame_equal(expected, df)
+
+    def test_no_rows(self):
+        # given
+        # when
+        df = fundamentals_rows_to_frame({}, FIELDS)
+
+        # then
+        self.assertTrue(df.empty)
+        self.assertEqual(list(FIELDS), df.columns.tolist())
+
+
+class TestFundamentalsPanel(unittest.TestCase):
+    def test_from_rows(self):
+        # given
+        rows = make_rows()
+
+        # when
+        panel = FundamentalsPanel.from_rows(rows, FIELDS)
+
+        # then
+        self.assertEqual((2, 4, 2), panel.values.shape)
+        self.assertEqual(["AAPL", "MSFT"], panel.symbols)
+        self.assertEqual(list(FIELDS), panel.fields)
+        assert_index_equal(
+            pd.MultiIndex.from_arrays(
+                [[2019, 2020, 2021, 2021], pd.array([4, None, 1, 2], dtype="Int64")],
+                names=["year", "quarter"],
+            ),
+            panel.periods,
+        )
+        np.testing.assert_array_equal(
+            np.array([[np.nan, 9.0, 1.0, 2.0], [7.0, np.nan, np.nan, 5.0]]),
+            panel.values[:, :, 0],
+        )
+
+    def test_field(self):
+        # given
+        panel = FundamentalsPanel.from_rows(make_rows(), FIELDS)
+
+        # when
+        df = panel.field("revenue")
+
+        # then
+        self.assertEqual(["AAPL", "MSFT"], df.columns.tolist())
+        self.assertEqual(5.0, df.loc[(2021, 2), "MSFT"])
+        self.assertTrue(np.isnan(df.loc[(2019, 4), "AAPL"]))
+
+    def test_to_frame_matches_fundamentals_rows_to_frame(self):
+        # given
+        rows = make_rows()
+
+        # when
+        df = FundamentalsPanel.from_rows(rows, FIELDS).to_frame()
+
+        # then
+        assert_frame_equal(fundamentals_rows_to_frame(rows, FIELDS), df)
@@ -0,0 +1,115 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from src.eetc_data_client.rate_limit import TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_acquire(self):
+        # given
+        with mock.patch("time.monotonic", return_value=100.0):
+            token_bucket = TokenBucket(rate=2, burst=2)
+
+        # when
+        with mock.patch("time.monotonic", return_value=100.0), mock.patch(
+            "time.sleep"
+        ) as sleep:
+            for _ in range(4):
+                token_bucket.acquire()
+
+        # then
+        # the burst is served immediately, the queued callers wait in turn
+        self.assertEqual(
+            [mock.call(0.5), mock.call(1.0)],
+            sleep.call_args_list,
+        )
+
+    def test_tokens_refill(self):
+        # given
+        with mock.patch("time.monotonic", return_value=100.0):
+            token_bucket = TokenBucket(rate=10, burst=1)
+            token_bucket.acquire()
+
+        # when
+        with mock.patch("time.monotonic", return_value=100.5), mock.patch(
+            "time.sleep"
+        ) as sleep:
+            token_bucket.acquire()
+
+        # then
+        sleep.assert_not_called()
+
+    def test_acquire_timeout(self):
+        # given
+        with mock.patch("time.monotonic", return_value=100.0):
+            token_bucket = TokenBucket(rate=2, burst=1)
+            token_bucket.acquire()
+
+        # when
+        with mock.patch("time.monotonic", return_value=100.0), mock.patch(
+            "time.sleep"
+        ) as sleep:
+            acquired = token_bucket.acquire(timeout=0.25)
+            token_bucket.acquire(timeout=1.0)
+
+        # then
+        # the caller giving up does not hold up the next one
+        self.assertFalse(acquired)
+        sleep.assert_called_once_with(0.5)
+
+    def test_acquire_from_threads(self):
+        # given
+        token_bucket = TokenBucket(rate=100, burst=1)
+
+        # when
+        start = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: token_bucket.acquire(), range(21)))
+
+        elapsed = time.monotonic() - start
+
+        # then
+        self.assertGreaterEqual(elapsed, 0.19)
+
+    def test_invalid_rate(self):
+        # given
+        # when
+        # then
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestTokenBucketAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_acquire_async(self):
+        # given
+        with mock.patch("time.monotonic", return_value=100.0):
+            token_bucket = TokenBucket(rate=4, burst=1)
+
+        # when
+        with mock.patch("time.monotonic", return_value=100.0), mock.patch(
+            "asyncio.sleep"
+        ) as sleep:
+            await token_bucket.acquire_async()
+            await token_bucket.acquire_async()
+
+        # then
+        sleep.assert_awaited_once_with(0.25)
+
+    async def test_acquire_async_timeout(self):
+        # given
+        with mock.patch("time.monotonic", return_value=100.0):
+            token_bucket = TokenBucket(rate=4, burst=1)
+            await token_bucket.acquire_async()
+
+        # when
+        with mock.patch("time.monotonic", return_value=100.0), mock.patch(
+            "asyncio.sleep"
+        ) as sleep:
+            acquired = await token_bucket.acquire_async(timeout=0.1)
+
+        # then
+        self.assertFalse(acquired)
+        sleep.assert_not_awaited()
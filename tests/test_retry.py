@@ -0,0 +1,67 @@
+import unittest
+from email.utils import formatdate
+from unittest import mock
+
+from src.eetc_data_client.retry import RetryPolicy, parse_retry_after
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_should_retry(self):
+        # given
+        retry_policy = RetryPolicy(max_attempts=3)
+
+        # when
+        # then
+        self.assertTrue(retry_policy.should_retry(1))
+        self.assertTrue(retry_policy.should_retry(2, 503))
+        self.assertFalse(retry_policy.should_retry(3, 503))
+        self.assertFalse(retry_policy.should_retry(1, 404))
+
+    def test_get_backoff(self):
+        # given
+        retry_policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+
+        # when
+        backoffs = [retry_policy.get_backoff(attempt) for attempt in range(1, 6)]
+
+        # then
+        self.assertEqual([0.5, 1.0, 2.0, 3, 3], backoffs)
+        self.assertEqual(2.0, retry_policy.get_backoff(1, "2"))
+        self.assertEqual(3, retry_policy.get_backoff(1, "120"))
+        self.assertEqual(0.5, retry_policy.get_backoff(1, "soon"))
+
+    def test_get_backoff_with_jitter(self):
+        # given
+        retry_policy = RetryPolicy(backoff_factor=1.0)
+
+        # when
+        with mock.patch("random.uniform", return_value=0.25) as uniform:
+            backoff = retry_policy.get_backoff(3)
+
+        # then
+        self.assertEqual(0.25, backoff)
+        uniform.assert_called_once_with(0, 4.0)
+
+    def test_invalid_max_attempts(self):
+        # given
+        # when
+        # then
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+
+class TestParseRetryAfter(unittest.TestCase):
+    def test_parse_retry_after(self):
+        # given
+        with mock.patch("time.time", return_value=1000.0):
+            http_date = formatdate(1030.0, usegmt=True)
+
+            # when
+            seconds = parse_retry_after(http_date)
+
+        # then
+        self.assertEqual(30.0, seconds)
+        self.assertEqual(5.0, parse_retry_after("5"))
+        self.assertEqual(0.0, parse_retry_after("-5"))
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
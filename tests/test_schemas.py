@@ -0,0 +1,43 @@
+import unittest
+from unittest import mock
+
+from src.eetc_data_client import schemas
+from src.eetc_data_client.schemas import Schema, register_schema
+
+
+class TestSchemas(unittest.TestCase):
+    def test_dtypes(self):
+        # given
+        schema = Schema(
+            {"date": schemas.STR, "year": schemas.INT, "close": schemas.FLOAT},
+            {"date": schemas.DATETIME, "close": schemas.FLOAT32},
+            index="date",
+        )
+
+        # when
+        dtypes = schema.dtypes
+
+        # then
+        self.assertEqual(
+            {
+                "date": schemas.DATETIME,
+                "year": schemas.NULLABLE_INT,
+                "close": schemas.FLOAT32,
+            },
+            dtypes,
+        )
+
+    def test_register_schema(self):
+        # given
+        schema = Schema(schemas.PRICE_DATA_FIELDS, {"close": schemas.FLOAT32})
+
+        # when
+        with mock.patch.dict(schemas.SCHEMAS):
+            register_schema("price", schema)
+            registered = schemas.SCHEMAS["price"]
+
+        # then
+        self.assertIs(schema, registered)
+
+        with self.assertRaises(ValueError):
+            register_schema("prices", schema)